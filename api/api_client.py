@@ -1,16 +1,50 @@
+import time
 import typing as t
-from requests import Session, Response
+from requests import Session, Response, Request, PreparedRequest
 from requests.exceptions import HTTPError
 
+from api.cache import ResponseCache
+from api.decode import decode_model
+from api.resilience import Resilience
+from api.tracing import HOOK_EVENTS, RequestTrace, TimedHTTPAdapter
+
+if t.TYPE_CHECKING:
+    from models.schema_cache import SchemaCache
+
+# Large enough for the default bulk worker pool, requests keeps only 10 connections per host
+DEFAULT_POOL_MAXSIZE = 32
+# Keyword arguments consumed by Session.send rather than by Request
+SEND_KWARGS = ("timeout", "verify", "cert", "proxies", "stream", "allow_redirects")
+MUTATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
 class APIClient:
-    def __init__(self, base_url: str, api_key: str, session: t.Optional[Session] = None) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        session: t.Optional[Session] = None,
+        resilience: t.Optional[Resilience] = None,
+        cache: t.Optional[ResponseCache] = None,
+        schema_cache: t.Optional["SchemaCache"] = None,
+    ) -> None:
         self.base_url = base_url
         self.api_key = api_key
+        self.resilience = resilience
+        self.cache = cache
+        self.schema_cache = schema_cache
+        self.headers = self.get_headers()
         self.session = session or self._create_default_session()
+        self.hooks: dict[str, list[t.Callable[[RequestTrace], None]]] = {event: [] for event in HOOK_EVENTS}
+        self._templates: dict[tuple[str, str], PreparedRequest] = {}
+        self._send_settings: t.Optional[dict] = None
 
     def _create_default_session(self) -> Session:
         session = Session()
-        session.headers.update(self.get_headers())
+        session.headers.update(self.headers)
+        adapter = TimedHTTPAdapter(pool_maxsize=DEFAULT_POOL_MAXSIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
         return session
 
     def get_headers(self) -> dict:
@@ -19,18 +53,130 @@ class APIClient:
             "Content-Type": "application/json"
         }
 
-    def handle_response(self, response: Response) -> t.Any:
+    def handle_response(self, response: Response, model: t.Any = None, trusted: bool = False) -> t.Any:
         response.raise_for_status()
+        if model is not None:
+            return response.status_code, decode_model(model, response.content, trusted, self.schema_cache)
         try:
             return response.status_code, response.json()
         except ValueError:
             return response.text
 
-    def request(self, method: str, path: str, **kwargs) -> t.Any:
+    def add_hook(self, event: str, hook: t.Callable[[RequestTrace], None]) -> None:
+        """Registers ``hook`` for ``pre_request``, ``post_response`` or ``post_decode``.
+
+        Every hook gets the request's ``RequestTrace``. ``post_decode`` fires once per request,
+        also when sending or decoding failed (``trace.error`` is set then).
+        """
+        if event not in self.hooks:
+            raise ValueError(f"Unknown hook event {event!r}, expected one of {HOOK_EVENTS}")
+        self.hooks[event].append(hook)
+
+    def _emit(self, event: str, trace: RequestTrace) -> None:
+        trace.marks[event] = time.perf_counter()
+        for hook in self.hooks[event]:
+            hook(trace)
+
+    def template(self, method: str, path: str) -> PreparedRequest:
+        """Prepared request for an endpoint with the session headers already merged in.
+
+        Templates are built once per (method, path) and copied on every call; session cookies
+        and auth can change between calls, so ``send`` applies their current state each time.
+        """
+        key = (method, path)
+        template = self._templates.get(key)
+        if template is None:
+            request = Request(method, f"{self.base_url}{path}", headers=self.headers)
+            template = self._templates[key] = self.session.prepare_request(request)
+        return template
+
+    def send(
+        self,
+        template: PreparedRequest,
+        path: t.Optional[str] = None,
+        params: t.Optional[dict] = None,
+        json: t.Any = None,
+        headers: t.Optional[dict] = None,
+        model: t.Any = None,
+        trusted: bool = False,
+        **kwargs
+    ) -> t.Any:
+        prepared = template.copy()
+        if path is not None or params:
+            prepared.prepare_url(f"{self.base_url}{path}" if path is not None else template.url, params)
+        if json is not None:
+            prepared.prepare_body(data=None, files=None, json=json)
+        # the same cookies and auth Session.prepare_request would apply now, e.g. ones set by
+        # a Set-Cookie of an earlier response
+        prepared.headers.pop("Cookie", None)
+        if self.session.cookies:
+            prepared.prepare_cookies(self.session.cookies)
+        if self.session.auth:
+            prepared.prepare_auth(self.session.auth, prepared.url)
+        if headers:
+            prepared.headers.update(headers)
+        return self._dispatch(prepared, model, trusted, **kwargs)
+
+    def request(self, method: str, path: str, model: t.Any = None, trusted: bool = False, **kwargs) -> t.Any:
         url = f"{self.base_url}{path}"
+        send_kwargs = {key: kwargs.pop(key) for key in SEND_KWARGS if key in kwargs}
+        headers = kwargs.pop("headers", None)
+        kwargs["headers"] = {**self.headers, **headers} if headers else self.headers
         try:
-            headers = self.get_headers()
-            response = self.session.request(method, url, headers=headers, **kwargs)
-            return self.handle_response(response)
+            prepared = self.session.prepare_request(Request(method, url, **kwargs))
+            return self._dispatch(prepared, model, trusted, **send_kwargs)
         except HTTPError as e:
-            raise e
\ No newline at end of file
+            raise e
+
+    def _dispatch(self, prepared: PreparedRequest, model: t.Any = None, trusted: bool = False, **kwargs) -> t.Any:
+        if self._send_settings is None:
+            # Proxy/CA lookups from the environment are the bulk of Session.request overhead,
+            # resolve them once per client instead of on every call
+            self._send_settings = self.session.merge_environment_settings(self.base_url, {}, None, None, None)
+        settings = {**self._send_settings, **kwargs} if kwargs else self._send_settings
+        if not any(self.hooks.values()):
+            return self.handle_response(self._fetch(prepared, settings), model, trusted)
+
+        trace = RequestTrace(prepared, model)
+        try:
+            self._emit("pre_request", trace)
+            with trace:
+                trace.response = self._fetch(prepared, settings)
+            self._emit("post_response", trace)
+            trace.result = self.handle_response(trace.response, model, trusted)
+            return trace.result
+        except Exception as e:
+            trace.error = e
+            raise
+        finally:
+            self._emit("post_decode", trace)
+
+    def _fetch(self, prepared: PreparedRequest, settings: dict) -> Response:
+        if self.cache is not None:
+            if prepared.method == "GET":
+                return self._fetch_cached(prepared, settings)
+            if prepared.method in MUTATING_METHODS:
+                try:
+                    return self._send(prepared, settings)
+                finally:
+                    self.cache.invalidate(prepared.url)
+        return self._send(prepared, settings)
+
+    def _fetch_cached(self, prepared: PreparedRequest, settings: dict) -> Response:
+        entry, fresh = self.cache.lookup(prepared.url)
+        if fresh:
+            return entry.to_response()
+        if entry is not None:
+            prepared.headers.update(entry.validators())
+        response = self._send(prepared, settings)
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidated(entry)
+            return entry.to_response()
+        if response.status_code == 200:
+            self.cache.store(prepared.url, response.status_code, response.text, response.headers)
+        return response
+
+    def _send(self, prepared: PreparedRequest, settings: dict) -> Response:
+        if self.resilience is None:
+            return self.session.send(prepared, **settings)
+        return self.resilience.call(prepared, self.session.send, **settings)
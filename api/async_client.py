@@ -0,0 +1,86 @@
+import asyncio
+import typing as t
+
+import httpx
+
+from api.decode import decode_model
+
+if t.TYPE_CHECKING:
+    from models.schema_cache import SchemaCache
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_CONCURRENCY = 50
+
+
+class AsyncAPIClient:
+    """Awaitable counterpart of ``APIClient`` backed by a pooled ``httpx.AsyncClient``.
+
+    ``max_connections`` bounds the connection pool, ``concurrency`` bounds the number
+    of requests that may be in flight at once (requests above the limit wait their turn).
+    ``schema_cache`` (a ``models.schema_cache.SchemaCache``) switches model validation to
+    the incremental mode.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        client: t.Optional[httpx.AsyncClient] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        schema_cache: t.Optional["SchemaCache"] = None,
+    ) -> None:
+        self.base_url = base_url
+        self.api_key = api_key
+        self.schema_cache = schema_cache
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.concurrency = concurrency
+        self.client = client or self._create_default_client()
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    def _create_default_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+        )
+        return httpx.AsyncClient(headers=self.get_headers(), limits=limits)
+
+    def get_headers(self) -> dict:
+        # h11 rejects header values with trailing whitespace, e.g. "APIKey " for an empty key
+        return {
+            "Authorization": f"APIKey {self.api_key}".rstrip(),
+            "Content-Type": "application/json"
+        }
+
+    def handle_response(self, response: httpx.Response, model: t.Any = None, trusted: bool = False) -> t.Any:
+        response.raise_for_status()
+        if model is not None:
+            return response.status_code, decode_model(model, response.content, trusted, self.schema_cache)
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.text
+
+    async def request(self, method: str, path: str, model: t.Any = None, trusted: bool = False,
+                      **kwargs) -> t.Any:
+        url = f"{self.base_url}{path}"
+        params = kwargs.get("params")
+        if params:
+            # requests silently drops None query values, httpx would send them as "key="
+            kwargs["params"] = {key: value for key, value in params.items() if value is not None}
+        async with self._semaphore:
+            response = await self.client.request(method, url, **kwargs)
+        return self.handle_response(response, model, trusted)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
@@ -0,0 +1,77 @@
+from functools import cached_property
+
+import httpx
+
+from api.async_client import AsyncAPIClient, DEFAULT_CONCURRENCY
+import typing as t
+
+if t.TYPE_CHECKING:
+    from models.schema_cache import SchemaCache
+
+
+class AsyncUsers:
+    def __init__(self, api_client: AsyncAPIClient) -> None:
+        self.api_client = api_client
+
+    async def get_users(self, page: t.Optional[int] = None, model: t.Any = None, trusted: bool = False):
+        return await self.api_client.request(
+            method="GET",
+            path="/api/users",
+            params={"page": page},
+            model=model,
+            trusted=trusted
+        )
+
+    async def get_user(self, user_id: int, model: t.Any = None, trusted: bool = False):
+        return await self.api_client.request(
+            method="GET",
+            path=f"/api/users/{user_id}",
+            model=model,
+            trusted=trusted
+        )
+
+    async def add_user(self, body):
+        return await self.api_client.request(
+            method="POST",
+            path="/api/users",
+            json=body
+        )
+
+    async def edit_user(self, user_id, body):
+        return await self.api_client.request(
+            method="PATCH",
+            path=f"/api/users/{user_id}",
+            json=body
+        )
+
+    async def delete_user(self, user_id):
+        return await self.api_client.request(
+            method="DELETE",
+            path=f"/api/users/{user_id}"
+        )
+
+class AsyncReqresIn:
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        client: t.Optional[httpx.AsyncClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        schema_cache: t.Optional["SchemaCache"] = None,
+    ) -> None:
+        self.api_client = AsyncAPIClient(
+            base_url=base_url, api_key=api_key, client=client, concurrency=concurrency, schema_cache=schema_cache
+        )
+
+    @cached_property
+    def users(self) -> AsyncUsers:
+        return AsyncUsers(self.api_client)
+
+    async def aclose(self) -> None:
+        await self.api_client.aclose()
+
+    async def __aenter__(self) -> "AsyncReqresIn":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
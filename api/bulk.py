@@ -0,0 +1,56 @@
+import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+DEFAULT_WORKERS = 16
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    item: t.Any
+    response: t.Any = None
+    error: t.Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _capture(call: t.Callable[[t.Any], t.Any], item: t.Any) -> BulkResult:
+    try:
+        return BulkResult(item=item, response=call(item))
+    except Exception as e:
+        return BulkResult(item=item, error=e)
+
+
+def iter_bulk(
+    call: t.Callable[[t.Any], t.Any],
+    items: t.Iterable[t.Any],
+    workers: int = DEFAULT_WORKERS,
+    window: t.Optional[int] = None,
+) -> t.Iterator[BulkResult]:
+    """Applies ``call`` to every item on a thread pool and yields results in input order.
+
+    At most ``window`` items (``2 * workers`` by default) are submitted ahead of the oldest
+    unfinished one, so ``items`` may be a lazy iterable of any size. An exception raised
+    for one item is stored on its ``BulkResult`` and does not stop the others.
+    """
+    window = window or workers * 2
+    pending: deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for item in items:
+            if len(pending) >= window:
+                yield pending.popleft().result()
+            pending.append(executor.submit(_capture, call, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def run_bulk(
+    call: t.Callable[[t.Any], t.Any],
+    items: t.Iterable[t.Any],
+    workers: int = DEFAULT_WORKERS,
+    window: t.Optional[int] = None,
+) -> list[BulkResult]:
+    return list(iter_bulk(call, items, workers=workers, window=window))
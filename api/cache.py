@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+import typing as t
+from collections import Counter, OrderedDict
+from dataclasses import asdict, dataclass
+from urllib.parse import urlsplit
+
+from requests import Response
+
+DEFAULT_TTL = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass
+class CacheEntry:
+    url: str
+    status: int
+    content: str
+    content_type: str
+    etag: t.Optional[str]
+    last_modified: t.Optional[str]
+    expires_at: float
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+    def to_response(self) -> Response:
+        response = Response()
+        response.status_code = self.status
+        response._content = self.content.encode()
+        response.encoding = "utf-8"
+        response.headers["Content-Type"] = self.content_type
+        response.url = self.url
+        return response
+
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+class ResponseCache:
+    """Cache for GET responses keyed by full URL.
+
+    The in-memory tier is an LRU bounded by ``max_entries`` and ``max_bytes``. With
+    ``disk_dir`` set, entries are also written under ``disk_dir/<path hash>/<url hash>.json``
+    so they survive between runs and a whole resource path can be dropped at once.
+    Expired entries are kept for conditional revalidation until evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        disk_dir: t.Optional[str] = None,
+        clock: t.Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.clock = clock
+        self.stats: Counter = Counter()
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _disk_path(self, url: str) -> str:
+        return os.path.join(self.disk_dir, _digest(urlsplit(url).path.rstrip("/")), f"{_digest(url)}.json")
+
+    def _load(self, url: str) -> t.Optional[CacheEntry]:
+        try:
+            with open(self._disk_path(url), encoding="utf-8") as file:
+                return CacheEntry(**json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _dump(self, entry: CacheEntry) -> None:
+        path = self._disk_path(entry.url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(asdict(entry), file)
+        os.replace(tmp_path, path)
+
+    def _remember(self, entry: CacheEntry) -> None:
+        previous = self._entries.pop(entry.url, None)
+        if previous is not None:
+            self._bytes -= previous.size
+        self._entries[entry.url] = entry
+        self._bytes += entry.size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.stats["evictions"] += 1
+
+    def lookup(self, url: str) -> tuple[t.Optional[CacheEntry], bool]:
+        """Returns the entry for ``url`` (fresh or stale) and whether it is still fresh."""
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is not None:
+                self._entries.move_to_end(url)
+            elif self.disk_dir:
+                entry = self._load(url)
+                if entry is not None:
+                    self.stats["disk_loads"] += 1
+                    self._remember(entry)
+            fresh = entry is not None and entry.expires_at > self.clock()
+            self.stats["hits" if fresh else "misses"] += 1
+            return entry, fresh
+
+    def store(self, url: str, status: int, content: str, headers: t.Mapping[str, str]) -> None:
+        if "no-store" in headers.get("Cache-Control", ""):
+            return
+        entry = CacheEntry(
+            url=url,
+            status=status,
+            content=content,
+            content_type=headers.get("Content-Type", ""),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            expires_at=self.clock() + self.ttl,
+        )
+        with self._lock:
+            self._remember(entry)
+            self.stats["stores"] += 1
+            if self.disk_dir:
+                self._dump(entry)
+
+    def revalidated(self, entry: CacheEntry) -> None:
+        """Marks a stale entry fresh again after the server answered 304 Not Modified."""
+        with self._lock:
+            entry.expires_at = self.clock() + self.ttl
+            self.stats["revalidations"] += 1
+            if self.disk_dir:
+                self._dump(entry)
+
+    def invalidate(self, url: str) -> None:
+        """Drops entries for the resource at ``url`` and for its parent collection,
+        e.g. PATCH /api/users/2 drops /api/users/2 and every /api/users?page=N."""
+        path = urlsplit(url).path.rstrip("/")
+        paths = {path, path.rsplit("/", 1)[0]}
+        with self._lock:
+            for cached_url in [key for key in self._entries if urlsplit(key).path.rstrip("/") in paths]:
+                self._bytes -= self._entries.pop(cached_url).size
+                self.stats["invalidations"] += 1
+            if self.disk_dir:
+                for stale_path in paths:
+                    shutil.rmtree(os.path.join(self.disk_dir, _digest(stale_path)), ignore_errors=True)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            if self.disk_dir:
+                shutil.rmtree(self.disk_dir, ignore_errors=True)
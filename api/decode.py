@@ -0,0 +1,15 @@
+"""Response body -> model, shared by ``APIClient`` and ``AsyncAPIClient``."""
+import typing as t
+
+if t.TYPE_CHECKING:
+    from models.schema_cache import SchemaCache
+
+
+def decode_model(model: t.Any, content: bytes, trusted: bool = False,
+                 schema_cache: t.Optional["SchemaCache"] = None) -> t.Any:
+    # the caller already imported pydantic for the model, plain JSON calls never do
+    from models.response import validate_json
+
+    if schema_cache is not None and not trusted:
+        return schema_cache.validate_json(model, content)
+    return validate_json(model, content, trusted)
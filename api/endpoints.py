@@ -1,47 +1,134 @@
+from functools import cached_property
+
 from requests import Session
 
 from api.api_client import APIClient
+from api.bulk import BulkResult, DEFAULT_WORKERS, iter_bulk, run_bulk
+from api.cache import ResponseCache
+from api.resilience import Resilience
 import typing as t
 
+if t.TYPE_CHECKING:
+    from models.response import Data, UsersList
+    from models.schema_cache import SchemaCache
+
+DEFAULT_PREFETCH = 4
+
+
+class PaginationError(Exception):
+    """A page could not be fetched, ``page`` is where ``iter_users`` can be resumed from."""
+
+    def __init__(self, page: int, error: Exception) -> None:
+        super().__init__(f"Failed to fetch users page {page}: {error}")
+        self.page = page
+        self.error = error
+
+
 class Users:
     def __init__(self, api_client: APIClient) -> None:
         self.api_client = api_client
+        self._list_users = api_client.template("GET", "/api/users")
+        self._get_user = api_client.template("GET", "/api/users/")
+        self._add_user = api_client.template("POST", "/api/users")
+        self._edit_user = api_client.template("PATCH", "/api/users/")
+        self._delete_user = api_client.template("DELETE", "/api/users/")
 
-    def get_users(self,  page: t.Optional[int] = None):
-        return self.api_client.request(
-            method="GET",
-            path="/api/users",
-            params={"page": page}
+    def get_users(self,  page: t.Optional[int] = None, model: t.Any = None, trusted: bool = False):
+        return self.api_client.send(
+            self._list_users,
+            params={"page": page},
+            model=model,
+            trusted=trusted
         )
-    def get_user(self, user_id: int):
-        return self.api_client.request(
-            method="GET",
-            path=f"/api/users/{user_id}"
+    def get_user(self, user_id: int, model: t.Any = None, trusted: bool = False):
+        return self.api_client.send(
+            self._get_user,
+            path=f"/api/users/{user_id}",
+            model=model,
+            trusted=trusted
         )
     def add_user(self, body):
-        return self.api_client.request(
-            method="POST",
-            path="/api/users",
+        return self.api_client.send(
+            self._add_user,
             json=body
         )
 
     def edit_user(self, user_id, body):
-        return self.api_client.request(
-            method="PATCH",
+        return self.api_client.send(
+            self._edit_user,
             path=f"/api/users/{user_id}",
             json=body
         )
 
     def delete_user(self, user_id):
-        return self.api_client.request(
-            method="DELETE",
+        return self.api_client.send(
+            self._delete_user,
             path=f"/api/users/{user_id}"
         )
 
+    def iter_users(self, start_page: int = 1, prefetch: int = DEFAULT_PREFETCH,
+                   trusted: bool = False) -> t.Iterator["Data"]:
+        """Yields every user page by page, starting from ``start_page``.
+
+        ``total_pages`` is taken from the first page, up to ``prefetch`` following pages are
+        fetched concurrently while earlier ones are consumed. A failed page raises
+        ``PaginationError`` carrying the page number to pass back as ``start_page``.
+        Pages are validated straight from the response bytes, ``trusted`` skips the
+        email checks.
+        """
+        from models.response import UsersList
+
+        def fetch(page: int) -> UsersList:
+            return self.get_users(page=page, model=UsersList, trusted=trusted)[1]
+
+        try:
+            first = fetch(start_page)
+        except Exception as e:
+            raise PaginationError(start_page, e) from e
+        yield from first.data
+
+        pages = range(start_page + 1, first.total_pages + 1)
+        for result in iter_bulk(fetch, pages, workers=prefetch, window=prefetch):
+            if not result.ok:
+                raise PaginationError(result.item, result.error) from result.error
+            yield from result.response.data
+
+    def add_users(self, bodies: t.Iterable[dict], workers: int = DEFAULT_WORKERS,
+                  window: t.Optional[int] = None) -> list[BulkResult]:
+        return run_bulk(self.add_user, bodies, workers=workers, window=window)
+
+    def edit_users(self, edits: t.Iterable[tuple[int, dict]], workers: int = DEFAULT_WORKERS,
+                   window: t.Optional[int] = None) -> list[BulkResult]:
+        return run_bulk(lambda edit: self.edit_user(*edit), edits, workers=workers, window=window)
+
+    def delete_users(self, user_ids: t.Iterable[int], workers: int = DEFAULT_WORKERS,
+                     window: t.Optional[int] = None) -> list[BulkResult]:
+        return run_bulk(self.delete_user, user_ids, workers=workers, window=window)
+
 class ReqresIn:
-    def __init__(self, base_url: str, api_key: str, session: t.Optional[Session] = None) -> None:
-        self.api_client = APIClient(base_url=base_url, api_key=api_key, session=session)
+    def __init__(
+        self,
+        base_url: str,
+        api_key: str,
+        session: t.Optional[Session] = None,
+        resilience: t.Optional[Resilience] = None,
+        cache: t.Optional[ResponseCache] = None,
+        schema_cache: t.Optional["SchemaCache"] = None,
+    ) -> None:
+        self.api_client = APIClient(
+            base_url=base_url, api_key=api_key, session=session, resilience=resilience, cache=cache,
+            schema_cache=schema_cache,
+        )
 
-    @property
+    @cached_property
     def users(self) -> Users:
-        return Users(self.api_client)
\ No newline at end of file
+        return Users(self.api_client)
+
+
+def __getattr__(name: str) -> t.Any:
+    # The async endpoints pull in httpx and anyio, imported only when they are asked for
+    if name in ("AsyncUsers", "AsyncReqresIn"):
+        from api import async_endpoints
+
+        return getattr(async_endpoints, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
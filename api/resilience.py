@@ -0,0 +1,174 @@
+import random
+import threading
+import time
+import typing as t
+from collections import Counter
+from dataclasses import dataclass, field
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response
+from requests.exceptions import ConnectionError, Timeout
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without touching the network while the circuit for a host is open."""
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 5.0
+    jitter: bool = True
+    methods: frozenset = IDEMPOTENT_METHODS
+    statuses: frozenset = RETRY_STATUSES
+    idempotency_header: str = "Idempotency-Key"
+
+    def allows(self, request: PreparedRequest) -> bool:
+        """Non-idempotent methods are only retried when the caller set an idempotency key."""
+        return request.method in self.methods or self.idempotency_header in request.headers
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential delay before retry number ``attempt`` (1-based), with full jitter."""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
+
+
+class CircuitBreaker:
+    """Classic closed/open/half-open breaker for a single host.
+
+    While half-open only ``half_open_max_calls`` probes are let through at a time, the rest
+    are rejected as if the circuit were open until a probe reports back.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0,
+                 clock: t.Callable[[], float] = time.monotonic, half_open_max_calls: int = 1) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.half_open_max_calls = half_open_max_calls
+        self.failures = 0
+        self.opened_at: t.Optional[float] = None
+        self.probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return self.CLOSED
+        if self.clock() - self.opened_at >= self.reset_timeout:
+            return self.HALF_OPEN
+        return self.OPEN
+
+    def allow(self) -> bool:
+        with self._lock:
+            state = self.state
+            if state == self.HALF_OPEN:
+                if self.probes >= self.half_open_max_calls:
+                    return False
+                self.probes += 1
+            return state != self.OPEN
+
+    def release(self) -> None:
+        """Gives back a probe slot for a call that ended without a verdict on the host."""
+        with self._lock:
+            self.probes = max(0, self.probes - 1)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probes = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            # A failed probe in half-open state re-opens the circuit straight away
+            if self.failures >= self.failure_threshold or self.opened_at is not None:
+                self.opened_at = self.clock()
+            self.probes = 0
+
+
+@dataclass
+class Resilience:
+    """Retry, timeout and circuit breaker layer plugged into ``APIClient``.
+
+    ``policies`` overrides ``default_policy`` per HTTP method, ``timeout`` is applied to
+    requests that do not pass their own. Counters live in ``stats``.
+    """
+
+    default_policy: RetryPolicy = field(default_factory=RetryPolicy)
+    policies: dict[str, RetryPolicy] = field(default_factory=dict)
+    timeout: t.Optional[float] = 10.0
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+    half_open_max_calls: int = 1
+    sleep: t.Callable[[float], None] = time.sleep
+    clock: t.Callable[[], float] = time.monotonic
+    stats: Counter = field(default_factory=Counter)
+    breakers: dict[str, CircuitBreaker] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def _count(self, event: str) -> None:
+        with self._lock:
+            self.stats[event] += 1
+
+    def policy_for(self, method: str) -> RetryPolicy:
+        return self.policies.get(method, self.default_policy)
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            with self._lock:
+                breaker = self.breakers.setdefault(
+                    host, CircuitBreaker(self.failure_threshold, self.reset_timeout, self.clock, self.half_open_max_calls)
+                )
+        return breaker
+
+    def call(self, request: PreparedRequest, send: t.Callable[..., Response], **kwargs) -> Response:
+        kwargs.setdefault("timeout", self.timeout)
+        policy = self.policy_for(request.method)
+        attempts = policy.max_attempts if policy.allows(request) else 1
+        breaker = self.breaker_for(request.url)
+        attempt = 0
+        while True:
+            attempt += 1
+            if not breaker.allow():
+                self._count("circuit_open")
+                raise CircuitOpenError(f"Circuit open for {urlsplit(request.url).netloc}", request=request)
+            self._count("attempts")
+            try:
+                response = send(request, **kwargs)
+            except (ConnectionError, Timeout) as e:
+                self._count("timeouts" if isinstance(e, Timeout) else "connection_errors")
+                breaker.record_failure()
+                if attempt >= attempts:
+                    self._count("failures")
+                    raise
+            except BaseException:
+                breaker.release()
+                raise
+            else:
+                if response.status_code not in policy.statuses:
+                    breaker.record_success()
+                    self._count("successes")
+                    return response
+                self._count("retryable_statuses")
+                breaker.record_failure()
+                if attempt >= attempts:
+                    self._count("failures")
+                    return response
+                response.close()
+            self._count("retries")
+            self.sleep(policy.backoff(attempt))
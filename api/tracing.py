@@ -0,0 +1,199 @@
+import re
+import socket
+import threading
+import time
+import typing as t
+from collections import deque
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.connection import allowed_gai_family
+
+HOOK_EVENTS = ("pre_request", "post_response", "post_decode")
+DEFAULT_CAPACITY = 4096
+PHASES = ("dns", "connect", "tls", "wait", "download", "decode", "validate", "total")
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+_current = threading.local()
+
+
+class RequestTrace:
+    """Per-request state handed to every hook.
+
+    ``marks`` holds ``perf_counter`` timestamps of the events fired so far, ``dns``,
+    ``connect`` (TCP handshake) and ``tls`` are filled in by ``TimedHTTPAdapter`` when the
+    request had to open a connection.
+    """
+
+    __slots__ = ("request", "model", "response", "result", "error", "marks", "dns", "connect", "tls")
+
+    def __init__(self, request: PreparedRequest, model: t.Any = None) -> None:
+        self.request = request
+        self.model = model
+        self.response: t.Optional[Response] = None
+        self.result: t.Any = None
+        self.error: t.Optional[BaseException] = None
+        self.marks: dict[str, float] = {}
+        self.dns = 0.0
+        self.connect = 0.0
+        self.tls = 0.0
+
+    def __enter__(self) -> "RequestTrace":
+        _current.trace = self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        _current.trace = None
+
+
+def current_trace() -> t.Optional[RequestTrace]:
+    return getattr(_current, "trace", None)
+
+
+class TimedHTTPConnection(HTTPConnection):
+    def _new_conn(self):
+        trace = current_trace()
+        if trace is None:
+            return super()._new_conn()
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # let urllib3 resolve again and raise its own NameResolutionError
+            addresses = []
+        resolved = time.perf_counter()
+        trace.dns += resolved - started
+        if not addresses:
+            return super()._new_conn()
+        # connect to the resolved addresses in order, as create_connection would, so the
+        # lookup above is the only one and its time is not counted as connect time
+        host = self._dns_host
+        try:
+            for index, address in enumerate(addresses):
+                self._dns_host = address[4][0]
+                try:
+                    return super()._new_conn()
+                except ConnectTimeoutError:  # NewConnectionError included
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+            trace.connect += time.perf_counter() - resolved
+
+
+class TimedHTTPSConnection(HTTPSConnection, TimedHTTPConnection):
+    def connect(self) -> None:
+        trace = current_trace()
+        if trace is None:
+            return super().connect()
+        opened_before = trace.dns + trace.connect
+        started = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            # whatever connect() spent outside _new_conn (DNS and TCP) is the TLS handshake
+            opened = trace.dns + trace.connect - opened_before
+            trace.tls += max(0.0, time.perf_counter() - started - opened)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report DNS lookup, TCP connect and TLS handshake time to
+    the active ``RequestTrace``. Costs a thread-local lookup per new connection otherwise."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": TimedHTTPConnectionPool,
+            "https": TimedHTTPSConnectionPool,
+        }
+
+
+def endpoint_of(request: PreparedRequest) -> str:
+    """``GET /api/users/{id}`` style key, so ids do not split the aggregates."""
+    path = _ID_SEGMENT.sub("/{id}", urlsplit(request.url).path)
+    return f"{request.method} {path}"
+
+
+class RequestTiming(t.NamedTuple):
+    sequence: int
+    endpoint: str
+    status: t.Optional[int]
+    phases: dict[str, float]
+    error: t.Optional[str]
+
+    @classmethod
+    def from_trace(cls, sequence: int, trace: RequestTrace) -> "RequestTiming":
+        marks = trace.marks
+        started = marks["pre_request"]
+        finished = marks.get("post_decode", time.perf_counter())
+        phases = {"dns": trace.dns, "connect": trace.connect, "tls": trace.tls, "total": finished - started}
+        if "post_response" in marks:
+            elapsed = trace.response.elapsed.total_seconds()
+            phases["wait"] = max(0.0, elapsed - trace.dns - trace.connect - trace.tls)
+            phases["download"] = max(0.0, marks["post_response"] - started - elapsed)
+            phases["validate" if trace.model is not None else "decode"] = finished - marks["post_response"]
+        status = trace.response.status_code if trace.response is not None else None
+        error = type(trace.error).__name__ if trace.error is not None else None
+        return cls(sequence, endpoint_of(trace.request), status, phases, error)
+
+
+class TimingRecorder:
+    """Keeps the last ``capacity`` request timings in a ring buffer plus running per-endpoint
+    totals, so the session summary covers every request while memory stays bounded."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        self.records: deque[RequestTiming] = deque(maxlen=capacity)
+        self.sequence = 0
+        self._totals: dict[str, dict[str, list[float]]] = {}
+        self._counts: dict[str, list[int]] = {}
+        self._lock = threading.Lock()
+
+    def install(self, api_client) -> None:
+        api_client.add_hook("post_decode", self.record)
+
+    def record(self, trace: RequestTrace) -> None:
+        with self._lock:
+            self.sequence += 1
+            timing = RequestTiming.from_trace(self.sequence, trace)
+            self.records.append(timing)
+            counts = self._counts.setdefault(timing.endpoint, [0, 0])
+            counts[0] += 1
+            counts[1] += timing.error is not None
+            totals = self._totals.setdefault(timing.endpoint, {})
+            for phase, value in timing.phases.items():
+                total = totals.setdefault(phase, [0, 0.0, 0.0])
+                total[0] += 1
+                total[1] += value
+                total[2] = max(total[2], value)
+
+    def since(self, sequence: int) -> list[RequestTiming]:
+        """Timings recorded after ``sequence`` that are still in the buffer."""
+        with self._lock:
+            return [timing for timing in self.records if timing.sequence > sequence]
+
+    def summary(self) -> dict:
+        """Per endpoint request/error counts and mean/max milliseconds for every phase."""
+        with self._lock:
+            return {
+                endpoint: {
+                    "requests": self._counts[endpoint][0],
+                    "errors": self._counts[endpoint][1],
+                    "phases_ms": {
+                        phase: {"mean": round(total / count * 1e3, 3), "max": round(peak * 1e3, 3)}
+                        for phase, (count, total, peak) in sorted(totals.items(), key=lambda item: PHASES.index(item[0]))
+                    },
+                }
+                for endpoint, totals in self._totals.items()
+            }
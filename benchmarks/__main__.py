@@ -0,0 +1,50 @@
+"""Runs the benchmark suite and gates on a stored baseline.
+
+    python -m benchmarks --save benchmarks/baseline.json          # record a baseline
+    python -m benchmarks --baseline benchmarks/baseline.json      # exit 1 on regressions
+    python -m benchmarks -k 'api.*' -k 'models.*' --threshold 0.1
+
+With ``--baseline`` a selected case the baseline has no result for fails the run too: a
+baseline recorded without Chromium lists the page.* cases as skipped and cannot gate them,
+re-record it with ``--save`` on a machine with a browser (``playwright install chromium``),
+or when a change makes a case slower on purpose. The committed ``benchmarks/baseline.json``
+is also checked by ``pytest --run-slow`` (tests/test_benchmarks.py), with a loose threshold.
+"""
+import argparse
+import json
+import sys
+import typing as t
+
+from benchmarks import suite  # noqa: F401  registers the cases
+from benchmarks.harness import DEFAULT_THRESHOLD, compare, load, missing, run_cases, save
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Framework overhead benchmarks")
+    parser.add_argument("-k", dest="patterns", action="append", help="glob of case names to run, repeatable")
+    parser.add_argument("--baseline", help="JSON report to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed median slowdown, a share (0.25 = 25%%)")
+    parser.add_argument("--save", help="write this run's JSON report here")
+    parser.add_argument("--json", action="store_true", help="print the JSON report")
+    args = parser.parse_args(argv)
+
+    report = run_cases(args.patterns or ["*"], log=lambda line: print(line, file=sys.stderr))
+    if args.save:
+        save(report, args.save)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    if not args.baseline:
+        return 0
+    baseline = load(args.baseline)
+    regressions = compare(baseline, report, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    gaps = missing(baseline, args.patterns or ["*"])
+    for name, reason in gaps.items():
+        print(f"NOT BASELINED {name}: {reason}", file=sys.stderr)
+    return 1 if regressions or gaps else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Per-call ``logger.info`` latency with synchronous vs queued handlers.
+
+Run with ``python -m benchmarks.bench_logging``. Starts several processes, the way
+pytest-xdist workers would, that all log into the same file and time every call.
+"""
+import os
+import tempfile
+import time
+from multiprocessing import Pool
+
+from utils.logging_config import setup_logger
+
+WORKERS = 4
+CALLS = 20_000
+
+
+def _worker(args: tuple[str, bool, int]) -> list[float]:
+    log_file, queued, calls = args
+    logger = setup_logger(f"bench.{os.getpid()}", log_file=log_file, queued=queued, console=False)
+    latencies = []
+    for i in range(calls):
+        started = time.perf_counter()
+        logger.info("Setting price range: min=%s, max=%s", i, i + 50)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def run(workers: int = WORKERS, calls: int = CALLS) -> dict[str, dict[str, float]]:
+    results = {}
+    with tempfile.TemporaryDirectory() as log_dir:
+        for mode, queued in (("sync", False), ("queued", True)):
+            log_file = os.path.join(log_dir, f"{mode}.log")
+            with Pool(workers) as pool:
+                latencies = sorted(sum(pool.map(_worker, [(log_file, queued, calls)] * workers), []))
+            results[mode] = {
+                "mean_us": sum(latencies) / len(latencies) * 1e6,
+                "p50_us": latencies[len(latencies) // 2] * 1e6,
+                "p99_us": latencies[int(len(latencies) * 0.99)] * 1e6,
+            }
+    return results
+
+
+if __name__ == "__main__":
+    results = run()
+    for mode, stats in results.items():
+        print(f"{mode:>7}: mean {stats['mean_us']:6.1f}, p50 {stats['p50_us']:6.1f}, p99 {stats['p99_us']:6.1f} us/call "
+              f"({WORKERS} workers)")
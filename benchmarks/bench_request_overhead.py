@@ -0,0 +1,59 @@
+"""Per-call client overhead of ``Users.get_user`` without any network I/O.
+
+Run with ``python -m benchmarks.bench_request_overhead``. A canned transport adapter is
+mounted on the session, so the numbers only reflect what the client itself costs per call.
+"""
+import timeit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+
+from api.endpoints import ReqresIn
+
+BASE_URL = "http://reqres.local"
+CALLS = 20_000
+BODY = b'{"data": {"id": 2}, "support": {"url": "", "text": ""}}'
+
+
+class CannedAdapter(BaseAdapter):
+    def send(self, request, **kwargs) -> Response:
+        response = Response()
+        response.status_code = 200
+        response._content = BODY
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def make_client() -> ReqresIn:
+    reqresin = ReqresIn(base_url=BASE_URL, api_key="bench")
+    reqresin.api_client.session.mount(BASE_URL, CannedAdapter())
+    return reqresin
+
+
+def legacy_get_user(reqresin: ReqresIn, user_id: int):
+    """Request path as it was before: fresh headers and a full Session.request per call."""
+    api_client = reqresin.api_client
+    response = api_client.session.request(
+        "GET", f"{api_client.base_url}/api/users/{user_id}", headers=api_client.get_headers()
+    )
+    return api_client.handle_response(response)
+
+
+def run(calls: int = CALLS) -> dict[str, float]:
+    reqresin = make_client()
+    results = {
+        "legacy": timeit.timeit(lambda: legacy_get_user(reqresin, 2), number=calls),
+        "request": timeit.timeit(lambda: reqresin.api_client.request("GET", "/api/users/2"), number=calls),
+        "template": timeit.timeit(lambda: reqresin.users.get_user(2), number=calls),
+    }
+    return {name: total / calls * 1e6 for name, total in results.items()}
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, usec in results.items():
+        print(f"{name:>10}: {usec:8.1f} us/call  (x{results['legacy'] / usec:.1f})")
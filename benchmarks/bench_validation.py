@@ -0,0 +1,49 @@
+"""Response model validation cost on a large synthetic ``UsersList`` payload.
+
+Run with ``python -m benchmarks.bench_validation``. Compares the classic
+``UsersList(**response.json())`` double pass with ``validate_json`` straight from bytes,
+with and without trusted mode.
+"""
+import json
+import timeit
+
+from models.response import UsersList, validate_json
+
+ROWS = 10_000
+ROUNDS = 5
+
+
+def make_payload(rows: int = ROWS) -> bytes:
+    return json.dumps({
+        "page": 1,
+        "per_page": rows,
+        "total": rows,
+        "total_pages": 1,
+        "data": [
+            {
+                "id": user_id,
+                "email": f"user{user_id}@reqres.in",
+                "first_name": f"First{user_id}",
+                "last_name": f"Last{user_id}",
+                "avatar": f"https://reqres.in/img/faces/{user_id}-image.jpg"
+            }
+            for user_id in range(1, rows + 1)
+        ],
+        "support": {"url": "https://reqres.in/#support-heading", "text": "Support"}
+    }).encode()
+
+
+def run(rows: int = ROWS, rounds: int = ROUNDS) -> dict[str, float]:
+    raw = make_payload(rows)
+    results = {
+        "dict": timeit.timeit(lambda: UsersList(**json.loads(raw)), number=rounds),
+        "json": timeit.timeit(lambda: validate_json(UsersList, raw), number=rounds),
+        "trusted": timeit.timeit(lambda: validate_json(UsersList, raw, trusted=True), number=rounds),
+    }
+    return {name: total / rounds * 1e3 for name, total in results.items()}
+
+
+if __name__ == "__main__":
+    results = run()
+    for name, msec in results.items():
+        print(f"{name:>8}: {msec:8.1f} ms/payload  (x{results['dict'] / msec:.1f})")
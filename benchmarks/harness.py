@@ -0,0 +1,129 @@
+"""Minimal pytest-benchmark style harness with JSON baselines.
+
+A case is a generator registered with ``@case``: code before ``yield`` is setup, the
+yielded callable is timed, code after it is teardown. Every case is calibrated so a round
+lasts at least ``min_time`` and timed for several rounds; the median per-call time is what
+baselines are compared on.
+"""
+import fnmatch
+import json
+import platform
+import statistics
+import time
+import typing as t
+from contextlib import contextmanager
+from dataclasses import dataclass
+
+DEFAULT_ROUNDS = 5
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_THRESHOLD = 0.25
+
+CaseFactory = t.Callable[[], t.Iterator[t.Callable[[], t.Any]]]
+
+
+class SkipCase(Exception):
+    """Raised by a case setup when the case cannot run here (e.g. no browser installed)."""
+
+
+@dataclass
+class Case:
+    name: str
+    factory: CaseFactory
+    rounds: int = DEFAULT_ROUNDS
+    min_time: float = DEFAULT_MIN_TIME
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, rounds: int = DEFAULT_ROUNDS, min_time: float = DEFAULT_MIN_TIME) -> t.Callable[[CaseFactory], CaseFactory]:
+    def register(factory: CaseFactory) -> CaseFactory:
+        if name in CASES:
+            raise ValueError(f"Benchmark case {name!r} is already registered")
+        CASES[name] = Case(name, factory, rounds, min_time)
+        return factory
+    return register
+
+
+def measure(fn: t.Callable[[], t.Any], rounds: int = DEFAULT_ROUNDS, min_time: float = DEFAULT_MIN_TIME) -> dict:
+    """Per-call statistics in microseconds."""
+    fn()  # warm up caches, lazy imports, connection pools
+    number = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        if time.perf_counter() - started >= min_time:
+            break
+        number *= 2
+    samples = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - started) / number * 1e6)
+    return {
+        "median_us": round(statistics.median(samples), 3),
+        "min_us": round(min(samples), 3),
+        "mean_us": round(statistics.fmean(samples), 3),
+        "stddev_us": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "calls_per_round": number,
+        "rounds": rounds,
+    }
+
+
+def run_cases(patterns: t.Sequence[str] = ("*",), log: t.Callable[[str], t.Any] = print) -> dict:
+    results, skipped = {}, {}
+    for name, registered in CASES.items():
+        if not any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            continue
+        try:
+            with contextmanager(registered.factory)() as fn:
+                results[name] = measure(fn, registered.rounds, registered.min_time)
+        except SkipCase as e:
+            skipped[name] = str(e)
+            log(f"{name:<40} skipped: {e}")
+            continue
+        log(f"{name:<40} {results[name]['median_us']:>12.1f} us/call")
+    return {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(),
+                    "processor": platform.processor() or platform.machine()},
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        "skipped": skipped,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """Cases whose median got slower than the baseline by more than ``threshold`` (0.25 = 25%)."""
+    regressions = []
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        if now["median_us"] > before["median_us"] * (1 + threshold):
+            regressions.append(f"{name}: {before['median_us']}us -> {now['median_us']}us "
+                               f"(+{now['median_us'] / before['median_us'] - 1:.0%})")
+    return regressions
+
+
+def missing(baseline: dict, patterns: t.Sequence[str] = ("*",)) -> dict[str, str]:
+    """Registered cases matching ``patterns`` the baseline has no result for, with the reason
+    (e.g. the skip message when the baseline was recorded without a browser). ``compare``
+    cannot catch regressions in these, a gate should refuse to pass over them."""
+    gaps = {}
+    for name in CASES:
+        if name in baseline["results"] or not any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns):
+            continue
+        gaps[name] = baseline.get("skipped", {}).get(name, "not in the baseline")
+    return gaps
+
+
+def load(path: str) -> dict:
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def save(report: dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
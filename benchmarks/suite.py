@@ -0,0 +1,132 @@
+"""Benchmark cases for the framework's own hot paths.
+
+API client dispatch, response model parsing, logger setup and logging calls run anywhere;
+the page-object cases drive ``fixtures/hosting.html`` in headless Chromium and are skipped
+when no browser is installed.
+"""
+import json
+import logging
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+from benchmarks.bench_request_overhead import make_client
+from benchmarks.bench_validation import make_payload
+from benchmarks.harness import SkipCase, case
+from models.response import UsersList, validate_json
+from models.schema_cache import SchemaCache
+from utils import logging_config
+from utils.logging_config import setup_logger
+
+HOSTING_FIXTURE = Path(__file__).parent / "fixtures" / "hosting.html"
+PAYLOAD_ROWS = 1_000
+FIXTURE_CARDS = 200
+
+
+@case("api.request")
+def api_request():
+    reqresin = make_client()
+    yield lambda: reqresin.api_client.request("GET", "/api/users/2")
+
+
+@case("api.template")
+def api_template():
+    reqresin = make_client()
+    yield lambda: reqresin.users.get_user(2)
+
+
+@case("models.users_list.dict")
+def users_list_dict():
+    raw = make_payload(PAYLOAD_ROWS)
+    yield lambda: UsersList(**json.loads(raw))
+
+
+@case("models.users_list.validate_json")
+def users_list_validate_json():
+    raw = make_payload(PAYLOAD_ROWS)
+    yield lambda: validate_json(UsersList, raw)
+
+
+@case("models.users_list.trusted")
+def users_list_trusted():
+    raw = make_payload(PAYLOAD_ROWS)
+    yield lambda: validate_json(UsersList, raw, trusted=True)
+
+
+@case("models.users_list.schema_cache")
+def users_list_schema_cache():
+    """A repeated body through a warm ``SchemaCache``: trusted pass plus sampled rows."""
+    raw = make_payload(PAYLOAD_ROWS)
+    cache = SchemaCache(seed=0)
+    cache.validate_json(UsersList, raw)
+    yield lambda: cache.validate_json(UsersList, raw)
+
+
+def _forget_logger(name: str) -> None:
+    """Drops a configured logger, so the next setup_logger call configures it from scratch."""
+    logging_config._loggers.pop(name, None)
+    logging.Logger.manager.loggerDict.pop(name, None)
+
+
+@case("logging.setup_logger")
+def logging_setup_logger():
+    # one name set up and forgotten again: fresh setups without growing the logger registry
+    name = "bench.setup"
+    with tempfile.TemporaryDirectory() as log_dir:
+        log_file = str(Path(log_dir) / "setup.log")
+
+        def setup() -> None:
+            setup_logger(name, log_file=log_file, console=False)
+            _forget_logger(name)
+
+        yield setup
+
+
+@case("logging.info.queued")
+def logging_info_queued():
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = setup_logger("bench.info.queued", log_file=str(Path(log_dir) / "queued.log"), console=False)
+        yield lambda: logger.info("Setting price range: min=%s, max=%s", 400, 450)
+
+
+@contextmanager
+def _hosting_page():
+    """A HostingPage on the fixture with the price filter open, shared by the page-object cases."""
+    from playwright.sync_api import Error, sync_playwright
+
+    from pages.hosting_page import HostingPage
+
+    with sync_playwright() as playwright:
+        try:
+            browser = playwright.chromium.launch()
+        except Error as e:
+            raise SkipCase(f"no browser: {str(e).splitlines()[0]}")
+        try:
+            page = browser.new_page()
+            page.goto(f"{HOSTING_FIXTURE.as_uri()}?cards={FIXTURE_CARDS}")
+            hosting_page = HostingPage(page)
+            hosting_page.click_price_filter()
+            yield hosting_page
+        finally:
+            browser.close()
+
+
+@case("page.server_cards.evaluate_all", rounds=3)
+def page_server_cards():
+    with _hosting_page() as hosting_page:
+        yield hosting_page.get_server_cards
+
+
+@case("page.server_cards.per_card", rounds=3)
+def page_server_cards_per_card():
+    """The former one-round-trip-per-card extraction, for comparison."""
+    with _hosting_page() as hosting_page:
+        headers = hosting_page.page.locator('gcore-price-card div.gc-price-card-header')
+        yield lambda: [header.locator('span').nth(1).inner_text() for header in headers.all()]
+
+
+@case("page.numeric_input_cases", rounds=3)
+def page_numeric_input_cases():
+    with _hosting_page() as hosting_page:
+        cases = hosting_page.numeric_input_cases(0, 1000, is_min=True)
+        yield lambda: hosting_page.run_numeric_cases(hosting_page._min_price_input, cases)
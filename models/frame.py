@@ -0,0 +1,139 @@
+import sys
+import typing as t
+from array import array
+from itertools import repeat
+
+from models.response import Data, Support, UsersList
+
+COLUMNS = ("emails", "first_names", "last_names", "avatars")
+
+
+class UserRow:
+    """Lightweight view of one row of a ``UsersFrame``, no per-row ``__dict__``."""
+
+    __slots__ = ("_frame", "_index")
+
+    def __init__(self, frame: "UsersFrame", index: int) -> None:
+        self._frame = frame
+        self._index = index
+
+    @property
+    def id(self) -> int:
+        return self._frame.ids[self._index]
+
+    @property
+    def email(self) -> str:
+        return self._frame.emails[self._index]
+
+    @property
+    def first_name(self) -> str:
+        return self._frame.first_names[self._index]
+
+    @property
+    def last_name(self) -> str:
+        return self._frame.last_names[self._index]
+
+    @property
+    def avatar(self) -> str:
+        return self._frame.avatars[self._index]
+
+    def to_model(self) -> Data:
+        return Data(
+            id=self.id, email=self.email, first_name=self.first_name, last_name=self.last_name, avatar=self.avatar
+        )
+
+    def __repr__(self) -> str:
+        return f"UserRow(id={self.id}, email={self.email!r})"
+
+
+class UsersFrame:
+    """Column-oriented store for large user lists.
+
+    Ids live in a typed ``array``, string columns in plain lists with interned values, so
+    a row costs a handful of pointers instead of a full ``Data`` model. Page metadata is
+    kept when the frame is built from a ``UsersList`` so it can be converted back.
+    """
+
+    __slots__ = ("ids", "emails", "first_names", "last_names", "avatars",
+                 "page", "per_page", "total", "total_pages", "support")
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.emails: list[str] = []
+        self.first_names: list[str] = []
+        self.last_names: list[str] = []
+        self.avatars: list[str] = []
+        self.page: t.Optional[int] = None
+        self.per_page: t.Optional[int] = None
+        self.total: t.Optional[int] = None
+        self.total_pages: t.Optional[int] = None
+        self.support: t.Optional[Support] = None
+
+    @classmethod
+    def from_rows(cls, rows: t.Iterable[t.Union[Data, t.Mapping[str, t.Any]]]) -> "UsersFrame":
+        """Builds a frame from ``Data`` models or plain dicts, e.g. ``Users.iter_users()``."""
+        frame = cls()
+        for row in rows:
+            frame.append(row)
+        return frame
+
+    @classmethod
+    def from_users_list(cls, users_list: UsersList) -> "UsersFrame":
+        frame = cls.from_rows(users_list.data)
+        frame.page = users_list.page
+        frame.per_page = users_list.per_page
+        frame.total = users_list.total
+        frame.total_pages = users_list.total_pages
+        frame.support = users_list.support
+        return frame
+
+    def append(self, row: t.Union[Data, t.Mapping[str, t.Any]]) -> None:
+        get = row.get if isinstance(row, t.Mapping) else row.__getattribute__
+        self.ids.append(get("id"))
+        self.emails.append(sys.intern(get("email")))
+        self.first_names.append(sys.intern(get("first_name")))
+        self.last_names.append(sys.intern(get("last_name")))
+        self.avatars.append(sys.intern(get("avatar")))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: int) -> UserRow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("UsersFrame index out of range")
+        return UserRow(self, index)
+
+    def __iter__(self) -> t.Iterator[UserRow]:
+        return (UserRow(self, index) for index in range(len(self)))
+
+    def to_users_list(self) -> UsersList:
+        if self.support is None:
+            raise ValueError("UsersFrame has no page metadata, build it with from_users_list()")
+        return UsersList(
+            page=self.page,
+            per_page=self.per_page,
+            total=self.total,
+            total_pages=self.total_pages,
+            data=[
+                {"id": user_id, "email": email, "first_name": first_name, "last_name": last_name, "avatar": avatar}
+                for user_id, email, first_name, last_name, avatar
+                in zip(self.ids, self.emails, self.first_names, self.last_names, self.avatars)
+            ],
+            support=self.support,
+        )
+
+    def all_ids_greater_than(self, value: int) -> bool:
+        return not self.ids or min(self.ids) > value
+
+    def all_start_with(self, column: str, prefix: str) -> bool:
+        return all(map(str.startswith, self._column(column), repeat(prefix)))
+
+    def all_non_blank(self, column: str) -> bool:
+        return all(map(str.strip, self._column(column)))
+
+    def _column(self, column: str) -> list[str]:
+        if column not in COLUMNS:
+            raise KeyError(f"Unknown column {column!r}, expected one of {COLUMNS}")
+        return getattr(self, column)
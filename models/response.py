@@ -1,4 +1,7 @@
-from pydantic import BaseModel, EmailStr, field_validator, ConfigDict
+import typing as t
+from functools import lru_cache
+
+from pydantic import BaseModel, EmailStr, field_validator, ConfigDict, TypeAdapter
 
 
 class Data(BaseModel):
@@ -36,4 +39,38 @@ class CreatedUser(BaseModel):
     id: int
     createdAt: str
     name: str
-    job: str
\ No newline at end of file
+    job: str
+
+
+# Trusted variants skip the costly EmailStr check, meant for bulk reads of data
+# that has already been validated elsewhere (e.g. load runs against a known service)
+class _TrustedData(Data):
+    email: str
+
+class _TrustedUser(User):
+    data: _TrustedData
+
+class _TrustedUsersList(UsersList):
+    data: list[_TrustedData]
+
+TRUSTED_MODELS = {
+    Data: _TrustedData,
+    User: _TrustedUser,
+    UsersList: _TrustedUsersList,
+}
+
+
+@lru_cache(maxsize=None)
+def get_adapter(model: t.Any) -> TypeAdapter:
+    return TypeAdapter(model)
+
+
+def validate_json(model: t.Any, raw: t.Union[str, bytes], trusted: bool = False) -> t.Any:
+    """Validates a raw JSON body straight into ``model`` without an intermediate dict.
+
+    ``model`` may be any type a ``TypeAdapter`` accepts, e.g. ``UsersList`` or ``list[Data]``.
+    With ``trusted=True`` the relaxed variant from ``TRUSTED_MODELS`` is used when there is one.
+    """
+    if trusted:
+        model = TRUSTED_MODELS.get(model, model)
+    return get_adapter(model).validate_json(raw)
@@ -0,0 +1,172 @@
+"""Incremental response validation keyed by the structural shape of the payload.
+
+Polling and load runs receive the same shapes, and mostly the same records, over and over.
+A ``SchemaCache`` fingerprints the shape of every body (keys and JSON types, not values)
+and validates a shape it has not verified yet in full. So is a body whose own fields (all
+but the nested records) were not seen before, or are picked by ``sample_rate``. Otherwise:
+
+* the whole body goes through the relaxed ``TRUSTED_MODELS`` variant, so every field is
+  still type-checked, only the expensive checks (``EmailStr``) are skipped;
+* every nested record (``Data`` rows and the like) not seen before is validated with the
+  full model, and so is a ``sample_rate`` share of the records that were.
+
+New values are therefore always validated in full, only repeated ones can be skipped.
+
+Models without a relaxed variant are always validated in full. Results of the fast path
+are instances of the trusted subclasses, e.g. ``_TrustedUsersList`` for ``UsersList``.
+"""
+import json
+import random
+import threading
+import typing as t
+from collections import Counter, OrderedDict
+from functools import lru_cache
+
+from pydantic import BaseModel
+
+from models.response import TRUSTED_MODELS, get_adapter
+
+DEFAULT_MAX_SHAPES = 256
+DEFAULT_MAX_RECORDS = 100_000
+DEFAULT_SAMPLE_RATE = 0.05
+
+Shape = t.Hashable
+
+
+def fingerprint(value: t.Any) -> Shape:
+    """Structural shape of a decoded JSON value: object keys and value types, recursively;
+    a list is the set of its items' shapes, so its length does not matter."""
+    if isinstance(value, dict):
+        return tuple((key, fingerprint(item)) for key, item in sorted(value.items()))
+    if isinstance(value, list):
+        return ("list", frozenset(fingerprint(item) for item in value))
+    return type(value).__name__
+
+
+@lru_cache(maxsize=None)
+def record_fields(model: type) -> dict[str, tuple[type, bool]]:
+    """Fields of ``model`` holding nested models: name -> (model, is_list)."""
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        is_list = t.get_origin(annotation) is list
+        if is_list:
+            annotation = t.get_args(annotation)[0]
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            fields[name] = (annotation, is_list)
+    return fields
+
+
+def _record_key(record: t.Any) -> t.Hashable:
+    """The record itself as a hashable value, never just its hash: a collision must not
+    let an unseen record pass as a seen one."""
+    try:
+        key = tuple(record.items())
+        hash(key)
+        return key
+    except (AttributeError, TypeError):
+        # nested containers are not hashable, fall back to the canonical JSON text
+        return json.dumps(record, sort_keys=True)
+
+
+def _own_fields(model: type, payload: t.Any) -> t.Any:
+    """The body without its nested records, which are keyed one by one."""
+    if not isinstance(payload, dict):
+        return payload
+    nested = record_fields(model)
+    return {name: value for name, value in payload.items() if name not in nested}
+
+
+class SchemaCache:
+    def __init__(
+        self,
+        max_shapes: int = DEFAULT_MAX_SHAPES,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        seed: t.Optional[int] = None,
+    ) -> None:
+        self.max_shapes = max_shapes
+        self.max_records = max_records
+        self.sample_rate = sample_rate
+        self.stats: Counter = Counter()
+        self._shapes: OrderedDict[tuple, None] = OrderedDict()
+        self._records: OrderedDict[tuple, None] = OrderedDict()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def validate_json(self, model: t.Any, raw: t.Union[str, bytes]) -> t.Any:
+        trusted_model = TRUSTED_MODELS.get(model)
+        if trusted_model is None:
+            self._count("full")
+            return get_adapter(model).validate_json(raw)
+
+        payload = json.loads(raw)
+        shape_key = (model, fingerprint(payload))
+        body_key = (model, _record_key(_own_fields(model, payload)))
+        if not self._seen(self._shapes, shape_key) or self._needs_validation(body_key):
+            result = get_adapter(model).validate_python(payload)
+            self._remember(self._shapes, shape_key, self.max_shapes)
+            self._remember(self._records, body_key, self.max_records)
+            self._remember_records(model, payload)
+            self._count("full")
+            return result
+
+        result = get_adapter(trusted_model).validate_python(payload)
+        self._validate_new_records(model, payload)
+        self._count("fast")
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._shapes.clear()
+            self._records.clear()
+            self.stats.clear()
+
+    def _iter_records(self, model: type, payload: t.Any) -> t.Iterator[tuple[type, t.Any]]:
+        if not isinstance(payload, dict):
+            return
+        for name, (record_model, is_list) in record_fields(model).items():
+            value = payload.get(name)
+            for record in (value if is_list and isinstance(value, list) else [value]):
+                if isinstance(record, dict):
+                    yield record_model, record
+
+    def _remember_records(self, model: type, payload: t.Any) -> None:
+        for record_model, record in self._iter_records(model, payload):
+            self._remember(self._records, (record_model, _record_key(record)), self.max_records)
+
+    def _validate_new_records(self, model: type, payload: t.Any) -> None:
+        for record_model, record in self._iter_records(model, payload):
+            key = (record_model, _record_key(record))
+            if self._needs_validation(key):
+                get_adapter(record_model).validate_python(record)
+                self._remember(self._records, key, self.max_records)
+
+    def _needs_validation(self, key: tuple) -> bool:
+        """Unseen records and a sample_rate share of the seen ones are validated in full."""
+        if not self._seen(self._records, key):
+            self._count("records_new")
+            return True
+        if self._random.random() < self.sample_rate:
+            self._count("records_sampled")
+            return True
+        self._count("records_skipped")
+        return False
+
+    def _seen(self, entries: OrderedDict, key: tuple) -> bool:
+        with self._lock:
+            if key not in entries:
+                return False
+            entries.move_to_end(key)
+            return True
+
+    def _remember(self, entries: OrderedDict, key: tuple, limit: int) -> None:
+        with self._lock:
+            entries[key] = None
+            entries.move_to_end(key)
+            while len(entries) > limit:
+                entries.popitem(last=False)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
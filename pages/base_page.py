@@ -1,12 +1,193 @@
-from playwright.sync_api import Page
+import time
+import typing as t
+from contextlib import contextmanager
+
+from pages.network import NavigationReport, NetworkLayer, NetworkPolicy
+
+# playwright is imported where a page is driven, so collecting tests that never open one
+# (e.g. an API-only selection) does not pay for it
+if t.TYPE_CHECKING:
+    from playwright.sync_api import Locator, LocatorAssertions, Page
 
 BASE_URL = "https://gcore.com"
+DEFAULT_QUIET_MS = 150
+DEFAULT_SETTLE_TIMEOUT_MS = 5000
+
+# Watches the elements' parents (so replaced elements count too) for mutations to children,
+# attributes and text, and keeps the time of the latest one on window under the returned id.
+_WATCH_DOM = """elements => {
+    const watches = window.__domWatches ??= new Map();
+    const id = window.__domWatchId = (window.__domWatchId ?? 0) + 1;
+    const watch = {last: null, observer: null};
+    watch.observer = new MutationObserver(() => { watch.last = performance.now(); });
+    for (const target of new Set(elements.map(element => element.parentNode ?? element))) {
+        watch.observer.observe(target, {subtree: true, childList: true, attributes: true, characterData: true});
+    }
+    watches.set(id, watch);
+    return id;
+}"""
+
+# Resolves once the watched elements have changed at least once and then not again for `quiet`
+# ms. No mutation at all is a failure: quiet before the first change does not mean settled.
+_WAIT_FOR_DOM_CHANGE = """({id, quiet, timeout}) => new Promise((resolve, reject) => {
+    const watch = window.__domWatches.get(id);
+    const started = performance.now();
+    const stop = () => { watch.observer.disconnect(); window.__domWatches.delete(id); };
+    (function check() {
+        const now = performance.now();
+        if (watch.last !== null && now - watch.last >= quiet) return stop(), resolve();
+        if (now - started >= timeout) {
+            stop();
+            return reject(new Error(watch.last === null ? `DOM did not change in ${timeout}ms`
+                                                        : `DOM did not settle in ${timeout}ms`));
+        }
+        setTimeout(check, 16);
+    })();
+})"""
+
+# Input values are properties, not attributes, so a MutationObserver does not see them: sample
+# the value every animation frame and resolve with it once it has not changed for `quiet` ms.
+_WAIT_FOR_VALUE_QUIET = """(element, {quiet, timeout}) => new Promise((resolve, reject) => {
+    const started = performance.now();
+    let value = element.value, changed = started;
+    (function check(now) {
+        if (element.value !== value) { value = element.value; changed = now; }
+        if (now - changed >= quiet) return resolve(value);
+        if (now - started >= timeout) return reject(new Error(`Value did not settle in ${timeout}ms`));
+        requestAnimationFrame(check);
+    })(started);
+})"""
+
+# Runs a table of (input, expected) cases against one numeric input in a single round trip:
+# each value is typed the way fill() + Tab would (value setter, input/change events, blur)
+# and the value the widget settles on is read back. Number inputs sanitize non-numeric text
+# to "", that is reported as accepted=false, just like fill() refusing to type it.
+_RUN_NUMERIC_CASES = """async (element, {cases, quiet, timeout}) => {
+    const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+    const settle = () => new Promise((resolve, reject) => {
+        const started = performance.now();
+        let value = element.value, changed = started;
+        (function check(now) {
+            if (element.value !== value) { value = element.value; changed = now; }
+            if (now - changed >= quiet) return resolve(value);
+            if (now - started >= timeout) return reject(new Error(`Value did not settle in ${timeout}ms`));
+            requestAnimationFrame(check);
+        })(started);
+    });
+    const results = [];
+    for (const value of cases) {
+        const previous = element.value;
+        element.focus();
+        setValue.call(element, value);
+        if (value !== '' && element.value === '') {
+            // refused like fill() refuses it: the field keeps its value and sees no events
+            setValue.call(element, previous);
+            results.push({accepted: false, actual: previous});
+            continue;
+        }
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+        element.blur();
+        results.push({accepted: true, actual: await settle()});
+    }
+    return results;
+}"""
+
+
+def _parse_int(value: str) -> t.Union[int, str, None]:
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+class NumericCase(t.NamedTuple):
+    value: str
+    # value the field settles on, None when the input must refuse the text
+    expected: t.Optional[int]
+    description: str = ""
+
+
+class NumericCaseResult(t.NamedTuple):
+    case: NumericCase
+    accepted: bool
+    # the settled value, the raw text when it is not an integer
+    actual: t.Union[int, str, None]
+
+    @property
+    def passed(self) -> bool:
+        if self.case.expected is None:
+            return not self.accepted
+        return self.accepted and self.actual == self.case.expected
+
 
 class BasePage:
-    def __init__(self, page: Page, base_url: str = BASE_URL):
+    def __init__(self, page: "Page", base_url: str = BASE_URL, network: t.Optional[NetworkPolicy] = None):
         self.page = page
         self.base_url = base_url
+        self.timings: dict[str, float] = {}
+        self.navigations: list[NavigationReport] = []
+        self._network = NetworkLayer(page, network) if network else None
+        self._network_installed = False
+
+    @staticmethod
+    def expect(locator: "Locator") -> "LocatorAssertions":
+        """playwright's expect(), imported on first use."""
+        from playwright.sync_api import expect
+
+        return expect(locator)
 
     def navigate(self, path: str):
         full_url = f"{self.base_url}{path}"
-        self.page.goto(full_url, wait_until="networkidle")
\ No newline at end of file
+        if self._network is None:
+            self.page.goto(full_url, wait_until="networkidle")
+            return
+        if not self._network_installed:
+            self._network.install()
+            self._network_installed = True
+        report = self._network.measure(full_url, lambda: self.page.goto(full_url, wait_until="networkidle"))
+        self.navigations.append(report)
+        self.timings[f"navigate {path}"] = report.seconds
+
+    def open(self, path: str):
+        """Navigates to path unless the page is already there, e.g. handed out warm by a ContextPool."""
+        if self.page.url.split("#")[0].rstrip("/") != f"{self.base_url}{path}".rstrip("/"):
+            self.navigate(path)
+
+    @contextmanager
+    def dom_change(self, locator: "Locator", quiet_ms: int = DEFAULT_QUIET_MS,
+                   timeout: int = DEFAULT_SETTLE_TIMEOUT_MS) -> t.Iterator[None]:
+        """Waits for the re-render the block causes in the elements matched by locator: the
+        observer is armed before the block, and after it the elements must change and then
+        stay unchanged for quiet_ms. Only wrap actions that are expected to re-render them."""
+        locator.first.wait_for(state="attached", timeout=timeout)
+        watch_id = locator.evaluate_all(_WATCH_DOM)
+        yield
+        self.page.evaluate(_WAIT_FOR_DOM_CHANGE, {"id": watch_id, "quiet": quiet_ms, "timeout": timeout})
+
+    def wait_for_value_stable(self, locator: "Locator", quiet_ms: int = DEFAULT_QUIET_MS,
+                              timeout: int = DEFAULT_SETTLE_TIMEOUT_MS) -> str:
+        """Waits until the input's value stops changing (debounce, clamping) and returns it."""
+        return locator.evaluate(_WAIT_FOR_VALUE_QUIET, {"quiet": quiet_ms, "timeout": timeout})
+
+    def run_numeric_cases(self, locator: "Locator", cases: t.Sequence[NumericCase], quiet_ms: int = 32,
+                          timeout: int = DEFAULT_SETTLE_TIMEOUT_MS) -> list[NumericCaseResult]:
+        """Enters every case into a numeric input in one in-page script, in order, and returns
+        what the input settled on for each of them."""
+        raw = locator.evaluate(
+            _RUN_NUMERIC_CASES, {"cases": [case.value for case in cases], "quiet": quiet_ms, "timeout": timeout}
+        )
+        return [NumericCaseResult(case, result["accepted"], _parse_int(result["actual"]))
+                for case, result in zip(cases, raw)]
+
+    @contextmanager
+    def time_budget(self, name: str, seconds: float, enforce: bool = True) -> t.Iterator[None]:
+        """Records how long the block took in self.timings and, when enforce is set, fails it
+        if it ran over budget."""
+        started = time.perf_counter()
+        yield
+        elapsed = self.timings[name] = time.perf_counter() - started
+        if enforce:
+            assert elapsed <= seconds, f"{name} took {elapsed:.2f}s, budget is {seconds}s"
@@ -1,42 +1,74 @@
+import json
+import typing as t
+
 import allure
-import pytest
-from playwright.sync_api import Page, expect, Error
 
-from pages.base_page import BasePage
-from utils.logging_config import setup_logger
+from pages.base_page import BasePage, NumericCase
+from pages.network import NetworkPolicy
+from utils.logging_config import get_logger
+
+if t.TYPE_CHECKING:
+    from playwright.sync_api import Locator, Page
+
+logger = get_logger(__name__)
+
+# One round trip for all card headers: their spans are [title, price, ...], the price is parsed
+# the same way as before (currency sign dropped, digits kept)
+_EXTRACT_CARDS = """headers => headers.map(header => {
+    const spans = [...header.querySelectorAll('span')].map(span => span.innerText.trim());
+    const priceText = spans[1] ?? '';
+    const digits = priceText.slice(1).replace(/\\D/g, '');
+    return {title: spans[0] ?? '', price_text: priceText, price: digits ? Number(digits) : null,
+            visible: header.getClientRects().length > 0};
+})"""
+
+
+class ServerCard(t.NamedTuple):
+    title: str
+    price_text: str
+    price: t.Optional[int]
+    visible: bool
 
-logger = setup_logger(__name__)
 
 class HostingPage(BasePage):
-    def __init__(self, page: Page):
-        super().__init__(page)
+    def __init__(self, page: "Page", network: t.Optional[NetworkPolicy] = None):
+        super().__init__(page, network=network)
         self._server_type = lambda value: page.locator(f'gcore-server-configurator input[type="radio"][value="{value}"]')
         self._currency_option = lambda value: page.locator(f'gcore-switcher-currency input[type="radio"][value="{value}"]')
         self._filter_price_btn = page.get_by_role("button", name="Price")
         self._min_price_input = page.locator('gcore-range-multi-slider input[type="number"]').first
         self._max_price_input = page.locator('gcore-range-multi-slider input[type="number"]').last
         self._cards_list = page.locator('gcore-price-card')
+        self._card_headers = self._cards_list.locator('div.gc-price-card-header')
 
     @allure.step("Select server type: {server_type}")
     def select_server_type(self, server_type: str):
-        self._server_type(server_type).click()
+        self._switch(self._server_type(server_type))
 
     @allure.step("Select currency type: {currency_type}")
     def select_currency_type(self, currency_type: str):
-        self._currency_option(currency_type).click()
+        self._switch(self._currency_option(currency_type))
+
+    def _switch(self, option: "Locator"):
+        # switching server type or currency re-renders the cards, wait for that instead of a fixed
+        # pause; the option that is already selected changes nothing, so there is nothing to wait for
+        if option.is_checked():
+            option.click()
+            return
+        with self.dom_change(self._cards_list):
+            option.click()
 
     def check_server_switcher(self, expected_value: str):
         selected_server = self._server_type(expected_value)
-        expect(selected_server).to_be_checked()
+        self.expect(selected_server).to_be_checked()
 
     @allure.step("Check currency switcher is set to {0}")
     def check_currency_switcher(self, expected_value: str):
         selected_currency = self._currency_option(expected_value)
-        expect(selected_currency).to_be_checked()
+        self.expect(selected_currency).to_be_checked()
 
     @allure.step("Click price filter")
     def click_price_filter(self):
-        self.page.wait_for_timeout(1000)
         logger.info("Clicking price filter button")
         self._filter_price_btn.click()
         self.page.wait_for_selector('gcore-range-multi-slider', state='visible')
@@ -61,7 +93,7 @@ class HostingPage(BasePage):
         self._max_price_input.fill(str(max_price))
 
 
-        expect(self._cards_list.locator(':visible')).not_to_have_count(initial_card_count, timeout=5000)
+        self.expect(self._cards_list.locator(':visible')).not_to_have_count(initial_card_count, timeout=5000)
 
     @allure.step("Check servers price range: min={min_price}, max={max_price}")
     def check_the_servers_price_range(self, min_price: int, max_price: int):
@@ -73,30 +105,55 @@ class HostingPage(BasePage):
         """
         logger.info("Checking server prices in range")
 
-        card_count = self._cards_list.count()
-        logger.debug(f"Found {card_count} price cards")
-        assert card_count > 0, "No cards found after setting price range"
-
-        cards = self._cards_list.locator('div.gc-price-card-header').all()
-        for card in cards:
-            price_text = card.locator('span').nth(1).inner_text()
-            logger.debug(f"Price text: {price_text}")
-            price_cleaned = ''.join(char for char in price_text[1:] if char.isdigit())
-            price = int(price_cleaned)
-            assert min_price <= price <= max_price, f"Price {price} is out of range [{min_price}, {max_price}]"
-
-    def validate_numeric_input_behavior(self, input_locator, paired_input_locator=None, is_min=True):
+        cards = self.get_server_cards()
+        assert cards, "No cards found after setting price range"
+        out_of_range = [card for card in cards if card.price is None or not min_price <= card.price <= max_price]
+        assert not out_of_range, \
+            f"Prices out of range [{min_price}, {max_price}]: {[card.price_text for card in out_of_range]}"
+
+    def get_server_cards(self) -> list[ServerCard]:
+        """Title and price of every server card, read in a single evaluate_all call."""
+        cards = [ServerCard(**card) for card in self._card_headers.evaluate_all(_EXTRACT_CARDS)]
+        logger.debug(f"Extracted {len(cards)} price cards")
+        return cards
+
+    @staticmethod
+    def numeric_input_cases(default_value: int, paired_value: t.Optional[int] = None,
+                            is_min: bool = True) -> list[NumericCase]:
         """
-        Performs comprehensive validation of a numeric input field:
-        - Keeps default if input is lower than default or negative
-        - Ignores letters and special characters
+        Edge values of a price input and what the field is expected to settle on, the same
+        checks the per-case flow made:
+        - Keeps default if input is lower than default (min) / greater than default (max) or negative
+        - Refuses letters and special characters
         - For min fields: Adjusts to (max_value - 1) if input exceeds max_value
         - For max fields: Adjusts to (min_value + 1) if input is below min_value
+        """
+        step = -1 if is_min else 1
+        cases = [
+            NumericCase(str(default_value + step), default_value, "beyond default"),
+            NumericCase("-100", default_value, "negative"),
+            NumericCase("abc", None, "letters"),
+            NumericCase("@#$", None, "special characters"),
+        ]
+        if paired_value is not None:
+            # crossing the paired value goes last, it is where the original flow left the field
+            cases.append(NumericCase(str(paired_value - 10 * step), paired_value + step, "crosses paired value"))
+        unique: dict[str, NumericCase] = {}
+        for case in cases:
+            unique.setdefault(case.value, case)
+        return list(unique.values())
+
+    def validate_numeric_input_behavior(self, input_locator, paired_input_locator=None, is_min=True,
+                                        cases: t.Optional[t.Sequence[NumericCase]] = None):
+        """
+        Performs comprehensive validation of a numeric input field, see numeric_input_cases.
+        All cases run in one in-page script and every failing case is reported at once.
 
         Args:
             input_locator: Locator of the input field to validate
             paired_input_locator: Locator of paired field (max for min, min for max)
             is_min: Boolean indicating if this is a min field (True) or max field (False)
+            cases: Cases to run instead of numeric_input_cases
         """
         logger.info(f"Starting validation of {'min' if is_min else 'max'} input behavior")
 
@@ -108,53 +165,21 @@ class HostingPage(BasePage):
 
         logger.info(f"Default value: {default_value}, Paired value: {paired_value}")
 
-        # Test: Input less than default (for min) or greater than default (for max)
-        test_value = default_value - 1 if is_min else default_value + 1
-        input_locator.fill(str(test_value))
-        self.page.wait_for_timeout(500)
-        self.page.keyboard.press("Tab")
-        actual_value = int(input_locator.input_value())
-
-        expected_value = default_value
-        assert_message = f"Input {'below' if is_min else 'above'} default was not reset to default: {actual_value}"
-        assert actual_value == expected_value, assert_message
-
-        # Test: Input negative number
-        input_locator.fill("-100")
-        self.page.wait_for_timeout(500)
-        self.page.keyboard.press("Tab")
-        actual_value = int(input_locator.input_value())
-        assert actual_value == default_value, f"Negative value not reset to default: {actual_value}"
-
-        # Test: Input letters
-        with pytest.raises(Error) as exc_info:
-            input_locator.fill("abc")
-            self.page.keyboard.press("Tab")
-        assert "Cannot type text into input[type=number]" in str(exc_info.value), \
-            f"Unexpected error: {exc_info.value}"
-
-        # Test: Input special characters
-        with pytest.raises(Error) as exc_info:
-            input_locator.fill("@#$")
-            self.page.keyboard.press("Tab")
-        assert "Cannot type text into input[type=number]" in str(exc_info.value), \
-            f"Unexpected error: {exc_info.value}"
-
-        if paired_input_locator and paired_value is not None:
-            if is_min:
-                test_value = paired_value + 10
-                expected_value = paired_value - 1
-                assert_message = f"Min input greater than max not set to max-1: {{actual}} vs {expected_value}"
-            else:
-                test_value = paired_value - 10
-                expected_value = paired_value + 1
-                assert_message = f"Max input less than min not set to min+1: {{actual}} vs {expected_value}"
-
-            input_locator.fill(str(test_value))
-            self.page.wait_for_timeout(500)
-            self.page.keyboard.press("Tab")
-            actual_value = int(input_locator.input_value())
-            assert actual_value == expected_value, assert_message.format(actual=actual_value)
+        if cases is None:
+            cases = self.numeric_input_cases(default_value, paired_value, is_min)
+        results = self.run_numeric_cases(input_locator, cases)
+        allure.attach(
+            json.dumps([{**result.case._asdict(), "accepted": result.accepted, "actual": result.actual,
+                         "passed": result.passed} for result in results], indent=2),
+            name=f"{'Min' if is_min else 'Max'} input cases", attachment_type=allure.attachment_type.JSON,
+        )
+        failed = [result for result in results if not result.passed]
+        assert not failed, "Numeric input cases failed:\n" + "\n".join(
+            f"{result.case.description} {result.case.value!r}: expected "
+            f"{'refusal' if result.case.expected is None else result.case.expected}, "
+            f"got {result.actual if result.accepted else 'refusal'}"
+            for result in failed
+        )
 
     @allure.step("Validate minimum price input behavior")
     def validate_min_price_input_behavior(self):
@@ -0,0 +1,229 @@
+"""Request routing for page objects.
+
+A ``NetworkPolicy`` blocks resource types and domains a test never looks at (trackers,
+media), serves static assets from an on-disk cache filled on the first run, or replays a
+recorded HAR so the page works fully offline. Cached assets older than ``cache_max_age`` are
+revalidated with the server (ETag / Last-Modified) before they are served again.
+``BasePage.navigate`` installs the policy on the page once and keeps a ``NavigationReport``
+per navigation, compared against the last navigation to the same URL that fetched every
+asset live.
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import typing as t
+from dataclasses import dataclass, field
+from pathlib import Path
+from urllib.parse import urlsplit
+
+if t.TYPE_CHECKING:
+    from playwright.sync_api import Page, Route
+
+HAR_MODES = ("off", "record", "replay")
+DEFAULT_BLOCKED_TYPES = ("media",)
+DEFAULT_BLOCKED_DOMAINS = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "facebook.net",
+    "hotjar.com",
+    "clarity.ms",
+    "mc.yandex.ru",
+    "licdn.com",
+    "hs-analytics.net",
+)
+CACHED_TYPES = ("script", "stylesheet", "image", "font")
+DEFAULT_CACHE_MAX_AGE = 24 * 60 * 60
+# the body playwright hands over is already decoded and the length is recomputed on fulfill
+_DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+
+@dataclass
+class NetworkPolicy:
+    blocked_types: tuple[str, ...] = DEFAULT_BLOCKED_TYPES
+    blocked_domains: tuple[str, ...] = DEFAULT_BLOCKED_DOMAINS
+    cache_dir: t.Optional[str] = None
+    cached_types: tuple[str, ...] = CACHED_TYPES
+    cache_max_age: float = DEFAULT_CACHE_MAX_AGE
+    har_path: t.Optional[str] = None
+    har_mode: str = "off"
+
+    def __post_init__(self) -> None:
+        if self.har_mode not in HAR_MODES:
+            raise ValueError(f"Unknown HAR mode {self.har_mode!r}, expected one of {HAR_MODES}")
+        if self.har_mode != "off" and not self.har_path:
+            raise ValueError(f"HAR mode {self.har_mode!r} needs har_path")
+
+    def is_blocked(self, resource_type: str, url: str) -> bool:
+        if resource_type in self.blocked_types:
+            return True
+        host = urlsplit(url).hostname or ""
+        return any(host == domain or host.endswith(f".{domain}") for domain in self.blocked_domains)
+
+
+class NavigationReport(t.NamedTuple):
+    url: str
+    seconds: float
+    blocked: int
+    cache_hits: int
+    cache_misses: int
+    # expired cache entries the server confirmed unchanged (304)
+    revalidated: int
+    # the last navigation to url that fetched every asset live (blocking still applied)
+    baseline_seconds: t.Optional[float]
+
+    @property
+    def saved_seconds(self) -> t.Optional[float]:
+        if self.baseline_seconds is None:
+            return None
+        return self.baseline_seconds - self.seconds
+
+
+@dataclass
+class _Counters:
+    blocked: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    revalidated: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **deltas) -> None:
+        with self.lock:
+            for name, delta in deltas.items():
+                setattr(self, name, getattr(self, name) + delta)
+
+    def snapshot(self) -> tuple[int, int, int, int]:
+        with self.lock:
+            return self.blocked, self.cache_hits, self.cache_misses, self.revalidated
+
+
+class AssetCache:
+    """Static GET responses on disk, one ``<sha1>.json`` (status, headers, store time) plus
+    ``<sha1>.body`` per URL, and the live navigation baselines as ``<sha1>.navigation.json``."""
+
+    def __init__(self, directory: str, max_age: float = DEFAULT_CACHE_MAX_AGE) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha1(url.encode()).hexdigest()
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        key = self._key(url)
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def load(self, url: str) -> t.Optional[tuple[dict, bytes]]:
+        meta_path, body_path = self._paths(url)
+        try:
+            return json.loads(meta_path.read_text()), body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self, meta: dict) -> bool:
+        return time.time() - meta.get("stored_at", 0.0) < self.max_age
+
+    def store(self, url: str, status: int, headers: dict, body: bytes) -> None:
+        meta_path, body_path = self._paths(url)
+        body_path.write_bytes(body)
+        # the meta file is written last, so a half-written entry is never loaded
+        self._write_meta(meta_path, {"url": url, "status": status, "headers": headers})
+
+    def touch(self, url: str, meta: dict) -> None:
+        """Restarts the max age of an entry the server confirmed unchanged."""
+        self._write_meta(self._paths(url)[0], meta)
+
+    @staticmethod
+    def _write_meta(meta_path: Path, meta: dict) -> None:
+        meta_path.write_text(json.dumps({**meta, "stored_at": time.time()}))
+
+    def load_baseline(self, url: str) -> t.Optional[float]:
+        try:
+            return json.loads((self.directory / f"{self._key(url)}.navigation.json").read_text())["seconds"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def store_baseline(self, url: str, seconds: float) -> None:
+        path = self.directory / f"{self._key(url)}.navigation.json"
+        # written aside and renamed, parallel workers share the directory
+        partial = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        partial.write_text(json.dumps({"url": url, "seconds": seconds}))
+        partial.replace(path)
+
+
+class NetworkLayer:
+    """Routes of one page for a ``NetworkPolicy`` plus the counters behind the reports."""
+
+    def __init__(self, page: "Page", policy: NetworkPolicy) -> None:
+        self.page = page
+        self.policy = policy
+        self.cache = AssetCache(policy.cache_dir, policy.cache_max_age) if policy.cache_dir else None
+        self.counters = _Counters()
+
+    def install(self) -> None:
+        if self.policy.har_mode != "off":
+            self.page.route_from_har(
+                self.policy.har_path,
+                not_found="abort" if self.policy.har_mode == "replay" else "fallback",
+                update=self.policy.har_mode == "record",
+            )
+        # the HAR has to see every request to replay the page offline later: recording runs
+        # unfiltered, and in replay the HAR already answers everything
+        if self.policy.har_mode == "off":
+            self.page.route("**/*", self._handle)
+
+    def _handle(self, route: "Route") -> None:
+        request = route.request
+        if self.policy.is_blocked(request.resource_type, request.url):
+            self.counters.add(blocked=1)
+            route.abort("blockedbyclient")
+            return
+        if self.cache is None or request.method != "GET" or request.resource_type not in self.policy.cached_types:
+            route.fallback()
+            return
+        cached = self.cache.load(request.url)
+        if cached is not None and self.cache.is_fresh(cached[0]):
+            meta, body = cached
+            self.counters.add(cache_hits=1)
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+        validators = _validators(cached[0]) if cached is not None else {}
+        response = route.fetch(headers={**request.headers, **validators}) if validators else route.fetch()
+        if cached is not None and response.status == 304:
+            meta, body = cached
+            self.cache.touch(request.url, meta)
+            self.counters.add(revalidated=1)
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+        body = response.body()
+        if response.status == 200:
+            headers = {name: value for name, value in response.headers.items() if name not in _DROPPED_HEADERS}
+            self.cache.store(request.url, response.status, headers, body)
+        self.counters.add(cache_misses=1)
+        route.fulfill(response=response, body=body)
+
+    def measure(self, url: str, navigate: t.Callable[[], t.Any]) -> NavigationReport:
+        before = self.counters.snapshot()
+        started = time.perf_counter()
+        navigate()
+        seconds = time.perf_counter() - started
+        blocked, hits, misses, revalidated = (now - then for now, then in zip(self.counters.snapshot(), before))
+        baseline = None
+        if self.cache is not None:
+            if misses and not hits and not revalidated:
+                self.cache.store_baseline(url, seconds)
+            baseline = self.cache.load_baseline(url)
+        return NavigationReport(url, seconds, blocked, hits, misses, revalidated, baseline)
+
+
+def _validators(meta: dict) -> dict[str, str]:
+    """Conditional request headers for revalidating a cached response."""
+    headers = {name.lower(): value for name, value in meta["headers"].items()}
+    validators = {}
+    if "etag" in headers:
+        validators["if-none-match"] = headers["etag"]
+    if "last-modified" in headers:
+        validators["if-modified-since"] = headers["last-modified"]
+    return validators
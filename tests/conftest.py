@@ -0,0 +1,232 @@
+import functools
+import json
+import typing as t
+
+import allure
+import pytest
+
+from utils.logging_config import configure_logging, resolve_test_logs, set_current_test
+
+# Collection imports this module for every run, so whatever only some tests need (requests,
+# playwright, the local server, the UI helpers) is imported inside the fixtures that use it.
+# The UI options therefore take plain strings and are checked when a UI fixture reads them.
+if t.TYPE_CHECKING:
+    from api.tracing import TimingRecorder
+    from pages.network import NetworkPolicy
+    from utils.context_pool import ContextPool
+    from utils.reqres_server import ReqresServer
+    from utils.trace_policy import ContextTracer
+
+REMOTE_REQRES_URL = "https://reqres.in"
+API_TIMINGS_KEY = pytest.StashKey["TimingRecorder"]()
+PHASE_REPORTS_KEY = pytest.StashKey[dict[str, pytest.TestReport]]()
+# node ids of tests with a failed setup/call/teardown phase, until their logs are resolved
+_failed_tests: set[str] = set()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reqres",
+        choices=("remote", "local"),
+        default="remote",
+        help="Run API tests against the public reqres.in or the bundled local stand-in server"
+    )
+    parser.addoption("--reqres-latency", type=float, default=0.0,
+                     help="Latency added by the local reqres server, seconds")
+    parser.addoption("--reqres-error-rate", type=float, default=0.0,
+                     help="Share of requests the local reqres server answers with 503")
+    parser.addoption("--context-pool-size", type=int,
+                     help="Warm browser contexts kept per worker for the UI tests (default 2)")
+    parser.addoption("--ui-network", choices=("live", "filtered", "record", "replay"), default="live",
+                     help="UI tests: load everything (live, default), block trackers/media and cache static "
+                          "assets (filtered), record everything into a HAR (record) or serve the page from it "
+                          "offline (replay)")
+    parser.addoption("--ui-har", default="tests/data/hosting.har", help="HAR file for --ui-network record/replay")
+    parser.addoption("--ui-asset-cache", default=".cache/assets", help="On-disk static asset cache of --ui-network")
+    parser.addoption("--ui-asset-max-age", type=float,
+                     help="Seconds a cached asset is served before it is revalidated with the server (default a day)")
+    parser.addoption("--hosting-scenario", action="append", default=[],
+                     help="server_type:currency:min:max scenario of the hosting page test, repeatable "
+                          "(see utils.ui_runner for running a matrix of them in parallel)")
+    parser.addoption("--ui-step-budgets", action="store_true",
+                     help="Fail UI steps that run over their time budget, e.g. against --ui-network replay; "
+                          "otherwise step timings are only recorded")
+    parser.addoption("--ui-trace", default="on-failure",
+                     help="Playwright tracing of the UI tests: off, on-failure (keep failed tests only), "
+                          "sampled or always")
+    parser.addoption("--ui-trace-sample-rate", type=float, default=0.1, help="Share of tests traced by --ui-trace sampled")
+    parser.addoption("--ui-trace-dir", help="Where kept traces are written (default test-results/traces)")
+    parser.addoption("--ui-trace-compress", action="store_true", help="Recompress kept traces with maximum deflate")
+    parser.addoption("--ui-trace-snapshots", action="store_true", default=None,
+                     help="Record screenshots and DOM snapshots with --ui-trace on-failure too (costly)")
+    parser.addoption("--ui-trace-attach", action="store_true", help="Attach kept traces to the Allure report")
+    parser.addoption("--worker-id", help="Worker id for log files and trace names of one of several parallel "
+                                         "processes (set by utils.ui_runner), defaults to the pytest-xdist one")
+    parser.addoption("--run-slow", action="store_true", help="Also run the tests marked slow")
+    parser.addoption("--log-structured", action="store_true",
+                     help="Write JSON Lines logs with test and worker ids, one file per xdist worker")
+    parser.addoption("--log-failed-only", action="store_true",
+                     help="Buffer each test's log records in memory and write them only if the test fails")
+
+
+def pytest_configure(config):
+    configure_logging(structured=config.getoption("--log-structured"),
+                      failed_only=config.getoption("--log-failed-only"),
+                      worker_id=config.getoption("--worker-id"))
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow, run with --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+def pytest_runtest_logstart(nodeid, location):
+    set_current_test(nodeid)
+
+
+def pytest_runtest_logreport(report):
+    if report.failed:
+        _failed_tests.add(report.nodeid)
+    if report.when == "teardown":
+        resolve_test_logs(report.nodeid, keep=report.nodeid in _failed_tests)
+        _failed_tests.discard(report.nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    set_current_test(None)
+
+
+@pytest.hookimpl(wrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call):
+    # keeps the setup/call reports on the item, so fixtures can see in teardown whether the test failed
+    report = yield
+    item.stash.setdefault(PHASE_REPORTS_KEY, {})[report.when] = report
+    return report
+
+
+@pytest.fixture
+def node_failed(request) -> t.Callable[[], bool]:
+    """Call in teardown: whether the setup or the call phase of the current test failed."""
+    return lambda: any(report.failed for report in request.node.stash.get(PHASE_REPORTS_KEY, {}).values())
+
+
+@pytest.fixture(scope="session")
+def reqres_server() -> t.Iterator["ReqresServer"]:
+    """Bundled reqres.in stand-in, started once per session."""
+    from utils.reqres_server import ReqresServer
+
+    with ReqresServer() as server:
+        yield server
+
+
+@pytest.fixture
+def stub(reqres_server) -> t.Iterator[tuple[str, "ReqresServer"]]:
+    """Local reqres server in a clean state, yields its base URL and the server."""
+    reqres_server.reset()
+    yield reqres_server.base_url, reqres_server
+
+
+@pytest.fixture
+def reqres_base_url(request) -> str:
+    if request.config.getoption("--reqres") == "remote":
+        return REMOTE_REQRES_URL
+    server = request.getfixturevalue("reqres_server")
+    server.reset()
+    server.latency = request.config.getoption("--reqres-latency")
+    server.error_rate = request.config.getoption("--reqres-error-rate")
+    return server.base_url
+
+
+def ui_network_policy(config) -> t.Optional["NetworkPolicy"]:
+    mode = config.getoption("--ui-network")
+    if mode == "live":
+        return None
+    from pages.network import DEFAULT_CACHE_MAX_AGE, NetworkPolicy
+
+    max_age = config.getoption("--ui-asset-max-age")
+    return NetworkPolicy(
+        cache_dir=str(config.rootpath / config.getoption("--ui-asset-cache")),
+        cache_max_age=DEFAULT_CACHE_MAX_AGE if max_age is None else max_age,
+        har_path=str(config.rootpath / config.getoption("--ui-har")) if mode in ("record", "replay") else None,
+        har_mode=mode if mode in ("record", "replay") else "off",
+    )
+
+
+@pytest.fixture(scope="session")
+def hosting_pool(request, browser, browser_context_args) -> t.Iterator["ContextPool"]:
+    """Warm contexts of this worker with HostingPage already on /hosting, reset between tests.
+
+    The pool opens its own contexts with browser_context_args, so pytest-playwright's
+    page/context fixtures are not used and its --screenshot, --video and --output options
+    do nothing for the tests on these pages; use --ui-trace for failure artifacts instead.
+    A reset clears cookies, storage, permissions and extra tabs but not the HTTP cache,
+    service workers or the page's in-memory state before the next acquire() re-navigates.
+    """
+    from pages.hosting_page import HostingPage
+    from utils.context_pool import DEFAULT_POOL_SIZE, ContextPool
+
+    factory = functools.partial(HostingPage, network=ui_network_policy(request.config))
+    size = request.config.getoption("--context-pool-size") or DEFAULT_POOL_SIZE
+    with ContextPool(browser, factory, "/hosting", size=size, context_args=browser_context_args) as pool:
+        yield pool
+
+
+@pytest.fixture(scope="session")
+def ui_tracer(request) -> "ContextTracer":
+    from utils.trace_policy import DEFAULT_TRACE_DIR, ContextTracer, TracePolicy
+
+    config = request.config
+    try:
+        policy = TracePolicy(
+            mode=config.getoption("--ui-trace"),
+            sample_rate=config.getoption("--ui-trace-sample-rate"),
+            output_dir=str(config.rootpath / (config.getoption("--ui-trace-dir") or DEFAULT_TRACE_DIR)),
+            compress=config.getoption("--ui-trace-compress"),
+            snapshots=config.getoption("--ui-trace-snapshots"),
+        )
+    except ValueError as e:
+        raise pytest.UsageError(str(e)) from None
+    return ContextTracer(policy)
+
+
+@pytest.fixture(scope="session")
+def api_timings(request) -> t.Iterator["TimingRecorder"]:
+    """Per-phase request timings of every client installed on it, summarised at session end."""
+    from api.tracing import TimingRecorder
+
+    recorder = TimingRecorder()
+    request.config.stash[API_TIMINGS_KEY] = recorder
+    yield recorder
+    if recorder.sequence:
+        allure.attach(json.dumps(recorder.summary(), indent=2), name="API timings summary",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+@pytest.fixture(autouse=True)
+def attach_api_timings(request) -> t.Iterator[None]:
+    if "api_timings" not in request.fixturenames:
+        yield
+        return
+    recorder = request.getfixturevalue("api_timings")
+    sequence = recorder.sequence
+    yield
+    timings = recorder.since(sequence)
+    if timings:
+        allure.attach(json.dumps([timing._asdict() for timing in timings], indent=2), name="API timings",
+                      attachment_type=allure.attachment_type.JSON)
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    recorder = config.stash.get(API_TIMINGS_KEY, None)
+    if recorder is None or not recorder.sequence:
+        return
+    terminalreporter.section("API timings (ms)")
+    for endpoint, summary in recorder.summary().items():
+        phases = ", ".join(f"{phase} {stats['mean']}/{stats['max']}" for phase, stats in summary["phases_ms"].items())
+        terminalreporter.write_line(
+            f"{endpoint}: {summary['requests']} requests, {summary['errors']} errors; mean/max {phases}"
+        )
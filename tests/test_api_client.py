@@ -0,0 +1,97 @@
+import allure
+import pytest
+from pydantic import ValidationError
+
+from api.endpoints import ReqresIn
+from models.response import Data, UsersList, CreatedUser, UpdatedUser, User, validate_json
+
+
+@pytest.fixture
+def local_reqresin(stub):
+    base_url, _ = stub
+    return ReqresIn(base_url=base_url, api_key="local")
+
+
+@allure.feature("Users API")
+@allure.story("API client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_templated_endpoints_roundtrip(local_reqresin, stub):
+    _, state = stub
+    users = local_reqresin.users
+
+    assert UsersList(**users.get_users(page=2)[1]).page == 2
+    assert User(**users.get_user(user_id=3)[1]).data.id == 3
+    assert CreatedUser(**users.add_user(body={"name": "neo", "job": "the one"})[1]).name == "neo"
+    assert UpdatedUser(**users.edit_user(user_id=3, body={"name": "neo", "job": "hacker"})[1]).job == "hacker"
+    users.delete_user(user_id=3)
+    assert 3 not in state.users
+
+
+@allure.feature("Users API")
+@allure.story("API client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_users_facade_and_templates_are_reused(local_reqresin):
+    assert local_reqresin.users is local_reqresin.users
+    api_client = local_reqresin.api_client
+    assert api_client.template("GET", "/api/users") is api_client.template("GET", "/api/users")
+
+
+@allure.feature("Users API")
+@allure.story("API client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_header_override_does_not_leak(local_reqresin):
+    api_client = local_reqresin.api_client
+    template = local_reqresin.users._get_user
+
+    api_client.send(template, path="/api/users/1", headers={"Authorization": "APIKey other"})
+
+    assert template.headers["Authorization"] == "APIKey local"
+    assert api_client.headers["Authorization"] == "APIKey local"
+
+
+@allure.feature("Users API")
+@allure.story("API client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_templates_send_current_session_cookies(local_reqresin):
+    api_client = local_reqresin.api_client
+    users = local_reqresin.users
+    sent = []
+    api_client.add_hook("pre_request", lambda trace: sent.append(trace.request.headers.get("Cookie")))
+
+    users.get_user(2)
+    api_client.session.cookies.set("sid", "abc")
+    users.get_user(2)
+    api_client.request("GET", "/api/users/2")
+    api_client.session.cookies.clear()
+    users.get_user(2)
+
+    assert sent == [None, "sid=abc", "sid=abc", None]
+
+
+@allure.feature("Users API")
+@allure.story("Response validation")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_get_users_validates_straight_from_bytes(local_reqresin):
+    status, users = local_reqresin.users.get_users(page=1, model=UsersList)
+    _, trusted_users = local_reqresin.users.get_users(page=1, model=UsersList, trusted=True)
+
+    assert status == 200
+    assert isinstance(users, UsersList) and isinstance(trusted_users, UsersList)
+    assert users.model_dump() == trusted_users.model_dump()
+
+
+@allure.feature("Users API")
+@allure.story("Response validation")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_trusted_mode_skips_email_validation():
+    raw = '{"id": 1, "email": "not-an-email", "first_name": "a", "last_name": "b", "avatar": "x"}'
+
+    with pytest.raises(ValidationError):
+        validate_json(Data, raw)
+    assert validate_json(Data, raw, trusted=True).email == "not-an-email"
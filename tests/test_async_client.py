@@ -0,0 +1,59 @@
+import asyncio
+import time
+
+import allure
+import pytest
+
+from models.response import UsersList, CreatedUser, UpdatedUser, User
+
+
+@allure.feature("Users API")
+@allure.story("Async client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_async_crud_roundtrip(stub):
+    # imported by the tests, so collecting this module does not load httpx
+    from api.async_endpoints import AsyncReqresIn
+
+    base_url, state = stub
+
+    async def scenario():
+        async with AsyncReqresIn(base_url=base_url, api_key="") as reqresin:
+            users = await reqresin.users.get_users(page=1)
+            user = await reqresin.users.get_user(user_id=2)
+            created = await reqresin.users.add_user(body={"name": "morpheus", "job": "leader"})
+            updated = await reqresin.users.edit_user(user_id=2, body={"name": "morpheus", "job": "zion resident"})
+            await reqresin.users.delete_user(user_id=2)
+            return users, user, created, updated
+
+    users, user, created, updated = asyncio.run(scenario())
+
+    assert users[0] == 200 and UsersList(**users[1]).page == 1
+    assert user[0] == 200 and User(**user[1]).data.id == 2
+    assert created[0] == 201 and CreatedUser(**created[1]).id > 0
+    assert updated[0] == 200 and UpdatedUser(**updated[1]).job == "zion resident"
+    assert 2 not in state.users
+
+
+@allure.feature("Users API")
+@allure.story("Async client")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_async_requests_respect_concurrency_limit(stub):
+    from api.async_endpoints import AsyncReqresIn
+
+    base_url, state = stub
+    state.latency = 0.05
+    calls, concurrency = 40, 10
+
+    async def scenario():
+        async with AsyncReqresIn(base_url=base_url, api_key="", concurrency=concurrency) as reqresin:
+            return await asyncio.gather(*(reqresin.users.get_user(user_id=1) for _ in range(calls)))
+
+    started = time.perf_counter()
+    responses = asyncio.run(scenario())
+    elapsed = time.perf_counter() - started
+
+    assert all(status == 200 for status, _ in responses)
+    assert state.max_in_flight <= concurrency
+    assert elapsed < calls * state.latency / 2, f"Calls were not overlapped: {elapsed:.2f}s"
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import allure
+import pytest
+
+from benchmarks.harness import compare, load, measure, missing, run_cases
+
+BASELINE = Path(__file__).resolve().parent.parent / "benchmarks" / "baseline.json"
+# the committed baseline comes from one machine, the opt-in gate (--run-slow) only catches
+# gross regressions; python -m benchmarks --baseline ... --threshold gates tighter
+GATE_THRESHOLD = 1.0
+# under pytest every record also reaches its capture and live-log handlers on the root logger
+UNGATED_PREFIXES = ("logging.",)
+
+
+def report(**medians):
+    return {"results": {name: {"median_us": median} for name, median in medians.items()}}
+
+
+@allure.feature("Benchmarks")
+def test_compare_flags_slowdowns_over_threshold():
+    baseline = report(fast=10.0, steady=100.0, removed=1.0)
+    current = report(fast=13.0, steady=110.0, added=5.0)
+
+    assert compare(baseline, current, threshold=0.25) == ["fast: 10.0us -> 13.0us (+30%)"]
+
+
+@allure.feature("Benchmarks")
+def test_measure_calibrates_rounds():
+    calls = []
+
+    stats = measure(lambda: calls.append(None), rounds=3, min_time=0.001)
+
+    assert stats["rounds"] == 3
+    assert stats["calls_per_round"] > 1
+    assert stats["min_us"] <= stats["median_us"]
+
+
+@allure.feature("Benchmarks")
+def test_missing_lists_cases_the_baseline_cannot_gate():
+    from benchmarks import suite  # noqa: F401  registers the cases
+
+    baseline = {"results": {"api.request": {"median_us": 1.0}}, "skipped": {"api.template": "no server"}}
+
+    gaps = missing(baseline, ["api.*"])
+
+    assert gaps == {"api.template": "no server"}
+
+
+@allure.feature("Benchmarks")
+@pytest.mark.slow
+def test_no_regressions_against_baseline():
+    from benchmarks import suite  # noqa: F401  registers the cases, imports what they measure
+
+    baseline = load(str(BASELINE))
+    gaps = missing(baseline, ["*"])
+    if gaps:
+        listed = ", ".join(f"{name} ({reason})" for name, reason in gaps.items())
+        pytest.fail(f"benchmarks/baseline.json cannot gate {listed}; re-record it with "
+                    f"python -m benchmarks --save on a machine with Chromium", pytrace=False)
+
+    names = [name for name in baseline["results"] if not name.startswith(UNGATED_PREFIXES)]
+
+    current = run_cases(names, log=lambda line: None)
+
+    assert not compare(baseline, current, GATE_THRESHOLD)
@@ -0,0 +1,98 @@
+import allure
+import pytest
+from requests.exceptions import HTTPError
+
+from api.bulk import run_bulk
+from api.endpoints import ReqresIn, PaginationError
+from models.response import Data
+
+
+@pytest.fixture
+def local_reqresin(stub):
+    base_url, _ = stub
+    return ReqresIn(base_url=base_url, api_key="local")
+
+
+@allure.feature("Users API")
+@allure.story("Bulk operations")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_add_users_keeps_order_and_reports_errors_per_item(local_reqresin, stub):
+    _, state = stub
+    bodies = [{"name": f"user{i}", "job": "tester"} for i in range(50)]
+    bodies[10] = {}
+
+    results = local_reqresin.users.add_users(bodies, workers=8)
+
+    assert [result.item for result in results] == bodies
+    assert [result.ok for result in results].count(False) == 1
+    assert isinstance(results[10].error, HTTPError)
+    assert all(result.response[1]["name"] == result.item["name"] for result in results if result.ok)
+    assert len(state.users) == 12 + 49
+    assert state.max_in_flight <= 8
+
+
+@allure.feature("Users API")
+@allure.story("Bulk operations")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_edit_and_delete_users(local_reqresin, stub):
+    _, state = stub
+
+    edited = local_reqresin.users.edit_users((user_id, {"job": f"job{user_id}"}) for user_id in range(1, 7))
+    deleted = local_reqresin.users.delete_users(range(1, 7))
+
+    assert [result.response[1]["job"] for result in edited] == [f"job{i}" for i in range(1, 7)]
+    assert all(result.ok for result in deleted)
+    assert sorted(state.users) == list(range(7, 13))
+
+
+def test_run_bulk_bounds_items_read_ahead():
+    consumed = []
+
+    def items():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    def call(item):
+        # by the time item N runs, at most `window` items past the oldest unfinished one are queued
+        assert len(consumed) <= item + 1 + 4
+        return item * 2
+
+    results = run_bulk(call, items(), workers=2, window=4)
+
+    assert [result.response for result in results] == [i * 2 for i in range(100)]
+
+
+@allure.feature("Users API")
+@allure.story("Pagination")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_iter_users_streams_every_page(local_reqresin, stub):
+    _, state = stub
+    state.reset(total_users=100)
+
+    users = list(local_reqresin.users.iter_users(prefetch=3))
+
+    assert [user.id for user in users] == list(range(1, 101))
+    assert isinstance(users[0], Data)
+
+
+@allure.feature("Users API")
+@allure.story("Pagination")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_iter_users_can_resume_after_failed_page(local_reqresin, stub):
+    _, state = stub
+    state.reset(total_users=30)
+    seen = []
+
+    state.inject(None, 500)
+    with pytest.raises(PaginationError) as exc_info:
+        for user in local_reqresin.users.iter_users(prefetch=1):
+            seen.append(user.id)
+    assert exc_info.value.page == 2
+
+    seen.extend(user.id for user in local_reqresin.users.iter_users(start_page=exc_info.value.page))
+    assert seen == list(range(1, 31))
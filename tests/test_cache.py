@@ -0,0 +1,100 @@
+import allure
+import pytest
+
+from api.cache import ResponseCache
+from api.endpoints import ReqresIn
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_reqresin(base_url: str, cache: ResponseCache) -> ReqresIn:
+    return ReqresIn(base_url=base_url, api_key="local", cache=cache)
+
+
+@allure.feature("Users API")
+@allure.story("Response cache")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_repeated_get_is_served_from_memory(stub):
+    base_url, state = stub
+    cache = ResponseCache(ttl=60)
+    reqresin = make_reqresin(base_url, cache)
+
+    first = reqresin.users.get_users(page=1)
+    second = reqresin.users.get_users(page=1)
+
+    assert first == second
+    assert state.requests == 1
+    assert cache.stats["hits"] == 1 and cache.stats["misses"] == 1
+
+
+@allure.feature("Users API")
+@allure.story("Response cache")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_stale_entry_is_revalidated_with_etag(stub):
+    base_url, state = stub
+    clock = Clock()
+    cache = ResponseCache(ttl=5, clock=clock)
+    reqresin = make_reqresin(base_url, cache)
+
+    first = reqresin.users.get_user(user_id=2)
+    clock.now += 10
+    second = reqresin.users.get_user(user_id=2)
+
+    assert first == second
+    assert state.requests == 2
+    assert cache.stats["revalidations"] == 1
+
+
+@allure.feature("Users API")
+@allure.story("Response cache")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_mutations_invalidate_resource_and_collection(stub):
+    base_url, state = stub
+    cache = ResponseCache(ttl=60)
+    reqresin = make_reqresin(base_url, cache)
+    reqresin.users.get_user(user_id=2)
+    reqresin.users.get_user(user_id=3)
+    reqresin.users.get_users(page=1)
+
+    reqresin.users.delete_user(user_id=2)
+
+    assert sorted(entry.split("/api/")[1] for entry in cache._entries) == ["users/3"]
+    assert len(reqresin.users.get_users(page=1)[1]["data"]) == 6
+    assert reqresin.users.get_users(page=1)[1]["data"][1]["id"] == 3
+
+
+def test_lru_evicts_by_count_and_size():
+    cache = ResponseCache(max_entries=2, max_bytes=10)
+    cache.store("http://x/a", 200, "aaaa", {})
+    cache.store("http://x/b", 200, "bbbb", {})
+    cache.lookup("http://x/a")
+    cache.store("http://x/c", 200, "cccc", {})
+
+    assert list(cache._entries) == ["http://x/a", "http://x/c"]
+    cache.store("http://x/d", 200, "dddddddd", {})
+    assert list(cache._entries) == ["http://x/d"]
+    assert cache.stats["evictions"] == 3
+
+
+def test_disk_tier_survives_new_cache_instance(stub, tmp_path):
+    base_url, state = stub
+    make_reqresin(base_url, ResponseCache(disk_dir=str(tmp_path))).users.get_user(user_id=4)
+
+    cache = ResponseCache(disk_dir=str(tmp_path))
+    status, body = make_reqresin(base_url, cache).users.get_user(user_id=4)
+
+    assert (status, body["data"]["id"]) == (200, 4)
+    assert state.requests == 1
+    assert cache.stats["disk_loads"] == 1
+
+    cache.invalidate(f"{base_url}/api/users/4")
+    assert ResponseCache(disk_dir=str(tmp_path)).lookup(f"{base_url}/api/users/4") == (None, False)
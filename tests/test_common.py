@@ -3,12 +3,15 @@ import pytest
 from pydantic import ValidationError
 
 from api.endpoints import ReqresIn
+from models.frame import UsersFrame
 from models.response import UsersList, CreatedUser, UpdatedUser
 
 
 @pytest.fixture
-def reqresin():
-    return ReqresIn(base_url="https://reqres.in", api_key="")
+def reqresin(reqres_base_url, api_timings):
+    reqresin = ReqresIn(base_url=reqres_base_url, api_key="")
+    api_timings.install(reqresin.api_client)
+    return reqresin
 
 @allure.feature("Users API")
 @allure.story("Get users list")
@@ -31,11 +34,11 @@ def test_get_users(reqresin, page):
         assert validated_data.total >= validated_data.per_page, "total should be >= per_page"
 
     with allure.step("Check user data"):
-        for user in validated_data.data:
-            assert user.id > 0, "ID Should be a positive number"
-            assert user.first_name.strip() != "", "Name should not be empty"
-            assert user.last_name.strip() != "", "Last name should not be empty"
-            assert user.avatar.startswith("https://"), f"Wrong avatar URL: {user.avatar}"
+        users = UsersFrame.from_users_list(validated_data)
+        assert users.all_ids_greater_than(0), f"ID Should be a positive number: {list(users.ids)}"
+        assert users.all_non_blank("first_names"), "Name should not be empty"
+        assert users.all_non_blank("last_names"), "Last name should not be empty"
+        assert users.all_start_with("avatars", "https://"), f"Wrong avatar URL: {users.avatars}"
 
 @allure.feature("Users API")
 @allure.story("Creating User")
@@ -0,0 +1,102 @@
+import allure
+import pytest
+
+from pages.base_page import BasePage
+from utils.context_pool import ContextPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.url = "about:blank"
+        self.evaluated = []
+
+    def goto(self, url, wait_until=None):
+        self.url = url
+        self.context.navigations += 1
+
+    def evaluate(self, script):
+        self.evaluated.append(script)
+
+    def close(self):
+        self.context.pages.remove(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+        self.cookies_cleared = 0
+        self.navigations = 0
+        self.closed = False
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def clear_cookies(self):
+        self.cookies_cleared += 1
+
+    def clear_permissions(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts = []
+
+    def new_context(self, **kwargs):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+@pytest.fixture
+def pool():
+    with ContextPool(FakeBrowser(), BasePage, "/hosting", size=1) as pool:
+        yield pool
+
+
+@allure.feature("Context pool")
+def test_released_context_is_reset_and_reused(pool):
+    first = pool.acquire()
+    first.page.context.new_page()
+    first.page.url = "https://gcore.com/hosting?currency=EUR"
+    pool.release(first)
+
+    second = pool.acquire()
+
+    assert second is first
+    assert len(pool.browser.contexts) == 1
+    assert second.page.context.pages == [second.page]
+    assert second.page.context.cookies_cleared == 1
+    assert second.page.url == "https://gcore.com/hosting"
+    assert pool.stats["created"] == 1 and pool.stats["reused"] == 1
+
+
+@allure.feature("Context pool")
+def test_contexts_over_pool_size_are_closed(pool):
+    first, second = pool.acquire(), pool.acquire()
+
+    pool.release(first)
+    pool.release(second)
+
+    assert not first.page.context.closed
+    assert second.page.context.closed
+    assert pool.stats["discarded"] == 1
+
+
+@allure.feature("Context pool")
+def test_released_context_is_navigated_only_when_acquired_again(pool):
+    page_object = pool.acquire()
+    page_object.page.url = "https://gcore.com/hosting?currency=EUR"
+
+    pool.release(page_object)
+    assert page_object.page.context.navigations == 1
+    assert page_object.page.url == "https://gcore.com/hosting?currency=EUR"
+
+    pool.acquire()
+    assert page_object.page.context.navigations == 2
@@ -0,0 +1,55 @@
+import allure
+import pytest
+
+from api.endpoints import ReqresIn
+from models.frame import UsersFrame
+from models.response import UsersList
+
+
+@allure.feature("Users API")
+@allure.story("Columnar user lists")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_frame_roundtrips_users_list(stub):
+    base_url, _ = stub
+    users_list = ReqresIn(base_url=base_url, api_key="local").users.get_users(page=1, model=UsersList)[1]
+
+    frame = UsersFrame.from_users_list(users_list)
+
+    assert len(frame) == len(users_list.data)
+    assert [row.id for row in frame] == [user.id for user in users_list.data]
+    assert frame[-1].to_model() == users_list.data[-1]
+    assert frame.to_users_list() == users_list
+
+
+@allure.feature("Users API")
+@allure.story("Columnar user lists")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_frame_streams_from_paginator(stub):
+    base_url, state = stub
+    state.reset(total_users=60)
+
+    frame = UsersFrame.from_rows(ReqresIn(base_url=base_url, api_key="local").users.iter_users(trusted=True))
+
+    assert list(frame.ids) == list(range(1, 61))
+    assert frame.all_ids_greater_than(0)
+    assert frame.all_start_with("avatars", "https://")
+    assert frame.all_non_blank("first_names") and frame.all_non_blank("last_names")
+
+
+@allure.feature("Users API")
+@allure.story("Columnar user lists")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_frame_checks_catch_bad_rows():
+    row = {"id": 1, "email": "a@reqres.in", "first_name": "A", "last_name": "B", "avatar": "https://x"}
+    frame = UsersFrame.from_rows([row, {**row, "id": 0, "first_name": "  ", "avatar": "http://x"}])
+
+    assert not frame.all_ids_greater_than(0)
+    assert not frame.all_non_blank("first_names")
+    assert not frame.all_start_with("avatars", "https://")
+    with pytest.raises(KeyError):
+        frame.all_non_blank("ids")
+    with pytest.raises(ValueError):
+        frame.to_users_list()
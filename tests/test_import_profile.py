@@ -0,0 +1,22 @@
+import allure
+
+from utils.import_profile import parse_importtime
+
+OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     pydantic.main
+import time:       200 |        300 |   pydantic
+import time:        50 |         50 |     requests.utils
+import time:       400 |        450 |   requests
+import time:        10 |        760 | api.client
+import time:         5 |          5 | api.tracing
+"""
+
+
+@allure.feature("Import profile")
+def test_parse_importtime_counts_each_package_once():
+    packages = parse_importtime(OUTPUT)
+
+    assert packages["api"] == {"cumulative_ms": 0.765, "self_ms": 0.015, "modules": 2}
+    assert packages["pydantic"] == {"cumulative_ms": 0.3, "self_ms": 0.3, "modules": 2}
+    assert packages["requests"]["cumulative_ms"] == 0.45
@@ -0,0 +1,82 @@
+import json
+
+import allure
+import pytest
+
+from utils.load_runner import LoadConfig, compare, main, run_load
+
+
+@allure.feature("Load runner")
+@allure.story("Closed loop")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_report_has_per_endpoint_stats(stub):
+    base_url, server = stub
+    config = LoadConfig(base_url=base_url, mix={"get_users": 1, "get_user": 1}, duration=0.5, concurrency=4, seed=1)
+
+    report = run_load(config)
+
+    assert set(report["endpoints"]) == {"get_users", "get_user"}
+    assert report["total"]["count"] == server.requests
+    assert report["total"]["errors"] == 0
+    assert sum(report["total"]["histogram_ms"].values()) == report["total"]["count"]
+    latency = report["total"]["latency_ms"]
+    assert 0 < latency["p50"] <= latency["p90"] <= latency["p99"] <= latency["max"]
+
+
+@allure.feature("Load runner")
+@allure.story("Open loop")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_rps_mode_paces_requests_and_counts_errors(stub):
+    base_url, server = stub
+    server.error_rate = 1.0
+    config = LoadConfig(base_url=base_url, mix={"get_user": 1}, duration=0.5, concurrency=4, rps=40)
+
+    report = run_load(config)
+
+    assert 15 <= report["total"]["count"] <= 21
+    assert report["endpoints"]["get_user"]["error_rate"] == 1.0
+    assert report["endpoints"]["get_user"]["error_types"] == {"HTTPError": report["total"]["count"]}
+    assert report["schedule"]["target_rps"] == 40
+    assert report["schedule"]["slots"] == report["total"]["count"]
+
+
+@allure.feature("Load runner")
+@allure.story("Open loop")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_rps_mode_counts_queueing_delay_of_an_overloaded_service(stub):
+    base_url, server = stub
+    server.latency = 0.05
+    # one worker serves at most ~20 calls/s, so slots fall further and further behind
+    config = LoadConfig(base_url=base_url, mix={"get_user": 1}, duration=0.3, concurrency=1, rps=40)
+
+    report = run_load(config)
+
+    schedule = report["schedule"]
+    assert schedule["achieved_rps"] < schedule["target_rps"] * 0.75
+    assert schedule["late_slots"] >= schedule["slots"] - 1
+    # latency includes the wait for the worker, far above the 50 ms service time
+    assert report["total"]["latency_ms"]["max"] > 100
+
+
+def test_compare_flags_regressions_and_cli_exit_code(stub, tmp_path):
+    base_url, _ = stub
+    baseline_path, output_path = tmp_path / "baseline.json", tmp_path / "current.json"
+    assert main(["--base-url", base_url, "--mix", "get_user=1", "--duration", "0.3",
+                 "--concurrency", "2", "--output", str(baseline_path)]) == 0
+    baseline = json.loads(baseline_path.read_text())
+
+    slower = json.loads(json.dumps(baseline))
+    slower["endpoints"]["get_user"]["latency_ms"]["p99"] = baseline["endpoints"]["get_user"]["latency_ms"]["p99"] * 3
+    assert compare(baseline, baseline) == []
+    assert compare(baseline, slower) == [
+        f"get_user: p99 {baseline['endpoints']['get_user']['latency_ms']['p99']}ms -> "
+        f"{slower['endpoints']['get_user']['latency_ms']['p99']}ms"
+    ]
+
+    baseline["total"]["throughput"] *= 100
+    baseline_path.write_text(json.dumps(baseline))
+    assert main(["--base-url", base_url, "--mix", "get_user=1", "--duration", "0.3", "--concurrency", "2",
+                 "--output", str(output_path), "--baseline", str(baseline_path)]) == 1
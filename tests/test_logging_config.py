@@ -0,0 +1,131 @@
+import json
+import logging
+import time
+
+import pytest
+
+from utils import logging_config
+from utils.log_merge import merge_logs
+from utils.logging_config import resolve_test_logs, set_current_test, setup_logger
+
+
+@pytest.fixture(autouse=True)
+def default_settings(monkeypatch):
+    # independent of --log-structured/--log-failed-only of the current run
+    monkeypatch.setattr(logging_config, "_settings", {"structured": False, "failed_only": False, "worker_id": None})
+
+
+def read_when_flushed(path, expected: str, timeout: float = 2.0) -> str:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists() and expected in path.read_text():
+            return path.read_text()
+        time.sleep(0.01)
+    pytest.fail(f"{expected!r} was not written to {path}")
+
+
+def test_setup_is_idempotent_and_quiet(tmp_path, capsys):
+    log_file = tmp_path / "quiet.log"
+
+    logger = setup_logger("tests.quiet", log_file=str(log_file), console=False)
+    again = setup_logger("tests.quiet", log_file=str(log_file), console=False)
+
+    assert logger is again
+    assert len(logger.handlers) == 1
+    assert "DEBUG:" not in capsys.readouterr().out
+
+
+def test_queued_logger_writes_in_background(tmp_path):
+    log_file = tmp_path / "queued.log"
+    logger = setup_logger("tests.queued", log_file=str(log_file), console=False)
+
+    logger.info("hello from the queue")
+
+    assert isinstance(logger.handlers[0], logging.handlers.QueueHandler)
+    assert " - INFO - hello from the queue" in read_when_flushed(log_file, "hello from the queue")
+
+
+def test_queued_record_is_rendered_when_logged(tmp_path):
+    log_file = tmp_path / "rendered.log"
+    logger = setup_logger("tests.rendered", log_file=str(log_file), console=False)
+    prices = [400]
+    records = []
+    logger.addFilter(lambda record: records.append(record) or True)
+
+    logger.info("prices %s", prices)
+    prices.append(450)
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        logger.exception("failed")
+
+    content = read_when_flushed(log_file, "ValueError: boom")
+    assert "prices [400]\n" in content
+    assert "failed\nTraceback" in content
+    assert (records[0].msg, records[0].args) == ("prices [400]", None)
+    assert records[-1].exc_info is None, "the queued record should not keep the traceback frames"
+
+
+def test_log_file_rotates_by_size(tmp_path, monkeypatch):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    log_file = tmp_path / "rotating.log"
+    logger = setup_logger("tests.rotating", log_file=str(log_file), console=False,
+                          queued=False, max_bytes=1024, backup_count=2)
+
+    for i in range(200):
+        logger.info(f"line {i:04d} " + "x" * 40)
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["rotating.log", "rotating.log.1", "rotating.log.2"]
+    assert log_file.stat().st_size <= 1024
+
+
+def test_text_log_file_is_per_worker_under_xdist(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw2")
+    logger = setup_logger("tests.text_worker", log_file=str(tmp_path / "test.log"), console=False, queued=False)
+
+    logger.info("worker line")
+
+    assert " - INFO - worker line" in (tmp_path / "test.gw2.log").read_text(encoding="utf-8")
+    assert not (tmp_path / "test.log").exists()
+
+
+def test_structured_logger_writes_json_lines_per_worker(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+    logger = setup_logger("tests.structured", log_file=str(tmp_path / "test.log"), console=False, structured=True)
+    set_current_test("tests/test_x.py::test_y")
+    try:
+        logger.info("structured line")
+    finally:
+        set_current_test(None)
+
+    lines = read_when_flushed(tmp_path / "test.gw3.jsonl", "structured line").splitlines()
+    entry = json.loads(lines[-1])
+    assert entry["message"] == "structured line"
+    assert entry["test_id"] == "tests/test_x.py::test_y"
+    assert entry["worker_id"] == "gw3"
+
+
+def test_failed_only_writes_logs_of_failed_tests(tmp_path):
+    log_file = tmp_path / "failed.log"
+    logger = setup_logger("tests.failed_only", log_file=str(log_file), console=False, failed_only=True)
+    for test_id, failed in (("test_passes", False), ("test_fails", True)):
+        set_current_test(test_id)
+        logger.info(f"inside {test_id}")
+        set_current_test(None)
+        resolve_test_logs(test_id, keep=failed)
+    logger.info("after tests")
+
+    written = read_when_flushed(log_file, "after tests")
+    assert "inside test_fails" in written
+    assert "inside test_passes" not in written
+
+
+def test_merge_logs_orders_workers_by_time(tmp_path):
+    entries = [{"ts": ts, "time": "", "level": "INFO", "message": f"m{ts}", "test_id": None, "worker_id": worker}
+               for worker, ts in (("gw0", 1.0), ("gw1", 2.0), ("gw0", 3.0), ("gw1", 4.0))]
+    for worker in ("gw0", "gw1"):
+        (tmp_path / f"test.{worker}.jsonl").write_text(
+            "".join(json.dumps(entry) + "\n" for entry in entries if entry["worker_id"] == worker)
+        )
+
+    assert [entry["message"] for entry in merge_logs([tmp_path])] == ["m1.0", "m2.0", "m3.0", "m4.0"]
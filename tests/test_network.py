@@ -0,0 +1,121 @@
+import allure
+import pytest
+
+from pages.network import AssetCache, NetworkLayer, NetworkPolicy
+
+
+@allure.feature("Network policy")
+@pytest.mark.parametrize("resource_type, url, blocked", [
+    ("script", "https://www.googletagmanager.com/gtm.js", True),
+    ("image", "https://stats.g.doubleclick.net/pixel", True),
+    ("media", "https://gcore.com/video.mp4", True),
+    ("script", "https://gcore.com/main.js", False),
+    ("document", "https://notgoogle-analytics.com/", False),
+])
+def test_blocked_requests(resource_type, url, blocked):
+    assert NetworkPolicy().is_blocked(resource_type, url) is blocked
+
+
+@allure.feature("Network policy")
+def test_har_mode_needs_a_path():
+    with pytest.raises(ValueError):
+        NetworkPolicy(har_mode="replay")
+
+
+@allure.feature("Network policy")
+def test_asset_cache_round_trip(tmp_path):
+    cache = AssetCache(str(tmp_path))
+    url = "https://gcore.com/main.js"
+
+    assert cache.load(url) is None
+    cache.store(url, 200, {"content-type": "text/javascript"}, b"console.log(1)")
+
+    meta, body = cache.load(url)
+    assert body == b"console.log(1)"
+    assert meta["headers"] == {"content-type": "text/javascript"}
+    assert cache.is_fresh(meta)
+    assert not AssetCache(str(tmp_path), max_age=0).is_fresh(meta)
+
+
+class FakePage:
+    def __init__(self):
+        self.routes = []
+
+    def route_from_har(self, har, **options):
+        self.routes.append(("har", options["update"]))
+
+    def route(self, pattern, handler):
+        self.routes.append(("route", pattern))
+
+
+@allure.feature("Network policy")
+@pytest.mark.parametrize("har_mode, routes", [
+    ("off", [("route", "**/*")]),
+    ("record", [("har", True)]),
+    ("replay", [("har", False)]),
+])
+def test_har_modes_are_not_filtered(tmp_path, har_mode, routes):
+    page = FakePage()
+    har_path = str(tmp_path / "page.har") if har_mode != "off" else None
+
+    NetworkLayer(page, NetworkPolicy(har_path=har_path, har_mode=har_mode)).install()
+
+    assert page.routes == routes
+
+
+class FakeResponse:
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = headers or {}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeRequest:
+    resource_type = "script"
+    method = "GET"
+    url = "https://gcore.com/main.js"
+    headers = {"accept": "*/*"}
+
+
+class FakeRoute:
+    def __init__(self, response):
+        self.request = FakeRequest()
+        self.response = response
+        self.fetched_with = None
+        self.fulfilled = None
+
+    def fetch(self, headers=None):
+        self.fetched_with = headers
+        return self.response
+
+    def fulfill(self, **kwargs):
+        self.fulfilled = kwargs
+
+
+@allure.feature("Network policy")
+def test_expired_asset_is_revalidated(tmp_path):
+    layer = NetworkLayer(FakePage(), NetworkPolicy(cache_dir=str(tmp_path), cache_max_age=0))
+    layer.cache.store(FakeRequest.url, 200, {"ETag": '"v1"'}, b"console.log(1)")
+
+    route = FakeRoute(FakeResponse(304))
+    layer._handle(route)
+
+    assert route.fetched_with == {"accept": "*/*", "if-none-match": '"v1"'}
+    assert route.fulfilled == {"status": 200, "headers": {"ETag": '"v1"'}, "body": b"console.log(1)"}
+    assert layer.counters.snapshot() == (0, 0, 0, 1)
+
+
+@allure.feature("Network policy")
+def test_navigation_is_compared_with_the_last_live_one(tmp_path):
+    layer = NetworkLayer(FakePage(), NetworkPolicy(cache_dir=str(tmp_path)))
+    url = "https://gcore.com/hosting"
+
+    live = layer.measure(url, lambda: layer._handle(FakeRoute(FakeResponse(200, body=b"console.log(1)"))))
+    cached = layer.measure(url, lambda: layer._handle(FakeRoute(FakeResponse(500))))
+
+    assert (live.cache_misses, cached.cache_hits) == (1, 1)
+    assert live.baseline_seconds == cached.baseline_seconds == live.seconds
+    assert cached.saved_seconds == live.seconds - cached.seconds
@@ -0,0 +1,27 @@
+import allure
+import pytest
+
+from pages.base_page import NumericCase, NumericCaseResult
+from pages.hosting_page import HostingPage
+
+
+@allure.feature("Numeric input cases")
+@pytest.mark.parametrize("case, accepted, actual, passed", [
+    (NumericCase("-100", 0), True, 0, True),
+    (NumericCase("-100", 0), True, -100, False),
+    (NumericCase("abc", None), False, None, True),
+    (NumericCase("abc", None), True, 0, False),
+    (NumericCase("1.5", 1), True, "1.5", False),
+])
+def test_case_result(case, accepted, actual, passed):
+    assert NumericCaseResult(case, accepted, actual).passed is passed
+
+
+@allure.feature("Numeric input cases")
+def test_price_input_cases():
+    min_cases = {case.value: case.expected for case in HostingPage.numeric_input_cases(100, 1000, is_min=True)}
+    max_cases = {case.value: case.expected for case in HostingPage.numeric_input_cases(1000, 100, is_min=False)}
+
+    assert min_cases == {"99": 100, "-100": 100, "abc": None, "@#$": None, "1010": 999}
+    assert max_cases == {"1001": 1000, "-100": 1000, "abc": None, "@#$": None, "90": 101}
+    assert list(min_cases)[-1] == "1010"
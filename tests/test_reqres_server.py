@@ -0,0 +1,59 @@
+import allure
+import pytest
+import requests
+from requests.exceptions import HTTPError
+
+from api.endpoints import ReqresIn
+from models.response import User, UsersList
+from utils.reqres_server import ReqresServer
+
+
+@allure.feature("Local reqres server")
+@allure.story("Response shapes")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_responses_match_models(stub):
+    base_url, _ = stub
+    users = ReqresIn(base_url=base_url, api_key="local").users
+
+    assert users.get_users(page=2, model=UsersList)[1].page == 2
+    assert users.get_user(user_id=5, model=User)[1].data.id == 5
+
+
+@allure.feature("Local reqres server")
+@allure.story("Error injection")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_error_rate_is_applied():
+    with ReqresServer(error_rate=0.5, error_status=502, seed=1) as server:
+        users = ReqresIn(base_url=server.base_url, api_key="local").users
+        statuses = []
+        for _ in range(40):
+            try:
+                statuses.append(users.get_user(user_id=1)[0])
+            except HTTPError as e:
+                statuses.append(e.response.status_code)
+
+    assert set(statuses) == {200, 502}
+    assert 10 < statuses.count(502) < 30
+
+
+@allure.feature("Local reqres server")
+@allure.story("Input validation")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+@pytest.mark.parametrize("method, path, body", [
+    ("PATCH", "/api/users/2", b"[]"),
+    ("PUT", "/api/users/2", b"1"),
+    ("PATCH", "/api/users/2", b"{not json"),
+    ("POST", "/api/users", b'"morpheus"'),
+    ("GET", "/api/users?page=abc", None),
+    ("GET", "/api/users?page=0", None),
+])
+def test_malformed_input_is_answered_with_400(stub, method, path, body):
+    base_url, _ = stub
+
+    response = requests.request(method, base_url + path, data=body, timeout=5)
+
+    assert response.status_code == 400
+    assert "error" in response.json()
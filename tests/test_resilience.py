@@ -0,0 +1,139 @@
+import allure
+import pytest
+from requests.exceptions import HTTPError, Timeout
+
+from api.endpoints import ReqresIn
+from api.resilience import Resilience, RetryPolicy, CircuitBreaker, CircuitOpenError
+
+
+def make_reqresin(base_url: str, **options) -> tuple[ReqresIn, Resilience]:
+    options.setdefault("default_policy", RetryPolicy(max_attempts=3, backoff_base=0.001))
+    resilience = Resilience(**options)
+    return ReqresIn(base_url=base_url, api_key="local", resilience=resilience), resilience
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_get_is_retried_after_server_errors(stub):
+    base_url, state = stub
+    reqresin, resilience = make_reqresin(base_url)
+    state.inject(503, 502)
+
+    status, body = reqresin.users.get_user(user_id=1)
+
+    assert status == 200 and body["data"]["id"] == 1
+    assert resilience.stats["attempts"] == 3
+    assert resilience.stats["retries"] == 2
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_slow_response_times_out_and_is_retried(stub):
+    base_url, state = stub
+    reqresin, resilience = make_reqresin(base_url, timeout=0.2)
+    state.inject(1.0)
+
+    status, _ = reqresin.users.get_users(page=1)
+
+    assert status == 200
+    assert resilience.stats["timeouts"] == 1
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_post_is_retried_only_with_idempotency_key(stub):
+    base_url, state = stub
+    reqresin, resilience = make_reqresin(base_url)
+    body = {"name": "morpheus", "job": "leader"}
+
+    state.inject(503)
+    with pytest.raises(HTTPError):
+        reqresin.users.add_user(body=body)
+    assert resilience.stats["retries"] == 0
+
+    state.inject(503)
+    api_client = reqresin.api_client
+    status, _ = api_client.send(
+        api_client.template("POST", "/api/users"), json=body, headers={"Idempotency-Key": "seed-1"}
+    )
+    assert status == 201
+    assert resilience.stats["retries"] == 1
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_circuit_opens_per_host_and_recovers(stub):
+    base_url, state = stub
+    now = [0.0]
+    reqresin, resilience = make_reqresin(
+        base_url, default_policy=RetryPolicy(max_attempts=1), failure_threshold=2, reset_timeout=10, clock=lambda: now[0]
+    )
+    state.inject(500, 500)
+
+    for _ in range(2):
+        with pytest.raises(HTTPError):
+            reqresin.users.get_user(user_id=1)
+    requests_before = state.requests
+    with pytest.raises(CircuitOpenError):
+        reqresin.users.get_user(user_id=1)
+    assert state.requests == requests_before, "Open circuit should not hit the server"
+    assert resilience.stats["circuit_open"] == 1
+
+    now[0] = 10.0
+    breaker = next(iter(resilience.breakers.values()))
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert reqresin.users.get_user(user_id=1)[0] == 200
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_half_open_circuit_lets_a_single_probe_through():
+    now = [0.0]
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=lambda: now[0])
+    breaker.record_failure()
+    now[0] = 10.0
+
+    assert [breaker.allow() for _ in range(5)] == [True, False, False, False, False]
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN and not breaker.allow()
+
+    now[0] = 20.0
+    assert breaker.allow() and not breaker.allow()
+    breaker.record_success()
+    assert all(breaker.allow() for _ in range(5))
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_backoff_grows_exponentially_within_cap():
+    policy = RetryPolicy(backoff_base=0.5, backoff_max=3.0, jitter=False)
+    assert [policy.backoff(attempt) for attempt in range(1, 5)] == [0.5, 1.0, 2.0, 3.0]
+    jittered = RetryPolicy(backoff_base=0.5, backoff_max=3.0)
+    assert all(0 <= jittered.backoff(4) <= 3.0 for _ in range(100))
+
+
+@allure.feature("Users API")
+@allure.story("Resilience")
+@allure.tag("api", "negative")
+@pytest.mark.negative
+def test_timeout_is_raised_when_attempts_are_exhausted(stub):
+    base_url, state = stub
+    reqresin, resilience = make_reqresin(base_url, default_policy=RetryPolicy(max_attempts=1), timeout=0.1)
+    state.inject(0.5)
+
+    with pytest.raises(Timeout):
+        reqresin.users.get_user(user_id=1)
+    assert resilience.stats["failures"] == 1
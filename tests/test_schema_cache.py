@@ -0,0 +1,132 @@
+import asyncio
+import json
+
+import allure
+import pytest
+from pydantic import ValidationError
+
+from api.endpoints import ReqresIn
+from models.response import CreatedUser, Data, UsersList
+from models.schema_cache import SchemaCache, fingerprint
+
+
+def users_payload(*emails: str) -> str:
+    return json.dumps({
+        "page": 1, "per_page": len(emails), "total": len(emails), "total_pages": 1,
+        "data": [
+            {"id": i, "email": email, "first_name": "a", "last_name": "b", "avatar": "x"}
+            for i, email in enumerate(emails, start=1)
+        ],
+        "support": {"url": "https://reqres.in/#support-heading", "text": "Support"},
+    })
+
+
+@allure.feature("Schema cache")
+def test_fingerprint_ignores_values_and_list_length():
+    one = json.loads(users_payload("a@reqres.in"))
+    many = json.loads(users_payload("b@reqres.in", "c@reqres.in", "d@reqres.in"))
+    one["page"] = 7
+
+    assert fingerprint(one) == fingerprint(many)
+    many["page"] = "7"
+    assert fingerprint(one) != fingerprint(many)
+
+
+@allure.feature("Schema cache")
+def test_known_shape_takes_fast_path_and_skips_seen_records():
+    cache = SchemaCache(sample_rate=0.0)
+    raw = users_payload("a@reqres.in", "b@reqres.in")
+
+    first = cache.validate_json(UsersList, raw)
+    second = cache.validate_json(UsersList, raw)
+
+    assert isinstance(first, UsersList) and isinstance(second, UsersList)
+    assert first.model_dump() == second.model_dump()
+    # the body's own fields, two users and the support block
+    assert cache.stats == {"full": 1, "fast": 1, "records_skipped": 4}
+
+
+@allure.feature("Schema cache")
+def test_new_records_on_fast_path_are_fully_validated():
+    cache = SchemaCache(sample_rate=0.0)
+    cache.validate_json(UsersList, users_payload("a@reqres.in"))
+
+    with pytest.raises(ValidationError):
+        cache.validate_json(UsersList, users_payload("a@reqres.in", "not-an-email"))
+    assert cache.stats["records_new"] == 1
+
+
+@allure.feature("Schema cache")
+def test_new_values_of_a_flat_model_are_fully_validated():
+    cache = SchemaCache(sample_rate=0.0)
+    user = {"id": 1, "email": "a@reqres.in", "first_name": "a", "last_name": "b", "avatar": "x"}
+
+    cache.validate_json(Data, json.dumps(user))
+    assert cache.validate_json(Data, json.dumps(user)).email == "a@reqres.in"
+    with pytest.raises(ValidationError):
+        cache.validate_json(Data, json.dumps({**user, "email": "not-an-email"}))
+    assert cache.stats == {"full": 1, "fast": 1, "records_skipped": 1, "records_new": 1}
+
+
+@allure.feature("Schema cache")
+def test_sampled_records_are_revalidated():
+    cache = SchemaCache(sample_rate=1.0)
+    raw = users_payload("a@reqres.in", "b@reqres.in")
+
+    cache.validate_json(UsersList, raw)
+    cache.validate_json(UsersList, raw)
+
+    # the sampled body is validated in full again, records included
+    assert cache.stats == {"full": 2, "records_sampled": 1}
+
+
+@allure.feature("Schema cache")
+def test_models_without_trusted_variant_are_always_validated_in_full():
+    cache = SchemaCache()
+    raw = '{"name": "morpheus", "job": "leader", "id": 1, "createdAt": "2024-01-01T00:00:00Z"}'
+
+    for _ in range(3):
+        cache.validate_json(CreatedUser, raw)
+
+    assert cache.stats == {"full": 3}
+
+
+@allure.feature("Schema cache")
+def test_shapes_are_evicted_least_recently_used():
+    cache = SchemaCache(max_shapes=1)
+    cache.validate_json(UsersList, users_payload("a@reqres.in"))
+    cache.validate_json(UsersList, users_payload())  # empty data is a different shape
+
+    cache.validate_json(UsersList, users_payload("a@reqres.in"))
+
+    assert cache.stats["full"] == 3
+
+
+@allure.feature("Schema cache")
+def test_client_uses_schema_cache(stub):
+    base_url, _ = stub
+    cache = SchemaCache()
+    reqresin = ReqresIn(base_url=base_url, api_key="local", schema_cache=cache)
+
+    for _ in range(2):
+        status, users = reqresin.users.get_users(page=1, model=UsersList)
+
+    assert status == 200 and isinstance(users, UsersList)
+    assert cache.stats["full"] == 1 and cache.stats["fast"] == 1
+
+
+@allure.feature("Schema cache")
+def test_async_client_uses_schema_cache(stub):
+    from api.async_endpoints import AsyncReqresIn
+
+    base_url, _ = stub
+    cache = SchemaCache()
+
+    async def scenario():
+        async with AsyncReqresIn(base_url=base_url, api_key="local", schema_cache=cache) as reqresin:
+            return [await reqresin.users.get_users(page=1, model=UsersList) for _ in range(2)]
+
+    responses = asyncio.run(scenario())
+
+    assert all(status == 200 and isinstance(users, UsersList) for status, users in responses)
+    assert cache.stats["full"] == 1 and cache.stats["fast"] == 1
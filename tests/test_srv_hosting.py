@@ -1,56 +1,102 @@
+import json
+import typing as t
+
 import allure
 
-from pages.hosting_page import HostingPage
-from utils.logging_config import setup_logger
+from utils.logging_config import get_logger
 
 import pytest
-from playwright.sync_api import Page
 
+# pytest imports this module even when a marker or -k deselects its test, so the page
+# objects (and playwright with them) are only imported by the fixtures that build pages
+if t.TYPE_CHECKING:
+    from pages.hosting_page import HostingPage
+    from utils.ui_runner import HostingScenario
+
+
+logger = get_logger(__name__)
+
+# Upper bounds for the steps that used to sleep, kept under the old sleeps alone (1 s to
+# open the filter, 3 x 0.5 s per price field) so a sleep-based page object cannot pass them.
+# Live gcore.com timings vary with the network, so they are only asserted with --ui-step-budgets
+# and otherwise just recorded in the "Step timings" attachment
+FILTER_OPEN_BUDGET = 0.9
+INPUT_VALIDATION_BUDGET = 1.4
+
+
+def pytest_generate_tests(metafunc):
+    if "scenario" in metafunc.fixturenames:
+        from utils.ui_runner import DEFAULT_SCENARIO, HostingScenario
 
-logger = setup_logger(__name__)
+        try:
+            scenarios = [HostingScenario.parse(value) for value in metafunc.config.getoption("--hosting-scenario")]
+        except ValueError as e:
+            raise pytest.UsageError(f"Invalid --hosting-scenario, expected server_type:currency:min:max: {e}")
+        metafunc.parametrize("scenario", scenarios or [DEFAULT_SCENARIO], ids=str)
 
 
 @pytest.fixture(scope="function")
-def hosting_page(page: Page, context):
-    logger.info("Starting tracing for test")
-    context.tracing.start(screenshots=True, snapshots=True, sources=True)
-    yield HostingPage(page)
-    context.tracing.stop(path="trace.zip")
+def hosting_page(request, hosting_pool, ui_tracer, node_failed) -> t.Iterator["HostingPage"]:
+    hosting_page = hosting_pool.acquire()
+    context = hosting_page.page.context
+    if ui_tracer.start(context, request.node.nodeid):
+        logger.info("Tracing test")
+    yield hosting_page
+    trace = ui_tracer.stop(context, request.node.nodeid, failed=node_failed())
+    if trace is not None:
+        logger.info(f"Trace written to {trace}")
+        if request.config.getoption("--ui-trace-attach"):
+            allure.attach.file(str(trace), name="Playwright trace", extension="zip")
+    for report in hosting_page.navigations:
+        baseline = "no live baseline yet" if report.baseline_seconds is None \
+            else f"{report.baseline_seconds:.2f}s live, {report.saved_seconds:.2f}s saved"
+        logger.info(f"Navigation to {report.url}: {report.seconds:.2f}s ({baseline}), {report.blocked} blocked, "
+                    f"{report.cache_hits} cached, {report.revalidated} revalidated, {report.cache_misses} fetched")
+    if hosting_page.navigations:
+        allure.attach(json.dumps([report._asdict() for report in hosting_page.navigations], indent=2),
+                      name="Navigations", attachment_type=allure.attachment_type.JSON)
+    if hosting_page.timings:
+        allure.attach(json.dumps(hosting_page.timings, indent=2), name="Step timings",
+                      attachment_type=allure.attachment_type.JSON)
+    hosting_pool.release(hosting_page)
 
 
 @allure.epic("Hosting Services")
 @allure.feature("Dedicated Hosting")
 @allure.story("Price Filter Functionality")
 @allure.severity(allure.severity_level.CRITICAL)
-def test_gcore_hosting_page(hosting_page: HostingPage):
-    min_price = 400
-    max_price = 450
+def test_gcore_hosting_page(hosting_page: "HostingPage", scenario: "HostingScenario", pytestconfig):
+    server_type, currency, min_price, max_price = scenario
+    enforce_budgets = pytestconfig.getoption("--ui-step-budgets")
 
     with allure.step(f"Starting test with price range: {min_price}–{max_price}"):
         logger.info(f"Starting test with price range: {min_price}–{max_price}")
 
     with allure.step("Navigate to hosting page"):
-        hosting_page.navigate("/hosting")
+        hosting_page.open("/hosting")
 
-    with allure.step("Select dedicated server type"):
-        hosting_page.select_server_type("dedicated")
+    with allure.step(f"Select {server_type} server type"):
+        hosting_page.select_server_type(server_type)
 
-    with allure.step("Verify dedicated server type is selected"):
-        hosting_page.check_server_switcher("dedicated")
+    with allure.step(f"Verify {server_type} server type is selected"):
+        hosting_page.check_server_switcher(server_type)
 
-    with allure.step("Select USD currency"):
-        hosting_page.select_currency_type("USD")
+    with allure.step(f"Select {currency} currency"):
+        hosting_page.select_currency_type(currency)
 
-    with allure.step("Verify USD currency is selected"):
-        hosting_page.check_currency_switcher("USD")
+    with allure.step(f"Verify {currency} currency is selected"):
+        hosting_page.check_currency_switcher(currency)
 
-    with allure.step("Open price filter"):
+    with allure.step("Open price filter"), \
+            hosting_page.time_budget("open price filter", FILTER_OPEN_BUDGET, enforce_budgets):
         hosting_page.click_price_filter()
 
-    with allure.step("Validate minimum price input behavior"):
+    with allure.step("Validate minimum price input behavior"), \
+            hosting_page.time_budget("validate min price input", INPUT_VALIDATION_BUDGET, enforce_budgets):
         hosting_page.validate_min_price_input_behavior()
 
-    with allure.step("Validate Maximum price input behavior"):
+    with allure.step("Validate Maximum price input behavior"), \
+            hosting_page.time_budget("validate max price input", INPUT_VALIDATION_BUDGET, enforce_budgets):
         hosting_page.validate_max_price_input_behavior()
 
     with allure.step(f"Set price range to {min_price}-{max_price}"):
@@ -0,0 +1,90 @@
+import zipfile
+
+import allure
+import pytest
+
+from utils.trace_policy import ContextTracer, TracePolicy, recompress
+
+
+@allure.feature("Trace policy")
+@pytest.mark.parametrize("mode, recorded, kept_on_pass, kept_on_failure", [
+    ("off", False, False, False),
+    ("on-failure", True, False, True),
+    ("always", True, True, True),
+])
+def test_modes(mode, recorded, kept_on_pass, kept_on_failure):
+    policy = TracePolicy(mode=mode)
+
+    assert policy.should_record("tests/test_a.py::test_b") is recorded
+    assert policy.should_keep(failed=False) is kept_on_pass
+    assert policy.should_keep(failed=True) is kept_on_failure
+
+
+@allure.feature("Trace policy")
+def test_sampling_is_stable_and_close_to_rate():
+    policy = TracePolicy(mode="sampled", sample_rate=0.25)
+    test_ids = [f"tests/test_a.py::test_{i}" for i in range(4000)]
+
+    sampled = [test_id for test_id in test_ids if policy.should_record(test_id)]
+
+    assert 0.2 < len(sampled) / len(test_ids) < 0.3
+    assert sampled == [test_id for test_id in test_ids if policy.should_record(test_id)]
+
+
+@allure.feature("Trace policy")
+def test_trace_paths_are_unique(tmp_path, monkeypatch):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    policy = TracePolicy(output_dir=str(tmp_path))
+
+    first = policy.trace_path("tests/test_srv_hosting.py::test_gcore_hosting_page[USD]")
+    second = policy.trace_path("tests/test_srv_hosting.py::test_gcore_hosting_page[USD]")
+
+    assert first != second
+    assert first.parent == tmp_path
+    assert first.name.startswith("tests_test_srv_hosting.py_test_gcore_hosting_page_USD.gw1.")
+
+
+@allure.feature("Trace policy")
+def test_recompress_keeps_members(tmp_path):
+    path = tmp_path / "trace.zip"
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("trace.trace", "event\n" * 10_000)
+    stored_size = path.stat().st_size
+
+    recompress(path)
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.read("trace.trace") == b"event\n" * 10_000
+    assert path.stat().st_size < stored_size
+
+
+class FakeTracing:
+    def __init__(self):
+        self.calls = []
+
+    def start(self, **options):
+        self.calls.append(("start", options["screenshots"], options["snapshots"]))
+
+    def start_chunk(self, **options):
+        self.calls.append(("start_chunk",))
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+@allure.feature("Trace policy")
+@pytest.mark.parametrize("mode, snapshots, captured", [
+    ("on-failure", None, False),
+    ("on-failure", True, True),
+    ("always", None, True),
+])
+def test_snapshots_are_skipped_on_failure_only_by_default(mode, snapshots, captured):
+    context = FakeContext()
+    tracer = ContextTracer(TracePolicy(mode=mode, snapshots=snapshots))
+
+    tracer.start(context, "tests/test_a.py::test_b")
+    tracer.start(context, "tests/test_a.py::test_c")
+
+    assert context.tracing.calls == [("start", captured, captured), ("start_chunk",)]
@@ -0,0 +1,88 @@
+import socket
+
+import allure
+import pytest
+from requests.exceptions import HTTPError
+
+from api.endpoints import ReqresIn
+from api.tracing import TimingRecorder
+from models.response import UsersList
+
+
+@allure.feature("Users API")
+@allure.story("Request timings")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_hooks_fire_in_order_with_trace(stub):
+    base_url, _ = stub
+    reqresin = ReqresIn(base_url=base_url, api_key="local")
+    events = []
+    for event in ("pre_request", "post_response", "post_decode"):
+        reqresin.api_client.add_hook(event, lambda trace, event=event: events.append((event, trace.result)))
+
+    status, _ = reqresin.users.get_user(user_id=1)
+
+    assert status == 200
+    assert [event for event, _ in events] == ["pre_request", "post_response", "post_decode"]
+    assert events[-1][1][0] == 200
+    with pytest.raises(ValueError):
+        reqresin.api_client.add_hook("on_send", print)
+
+
+@allure.feature("Users API")
+@allure.story("Request timings")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_recorder_splits_phases_per_endpoint(stub, api_timings):
+    base_url, server = stub
+    recorder = TimingRecorder(capacity=3)
+    reqresin = ReqresIn(base_url=base_url, api_key="local")
+    recorder.install(reqresin.api_client)
+    api_timings.install(reqresin.api_client)
+
+    reqresin.users.get_users(page=1, model=UsersList)
+    for user_id in range(1, 4):
+        reqresin.users.get_user(user_id=user_id)
+    server.inject(500)
+    with pytest.raises(HTTPError):
+        reqresin.users.get_user(user_id=1)
+
+    first, *_ = recorder.records
+    assert len(recorder.records) == 3 and first.sequence == 3
+    assert recorder.since(4)[0].error == "HTTPError"
+    summary = recorder.summary()
+    assert summary["GET /api/users"]["requests"] == 1
+    assert "validate" in summary["GET /api/users"]["phases_ms"]
+    assert summary["GET /api/users/{id}"]["requests"] == 4
+    assert summary["GET /api/users/{id}"]["errors"] == 1
+    assert set(summary["GET /api/users/{id}"]["phases_ms"]) == {"dns", "connect", "tls", "wait", "download", "decode", "total"}
+    assert summary["GET /api/users"]["phases_ms"]["connect"]["max"] > 0
+
+
+@allure.feature("Users API")
+@allure.story("Request timings")
+@allure.tag("api", "positive")
+@pytest.mark.positive
+def test_dns_lookup_is_timed_apart_from_connect(stub, monkeypatch):
+    base_url, _ = stub
+    host_and_port = base_url.split("//")[1]
+    real_getaddrinfo = socket.getaddrinfo
+    lookups = []
+
+    def getaddrinfo(host, *args, **kwargs):
+        lookups.append(host)
+        if host == "reqres.test":
+            # an unreachable address first, the connection falls back to the next one
+            return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", 1))] + real_getaddrinfo("127.0.0.1", *args, **kwargs)
+        return real_getaddrinfo(host, *args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    reqresin = ReqresIn(base_url=f"http://{host_and_port.replace('127.0.0.1', 'reqres.test')}", api_key="local")
+    traces = []
+    reqresin.api_client.add_hook("post_decode", traces.append)
+
+    assert reqresin.users.get_user(user_id=1)[0] == 200
+    # urllib3 still passes the resolved IP literals through getaddrinfo, which does no lookup
+    assert [host for host in lookups if not host[0].isdigit()] == ["reqres.test"]
+    assert "127.0.0.2" in lookups
+    assert traces[0].dns > 0 and traces[0].connect > 0
@@ -0,0 +1,29 @@
+import allure
+import pytest
+
+from utils.ui_runner import HostingScenario, run_matrix, scenario_matrix, split
+
+
+@allure.feature("UI runner")
+def test_matrix_is_spread_round_robin():
+    scenarios = scenario_matrix(["dedicated", "vps"], ["USD", "EUR"], [(400, 450), (100, 200)])
+
+    chunks = split(scenarios, 3)
+
+    assert len(scenarios) == 8
+    assert [len(chunk) for chunk in chunks] == [3, 3, 2]
+    assert sorted(sum(chunks, []), key=scenarios.index) == scenarios
+    assert HostingScenario.parse(str(scenarios[-1])) == HostingScenario("vps", "EUR", 100, 200)
+
+
+@allure.feature("UI runner")
+@pytest.mark.slow
+def test_run_matrix_starts_a_process_per_chunk(tmp_path):
+    scenarios = scenario_matrix(["dedicated"], ["USD", "EUR"], [(400, 450)])
+
+    # any suite works to check the process fan-out, this one needs no browser
+    report = run_matrix(scenarios, processes=4, alluredir=str(tmp_path), test_path="tests/test_numeric_cases.py")
+
+    assert report["passed"]
+    assert report["processes"] == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["gw0", "gw1"]
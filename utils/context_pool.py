@@ -0,0 +1,119 @@
+"""Warm browser contexts reused across UI tests.
+
+Creating a context and cold-loading a heavy page costs more than the test steps on it, so a
+``ContextPool`` keeps the contexts of one worker open and hands out page objects that are
+already navigated. A released context is reset (cookies, storage, permissions, extra tabs)
+and re-navigated by the next ``acquire`` instead of being recreated, so the last test of a
+worker does not pay for a navigation nobody uses; the HTTP cache stays warm.
+"""
+import threading
+import time
+import typing as t
+
+if t.TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+
+    from pages.base_page import BasePage
+
+DEFAULT_POOL_SIZE = 2
+PageObject = t.TypeVar("PageObject", bound="BasePage")
+
+_CLEAR_STORAGE = "() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }"
+
+
+class ContextPool(t.Generic[PageObject]):
+    def __init__(
+        self,
+        browser: "Browser",
+        factory: t.Callable[["Page"], PageObject],
+        path: str,
+        size: int = DEFAULT_POOL_SIZE,
+        context_args: t.Optional[dict] = None,
+    ) -> None:
+        self.browser = browser
+        self.factory = factory
+        self.path = path
+        self.size = size
+        self.context_args = context_args or {}
+        self.stats = {"created": 0, "reused": 0, "discarded": 0, "acquire_seconds": 0.0}
+        self._idle: list[PageObject] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> PageObject:
+        """A page object on ``path``, from an idle warm context if there is one."""
+        from playwright.sync_api import Error
+
+        started = time.perf_counter()
+        with self._lock:
+            page_object = self._idle.pop() if self._idle else None
+        if page_object is not None:
+            try:
+                page_object.navigate(self.path)
+                self.stats["reused"] += 1
+            except Error:
+                self.stats["discarded"] += 1
+                self._close(page_object.page.context)
+                page_object = None
+        if page_object is None:
+            page_object = self._create()
+        self.stats["acquire_seconds"] += time.perf_counter() - started
+        return page_object
+
+    def release(self, page_object: PageObject) -> None:
+        """Resets the context and keeps it warm for the next test, or closes it if the pool
+        is full or the reset failed (crashed page, closed context)."""
+        from playwright.sync_api import Error
+
+        with self._lock:
+            full = len(self._idle) >= self.size
+        if not full:
+            try:
+                self._reset(page_object)
+            except Error:
+                full = True
+        if full:
+            self.stats["discarded"] += 1
+            self._close(page_object.page.context)
+            return
+        with self._lock:
+            self._idle.append(page_object)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for page_object in idle:
+            self._close(page_object.page.context)
+
+    def __enter__(self) -> "ContextPool[PageObject]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _create(self) -> PageObject:
+        context = self.browser.new_context(**self.context_args)
+        self.stats["created"] += 1
+        page_object = self.factory(context.new_page())
+        page_object.navigate(self.path)
+        return page_object
+
+    def _reset(self, page_object: PageObject) -> None:
+        page = page_object.page
+        context: "BrowserContext" = page.context
+        for extra in context.pages:
+            if extra is not page:
+                extra.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        page.evaluate(_CLEAR_STORAGE)
+        page_object.timings.clear()
+        page_object.navigations.clear()
+
+    @staticmethod
+    def _close(context: "BrowserContext") -> None:
+        from playwright.sync_api import Error
+
+        try:
+            context.close()
+        except Error:
+            pass
@@ -0,0 +1,79 @@
+"""Import-time profile of a pytest run.
+
+Runs pytest with ``python -X importtime`` (collection only by default) and reports which
+top-level packages the run imported and what each cost, so it is visible when, say, an
+API-only selection starts paying for playwright or pydantic again.
+
+    python -m utils.import_profile -- -m positive tests/test_common.py
+    python -m utils.import_profile --top 15 --json -- tests/
+"""
+import argparse
+import json
+import re
+import subprocess
+import sys
+import typing as t
+from collections import defaultdict
+
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def parse_importtime(output: str) -> dict[str, dict[str, float]]:
+    """Per top-level package: cumulative milliseconds of the imports that entered it from
+    outside (so nothing is counted twice) and own time of all its modules."""
+    packages: dict[str, dict[str, float]] = defaultdict(lambda: {"cumulative_ms": 0.0, "self_ms": 0.0, "modules": 0})
+    # importtime prints a module after everything it imported; reversed, every parent comes
+    # right before its children, and a stack of (indent, package) gives each line's importer
+    importers: list[tuple[int, str]] = []
+    for line in reversed(output.splitlines()):
+        match = _LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, module = match.groups()
+        level, package_name = len(indent), module.split(".")[0]
+        while importers and importers[-1][0] >= level:
+            importers.pop()
+        package = packages[package_name]
+        package["self_ms"] += int(self_us) / 1e3
+        package["modules"] += 1
+        if not importers or importers[-1][1] != package_name:
+            package["cumulative_ms"] += int(cumulative_us) / 1e3
+        importers.append((level, package_name))
+    return {name: {key: round(value, 3) for key, value in stats.items()} for name, stats in packages.items()}
+
+
+def profile(pytest_args: t.Sequence[str], collect_only: bool = True) -> dict:
+    command = [sys.executable, "-X", "importtime", "-m", "pytest", "-q", "-p", "no:cacheprovider", *pytest_args]
+    if collect_only:
+        command.append("--collect-only")
+    completed = subprocess.run(command, capture_output=True, text=True)
+    packages = parse_importtime(completed.stderr)
+    return {
+        "command": command,
+        "exit_code": completed.returncode,
+        "total_ms": round(sum(stats["self_ms"] for stats in packages.values()), 3),
+        "packages": dict(sorted(packages.items(), key=lambda item: item[1]["cumulative_ms"], reverse=True)),
+    }
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Import-time profile of a pytest run")
+    parser.add_argument("--run", action="store_true", help="run the tests instead of collecting only")
+    parser.add_argument("--top", type=int, default=25, help="packages to show")
+    parser.add_argument("--json", action="store_true", help="print the full JSON report")
+    parser.add_argument("pytest_args", nargs="*", help="pytest arguments, after --")
+    args = parser.parse_args(argv)
+
+    report = profile(args.pytest_args, collect_only=not args.run)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return report["exit_code"]
+    print(f"{'package':<30} {'cumulative ms':>14} {'self ms':>10} {'modules':>8}")
+    for name, stats in list(report["packages"].items())[:args.top]:
+        print(f"{name:<30} {stats['cumulative_ms']:>14.1f} {stats['self_ms']:>10.1f} {stats['modules']:>8}")
+    print(f"{'total':<30} {report['total_ms']:>14.1f}")
+    return report["exit_code"]
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,243 @@
+"""Load generation on top of the ``Users`` endpoint definitions.
+
+Drives the same ``api.endpoints.Users`` methods the functional tests use with a weighted
+scenario mix, either closed-loop (``concurrency`` workers back to back) or open-loop at a
+target ``rps``, and reports per-endpoint latency percentiles, histograms, throughput and
+error rates as JSON. A previous report can be passed as a baseline to flag regressions.
+
+In open-loop mode latency is measured from each call's scheduled slot, not from when a
+worker got to it, so time spent queued behind an overloaded service is part of the
+percentiles (no coordinated omission). ``schedule`` compares the achieved rate with the
+target and counts the calls that started late.
+
+    python -m utils.load_runner --local --mix get_users=5,get_user=4,add_user=1 \\
+        --concurrency 32 --duration 10 --output load.json --baseline previous.json
+"""
+import argparse
+import itertools
+import json
+import random
+import sys
+import threading
+import time
+import typing as t
+from array import array
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+
+from api.endpoints import ReqresIn, Users
+
+DEFAULT_MIX = {"get_users": 5, "get_user": 4, "add_user": 1, "edit_user": 1}
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+# a call that starts this much after its slot counts as late, below it is wake-up jitter
+LATE_SLOT_TOLERANCE = 0.005
+Scenario = t.Callable[[Users, random.Random], t.Any]
+
+
+def _user_id(rng: random.Random) -> int:
+    return rng.randint(1, 12)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "get_users": lambda users, rng: users.get_users(page=rng.randint(1, 2)),
+    "get_user": lambda users, rng: users.get_user(user_id=_user_id(rng)),
+    "add_user": lambda users, rng: users.add_user(body={"name": "morpheus", "job": "leader"}),
+    "edit_user": lambda users, rng: users.edit_user(user_id=_user_id(rng), body={"name": "morpheus", "job": "zion"}),
+    "delete_user": lambda users, rng: users.delete_user(user_id=_user_id(rng)),
+}
+
+
+@dataclass
+class LoadConfig:
+    base_url: str
+    mix: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_MIX))
+    duration: float = 10.0
+    concurrency: int = 16
+    rps: t.Optional[float] = None
+    api_key: str = ""
+    seed: t.Optional[int] = None
+
+
+class EndpointStats:
+    def __init__(self) -> None:
+        self.latencies = array("d")
+        self.errors: Counter = Counter()
+
+    def record(self, latency: float, error: t.Optional[Exception]) -> None:
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[type(error).__name__] += 1
+
+    def summary(self, elapsed: float) -> dict:
+        count = len(self.latencies)
+        ordered = sorted(self.latencies)
+        errors = sum(self.errors.values())
+
+        def percentile(share: float) -> float:
+            return round(ordered[min(count - 1, int(share * count))] * 1e3, 3) if count else 0.0
+
+        histogram = Counter()
+        for latency in ordered:
+            latency_ms = latency * 1e3
+            bucket = next((f"<={bound}" for bound in HISTOGRAM_BOUNDS_MS if latency_ms <= bound),
+                          f">{HISTOGRAM_BOUNDS_MS[-1]}")
+            histogram[bucket] += 1
+        return {
+            "count": count,
+            "errors": errors,
+            "error_rate": round(errors / count, 4) if count else 0.0,
+            "error_types": dict(self.errors),
+            "throughput": round(count / elapsed, 2) if elapsed else 0.0,
+            "latency_ms": {
+                "mean": round(sum(ordered) / count * 1e3, 3) if count else 0.0,
+                "p50": percentile(0.50),
+                "p90": percentile(0.90),
+                "p99": percentile(0.99),
+                "max": round(ordered[-1] * 1e3, 3) if count else 0.0,
+            },
+            "histogram_ms": dict(histogram),
+        }
+
+
+def run_load(config: LoadConfig, users: t.Optional[Users] = None) -> dict:
+    """Runs the scenario mix for ``config.duration`` seconds and returns the report."""
+    unknown = set(config.mix) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenarios {sorted(unknown)}, expected some of {sorted(SCENARIOS)}")
+    users = users or ReqresIn(base_url=config.base_url, api_key=config.api_key).users
+    names = list(config.mix)
+    weights = [config.mix[name] for name in names]
+    stats = {name: EndpointStats() for name in names}
+    lock = threading.Lock()
+    sequence = itertools.count()
+    seed = random.Random(config.seed)
+    start_delays = array("d")
+    started = time.perf_counter()
+    deadline = started + config.duration
+
+    def worker(worker_seed: int) -> None:
+        rng = random.Random(worker_seed)
+        while True:
+            slot = None
+            if config.rps:
+                # open loop: every call has a slot on a fixed schedule shared by all workers
+                with lock:
+                    slot = started + next(sequence) / config.rps
+                if slot >= deadline:
+                    return
+                time.sleep(max(0.0, slot - time.perf_counter()))
+            elif time.perf_counter() >= deadline:
+                return
+            name = rng.choices(names, weights)[0]
+            error = None
+            call_started = time.perf_counter()
+            try:
+                SCENARIOS[name](users, rng)
+            except Exception as e:
+                error = e
+            latency = time.perf_counter() - (call_started if slot is None else slot)
+            with lock:
+                stats[name].record(latency, error)
+                if slot is not None:
+                    start_delays.append(call_started - slot)
+
+    with ThreadPoolExecutor(max_workers=config.concurrency) as executor:
+        for future in [executor.submit(worker, seed.random()) for _ in range(config.concurrency)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+
+    total = EndpointStats()
+    for endpoint in stats.values():
+        total.latencies.extend(endpoint.latencies)
+        total.errors.update(endpoint.errors)
+    report = {
+        "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(time.time() - elapsed)),
+        "elapsed": round(elapsed, 3),
+        "config": asdict(config),
+        "total": total.summary(elapsed),
+        "endpoints": {name: endpoint.summary(elapsed) for name, endpoint in stats.items()},
+    }
+    if config.rps:
+        report["schedule"] = {
+            "target_rps": config.rps,
+            "achieved_rps": round(len(total.latencies) / elapsed, 2) if elapsed else 0.0,
+            "slots": len(start_delays),
+            "late_slots": sum(1 for delay in start_delays if delay > LATE_SLOT_TOLERANCE),
+            "max_start_delay_ms": round(max(start_delays, default=0.0) * 1e3, 3),
+        }
+    return report
+
+
+def compare(baseline: dict, current: dict, tolerance: float = 0.2) -> list[str]:
+    """Lists regressions of ``current`` against ``baseline``: p50/p99 latency or error rate
+    up, or throughput down, by more than ``tolerance`` (a share, 0.2 = 20%)."""
+    regressions = []
+    for name, now in {"total": current["total"], **current["endpoints"]}.items():
+        before = baseline["total"] if name == "total" else baseline["endpoints"].get(name)
+        if not before or not before["count"]:
+            continue
+        for percentile in ("p50", "p99"):
+            old, new = before["latency_ms"][percentile], now["latency_ms"][percentile]
+            if new > old * (1 + tolerance):
+                regressions.append(f"{name}: {percentile} {old}ms -> {new}ms")
+        if now["error_rate"] > before["error_rate"] + tolerance * max(before["error_rate"], 0.01):
+            regressions.append(f"{name}: error rate {before['error_rate']} -> {now['error_rate']}")
+        if now["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {before['throughput']}/s -> {now['throughput']}/s")
+    return regressions
+
+
+def parse_mix(value: str) -> dict[str, float]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Load runner for the reqres Users endpoints")
+    target = parser.add_mutually_exclusive_group(required=True)
+    target.add_argument("--base-url", help="service to load, e.g. https://reqres.in")
+    target.add_argument("--local", action="store_true", help="start the bundled reqres server and load it")
+    parser.add_argument("--api-key", default="")
+    parser.add_argument("--mix", type=parse_mix, default=dict(DEFAULT_MIX),
+                        help="weighted scenarios, e.g. get_users=5,get_user=4,add_user=1")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="number of workers")
+    parser.add_argument("--rps", type=float, help="target requests per second (open loop)")
+    parser.add_argument("--seed", type=int)
+    parser.add_argument("--output", help="write the JSON report here")
+    parser.add_argument("--baseline", help="previous JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    config = LoadConfig(base_url=args.base_url or "", mix=args.mix, duration=args.duration,
+                        concurrency=args.concurrency, rps=args.rps, api_key=args.api_key, seed=args.seed)
+    if args.local:
+        from utils.reqres_server import ReqresServer
+
+        with ReqresServer() as server:
+            config.base_url = server.base_url
+            report = run_load(config)
+    else:
+        report = run_load(config)
+
+    rendered = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(rendered)
+    print(rendered)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            regressions = compare(json.load(file), report, args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
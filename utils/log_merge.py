@@ -0,0 +1,61 @@
+"""Merges the per-worker JSON Lines logs written with ``setup_logger(structured=True)``.
+
+Every worker file is already in time order, so they are merged lazily by ``ts``:
+
+    python -m utils.log_merge logs/ -o logs/test.merged.log
+    python -m utils.log_merge logs/test.gw0.jsonl logs/test.gw1.jsonl --json
+"""
+import argparse
+import heapq
+import json
+import sys
+import typing as t
+from pathlib import Path
+
+TEXT_FORMAT = "{time} - {level} - [{worker_id}] {test_id} - {message}"
+
+
+def _read(path: Path) -> t.Iterator[dict]:
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def collect_paths(paths: t.Iterable[t.Union[str, Path]]) -> list[Path]:
+    """Expands directories to the ``*.jsonl`` files in them."""
+    collected = []
+    for path in map(Path, paths):
+        collected.extend(sorted(path.glob("*.jsonl")) if path.is_dir() else [path])
+    return collected
+
+
+def merge_logs(paths: t.Iterable[t.Union[str, Path]]) -> t.Iterator[dict]:
+    return heapq.merge(*(_read(path) for path in collect_paths(paths)), key=lambda entry: entry["ts"])
+
+
+def format_entry(entry: dict) -> str:
+    line = TEXT_FORMAT.format(**{**entry, "test_id": entry.get("test_id") or "-"})
+    return f"{line}\n{entry['exc_info']}" if entry.get("exc_info") else line
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Merge per-worker JSON Lines logs in time order")
+    parser.add_argument("paths", nargs="+", help="log files or directories with *.jsonl files")
+    parser.add_argument("-o", "--output", help="write here instead of stdout")
+    parser.add_argument("--json", action="store_true", help="keep JSON Lines instead of text")
+    args = parser.parse_args(argv)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for entry in merge_logs(args.paths):
+            output.write((json.dumps(entry, ensure_ascii=False) if args.json else format_entry(entry)) + "\n")
+    finally:
+        if args.output:
+            output.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
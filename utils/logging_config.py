@@ -1,9 +1,32 @@
+import atexit
+import json
 import logging
 import os
+import queue
+import threading
+import typing as t
+from collections import defaultdict
+from functools import lru_cache
 from logging import Logger
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
+DEFAULT_MAX_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
+# Defaults for setup_logger, changed by configure_logging() (e.g. from pytest options)
+_settings = {"structured": False, "failed_only": False, "worker_id": None}
+_loggers: dict[str, Logger] = {}
+_queue_handlers: dict[tuple, QueueHandler] = {}
+# Handlers leading to a FailedTestBuffer, resolve_test_logs() notifies each of them
+_sinks: list[logging.Handler] = []
+_lock = threading.RLock()
+_current_test_id: t.Optional[str] = None
+
+
+@lru_cache(maxsize=None)
 def get_project_root() -> str:
     current_dir = Path(__file__).resolve().parent
     while current_dir != current_dir.parent:
@@ -12,66 +35,296 @@ def get_project_root() -> str:
         current_dir = current_dir.parent
     raise FileNotFoundError("Could not find project root")
 
-def setup_logger(name: str, log_file: str = "logs/test.log") -> Logger:
-    """Настройка логгера с выводом в консоль и файл.
 
-    Args:
-        name: Имя логгера (обычно __name__).
-        log_file: Путь к файлу логов (относительно корня проекта).
+def get_worker_id() -> str:
+    """Идентификатор из configure_logging(worker_id=...), воркера pytest-xdist (gw0, gw1, ...)
+    или "main" для единственного процесса."""
+    return _settings.get("worker_id") or os.environ.get("PYTEST_XDIST_WORKER", "main")
 
-    Returns:
-        Настроенный объект логгера.
 
-    Note:
-        Убедитесь, что папка `logs/` существует в корне проекта (`project_root/logs/`).
-        Если файл логов не создаётся, проверьте права доступа к папке `logs/`.
+def worker_log_file(log_file: str, structured: bool = True) -> str:
+    """Отдельный файл воркера: logs/test.log -> logs/test.gw0.jsonl (structured)
+    или logs/test.gw0.log (текстовый режим)."""
+    root, extension = os.path.splitext(log_file)
+    return f"{root}.{get_worker_id()}{'.jsonl' if structured else extension}"
+
+
+def configure_logging(structured: t.Optional[bool] = None, failed_only: t.Optional[bool] = None,
+                      worker_id: t.Optional[str] = None) -> None:
+    """Меняет значения по умолчанию для setup_logger.
+
+    worker_id задаёт идентификатор воркера явно (например, процессам utils.ui_runner),
+    иначе он берётся у pytest-xdist.
+
+    Действует только на ещё не настроенные логгеры, поэтому вызывать нужно до импорта
+    модулей с логгерами (например, в pytest_configure).
     """
-    print(f"DEBUG: Entering setup_logger with name={name}, log_file={log_file}")
+    if structured is not None:
+        _settings["structured"] = structured
+    if failed_only is not None:
+        _settings["failed_only"] = failed_only
+    if worker_id is not None:
+        _settings["worker_id"] = worker_id
+
+
+def set_current_test(test_id: t.Optional[str]) -> None:
+    """Привязывает последующие записи логов к тесту test_id (None - вне теста)."""
+    global _current_test_id
+    _current_test_id = test_id
+
+
+def resolve_test_logs(test_id: str, keep: bool) -> None:
+    """Сообщает буферам исход теста: записи упавшего теста пишутся в файл, остальные отбрасываются.
+
+    Решение идёт через ту же очередь, что и сами записи, поэтому под него попадают и
+    записи, которые фоновый поток ещё не успел обработать.
+    """
+    control = logging.LogRecord(__name__, logging.INFO, __file__, 0, "", None, None)
+    control.log_control = (test_id, keep)
+    for sink in list(_sinks):
+        sink.handle(control)
+
+
+class TestContextFilter(logging.Filter):
+    """Добавляет к записи test_id и worker_id в момент вызова логгера."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "log_control"):
+            record.test_id = _current_test_id
+            record.worker_id = get_worker_id()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": record.created,
+            "time": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "test_id": getattr(record, "test_id", None),
+            "worker_id": getattr(record, "worker_id", None) or get_worker_id(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc_info"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+class FailedTestBuffer(logging.Handler):
+    """Копит записи каждого теста в памяти до resolve_test_logs() и передаёт их в target
+    только для упавших тестов. Записи вне тестов передаются сразу."""
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__()
+        self.target = target
+        self.buffers: dict[str, list[logging.LogRecord]] = defaultdict(list)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        control = getattr(record, "log_control", None)
+        if control is not None:
+            test_id, keep = control
+            records = self.buffers.pop(test_id, [])
+            if keep:
+                for buffered in records:
+                    self._forward(buffered)
+            return
+        test_id = getattr(record, "test_id", None)
+        if test_id is None:
+            self._forward(record)
+        else:
+            self.buffers[test_id].append(record)
+
+    def _forward(self, record: logging.LogRecord) -> None:
+        if record.levelno >= self.target.level:
+            self.target.handle(record)
+
+    def flush(self) -> None:
+        self.target.flush()
 
-    project_root = get_project_root()
-    log_file_path = os.path.join(project_root, log_file)
-    print(f"DEBUG: Log file path: {log_file_path}")
+    def close(self) -> None:
+        self.target.close()
+        super().close()
 
+
+class LazyLogger:
+    """Заместитель логгера: setup_logger вызывается при первом обращении, а не при импорте модуля."""
+
+    def __init__(self, name: str, **options) -> None:
+        self._name = name
+        self._options = options
+        self._logger: t.Optional[Logger] = None
+
+    def __getattr__(self, attribute: str) -> t.Any:
+        logger = self._logger
+        if logger is None:
+            logger = self._logger = setup_logger(self._name, **self._options)
+        return getattr(logger, attribute)
+
+
+def get_logger(name: str, **options) -> Logger:
+    """Как setup_logger(name, **options), но логгер настраивается только при первой записи,
+    поэтому импорт модуля не трогает файловую систему и не создаёт обработчики."""
+    return t.cast(Logger, LazyLogger(name, **options))
+
+
+def _debug(enabled: bool, message: str) -> None:
+    if enabled:
+        print(f"DEBUG: {message}")
+
+
+def _prepare_log_dir(log_file_path: str, debug: bool) -> None:
     log_dir = os.path.dirname(log_file_path)
-    print(f"DEBUG: Log directory: {log_dir}")
+    _debug(debug, f"Log directory: {log_dir}")
     if not os.path.exists(log_dir):
         try:
-            os.makedirs(log_dir)
-            print(f"DEBUG: Created log directory: {log_dir}")
+            os.makedirs(log_dir, exist_ok=True)
+            _debug(debug, f"Created log directory: {log_dir}")
         except OSError as e:
             print(f"ERROR: Failed to create log directory {log_dir}: {e}")
             raise
-    else:
-        print(f"DEBUG: Log directory already exists: {log_dir}")
 
     if not os.access(log_dir, os.W_OK):
         print(f"ERROR: No write permission for log directory {log_dir}")
         raise PermissionError(f"No write permission for {log_dir}")
 
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.INFO)
-    print(f"DEBUG: Logger created with name={name}")
-
-    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
 
+def _create_handlers(log_file_path: str, max_bytes: int, backup_count: int, console: bool,
+                     structured: bool, failed_only: bool) -> list[logging.Handler]:
+    formatter = logging.Formatter(FORMAT, datefmt=DATE_FORMAT)
     try:
-        file_handler = logging.FileHandler(log_file_path, mode='a', delay=False)
-        file_handler.setLevel(logging.INFO)
-        file_handler.setFormatter(formatter)
-        print(f"DEBUG: FileHandler created for: {log_file_path}")
+        file_handler = RotatingFileHandler(
+            log_file_path, mode='a', maxBytes=max_bytes, backupCount=backup_count, delay=True
+        )
     except Exception as e:
         print(f"ERROR: Failed to create FileHandler for {log_file_path}: {e}")
         raise
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(JsonFormatter() if structured else formatter)
+    handlers: list[logging.Handler] = [FailedTestBuffer(file_handler) if failed_only else file_handler]
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.INFO)
+        console_handler.setFormatter(formatter)
+        # the console shows everything as it happens, outcome notifications are not records
+        console_handler.addFilter(lambda record: not hasattr(record, "log_control"))
+        handlers.append(console_handler)
+    return handlers
+
+
+_TRACEBACK_FORMATTER = logging.Formatter()
+
+
+class _InProcessQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # The queue never leaves the process, so the record is not copied to be picklable and
+        # the full formatting stays on the listener thread. The message and the traceback are
+        # rendered here though: mutable args may change before the listener gets to the record,
+        # and a queued exc_info would keep the exception's frames alive
+        record.msg = record.message = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _TRACEBACK_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def _get_queue_handler(*options) -> QueueHandler:
+    handler = _queue_handlers.get(options)
+    if handler is None:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *_create_handlers(*options), respect_handler_level=True)
+        listener.start()
+        atexit.register(listener.stop)
+        handler = _queue_handlers[options] = _InProcessQueueHandler(log_queue)
+        handler.addFilter(TestContextFilter())
+        handler.listener = listener
+        if options[-1]:  # failed_only
+            _sinks.append(handler)
+    return handler
+
+
+def setup_logger(
+    name: str,
+    log_file: str = "logs/test.log",
+    queued: bool = True,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    backup_count: int = DEFAULT_BACKUP_COUNT,
+    console: bool = True,
+    debug: t.Optional[bool] = None,
+    structured: t.Optional[bool] = None,
+    failed_only: t.Optional[bool] = None,
+) -> Logger:
+    """Настройка логгера с выводом в консоль и файл.
+
+    Логгер настраивается один раз на процесс: повторный вызов с тем же именем возвращает
+    уже настроенный объект без обращений к файловой системе.
+
+    Args:
+        name: Имя логгера (обычно __name__).
+        log_file: Путь к файлу логов (относительно корня проекта).
+        queued: Писать через QueueHandler/QueueListener: вызов logger.info только кладёт
+            запись в очередь, запись на диск идёт в фоновом потоке. False - синхронные
+            обработчики, как раньше.
+        max_bytes: Размер файла, после которого он ротируется. Под xdist каждый воркер
+            пишет и ротирует свой файл (logs/test.gw0.log).
+        backup_count: Сколько ротированных файлов хранить.
+        console: Дублировать ли записи в консоль.
+        debug: Печатать отладочные сообщения настройки. По умолчанию выключено,
+            включается переменной окружения LOGGER_SETUP_DEBUG.
+        structured: Писать JSON Lines с test_id и worker_id, каждый воркер xdist в свой
+            файл (см. worker_log_file, собрать обратно - utils.log_merge). По умолчанию
+            берётся из configure_logging().
+        failed_only: Держать записи теста в памяти и писать в файл только для упавших
+            тестов (см. resolve_test_logs). По умолчанию берётся из configure_logging().
+
+    Returns:
+        Настроенный объект логгера.
+
+    Note:
+        Папка `logs/` создаётся в корне проекта (`project_root/logs/`) при необходимости.
+        Если файл логов не создаётся, проверьте права доступа к папке `logs/`.
+    """
+    logger = _loggers.get(name)
+    if logger is not None:
+        return logger
 
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    if debug is None:
+        debug = bool(os.environ.get("LOGGER_SETUP_DEBUG"))
+    if structured is None:
+        structured = _settings["structured"]
+    if failed_only is None:
+        failed_only = _settings["failed_only"]
+    with _lock:
+        if name in _loggers:
+            return _loggers[name]
+        _debug(debug, f"Entering setup_logger with name={name}, log_file={log_file}")
 
-    logger.handlers.clear()
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+        # RotatingFileHandler не умеет ротировать один файл из нескольких процессов,
+        # поэтому у каждого воркера свой файл и в текстовом режиме
+        if structured or get_worker_id() != "main":
+            log_file = worker_log_file(log_file, structured)
+        log_file_path = os.path.join(get_project_root(), log_file)
+        _debug(debug, f"Log file path: {log_file_path}")
+        _prepare_log_dir(log_file_path, debug)
 
-    logger.info("Logger initialized successfully")
-    print(f"DEBUG: Logger initialized for {name}")
+        logger = logging.getLogger(name)
+        logger.setLevel(logging.INFO)
+        logger.handlers.clear()
+        options = (log_file_path, max_bytes, backup_count, console, structured, failed_only)
+        if queued:
+            logger.addHandler(_get_queue_handler(*options))
+        else:
+            for handler in _create_handlers(*options):
+                handler.addFilter(TestContextFilter())
+                logger.addHandler(handler)
+                if isinstance(handler, FailedTestBuffer):
+                    _sinks.append(handler)
 
-    return logger
\ No newline at end of file
+        logger.info("Logger initialized successfully")
+        _debug(debug, f"Logger initialized for {name}")
+        _loggers[name] = logger
+        return logger
@@ -0,0 +1,283 @@
+"""In-process stand-in for the reqres.in users API.
+
+Serves ``/api/users`` GET/POST/PATCH/DELETE with the response shapes of
+``models/response.py`` from an asyncio server, so the API suite can run offline and the
+client can be stress-tested on one box. Latency and errors can be injected per server
+(``latency``, ``error_rate``) or scripted per request (``inject``).
+
+Standalone: ``python -m utils.reqres_server --port 8000 --latency 0.01``.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import threading
+import typing as t
+from collections import deque
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+PER_PAGE = 6
+DEFAULT_USERS = 12
+SUPPORT = {
+    "url": "https://contentcaddy.io?utm_source=reqres&utm_medium=json&utm_campaign=referral",
+    "text": "Tired of writing endless social media content? Let Content Caddy generate it for you."
+}
+TIMESTAMP = "2025-01-01T00:00:00.000Z"
+
+Fault = t.Union[int, float, None]
+
+
+class BadRequest(ValueError):
+    """Malformed query or body, answered with ``400`` and a JSON error."""
+
+
+def make_user(user_id: int) -> dict:
+    return {
+        "id": user_id,
+        "email": f"user{user_id}@reqres.in",
+        "first_name": f"First{user_id}",
+        "last_name": f"Last{user_id}",
+        "avatar": f"https://reqres.in/img/faces/{user_id}-image.jpg"
+    }
+
+
+class ReqresServer:
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        total_users: int = DEFAULT_USERS,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: t.Optional[int] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.reset(total_users)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._loop: t.Optional[asyncio.AbstractEventLoop] = None
+        self._thread: t.Optional[threading.Thread] = None
+        self._server: t.Optional[asyncio.AbstractServer] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def reset(self, total_users: int = DEFAULT_USERS) -> None:
+        """Restores the seed users and clears counters, faults and latency."""
+        self.users = {user_id: make_user(user_id) for user_id in range(1, total_users + 1)}
+        self.faults: deque[Fault] = deque()
+        self.latency = 0.0
+        self.error_rate = 0.0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def inject(self, *faults: Fault) -> None:
+        """Queues faults for the next requests: an int is returned as the HTTP status,
+        a float stalls the request for that many seconds before it is served, None lets
+        the request through untouched."""
+        self.faults.extend(faults)
+
+    # --- lifecycle -------------------------------------------------------------------
+
+    async def serve(self) -> None:
+        """Runs the server in the current event loop until cancelled."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start(self) -> str:
+        """Starts the server on a background thread and returns its base URL."""
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+
+        def run() -> None:
+            asyncio.set_event_loop(self._loop)
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._handle, self.host, self.port, backlog=1024)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name="reqres-server", daemon=True)
+        self._thread.start()
+        ready.wait()
+        return self.base_url
+
+    def stop(self) -> None:
+        if self._loop is None:
+            return
+
+        async def shutdown() -> None:
+            self._server.close()
+            current = asyncio.current_task()
+            for task in asyncio.all_tasks():
+                if task is not current:
+                    task.cancel()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = self._thread = self._server = None
+
+    def __enter__(self) -> "ReqresServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    # --- HTTP ------------------------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length") or 0))
+
+                status, response_headers, payload = await self._serve_request(method, target, headers, body)
+                head = [f"HTTP/1.1 {status} {HTTPStatus(status).phrase}"]
+                head += [f"{name}: {value}" for name, value in response_headers.items()]
+                head.append(f"Content-Length: {len(payload)}")
+                writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + payload)
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Finish normally on shutdown: asyncio's connection callback calls
+            # task.exception() on the handler task, which raises for a cancelled task
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_request(self, method: str, target: str, headers: dict, body: bytes) -> tuple[int, dict, bytes]:
+        self.requests += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            fault = self.faults.popleft() if self.faults else None
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            if isinstance(fault, float):
+                await asyncio.sleep(fault)
+            elif isinstance(fault, int):
+                return self._json(fault, {"error": "Injected fault"})
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._json(self.error_status, {"error": "Injected fault"})
+
+            try:
+                status, response_headers, payload = self._route(method, target, body)
+            except BadRequest as e:
+                return self._json(400, {"error": str(e)})
+            if method == "GET" and status == 200:
+                etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+                response_headers["ETag"] = etag
+                if headers.get("if-none-match") == etag:
+                    return 304, response_headers, b""
+            return status, response_headers, payload
+        finally:
+            self.in_flight -= 1
+
+    def _json(self, status: int, body: t.Optional[dict] = None) -> tuple[int, dict, bytes]:
+        payload = b"" if body is None else json.dumps(body).encode()
+        return status, {"Content-Type": "application/json"}, payload
+
+    def _route(self, method: str, target: str, body: bytes) -> tuple[int, dict, bytes]:
+        url = urlsplit(target)
+        if url.path == "/api/users":
+            if method == "GET":
+                return self._json(200, self._page(self._page_number(url.query)))
+            if method == "POST":
+                data = self._json_object(body)
+                if not data:
+                    return self._json(400, {"error": "Missing body"})
+                user_id = max(self.users, default=0) + 1
+                self.users[user_id] = make_user(user_id)
+                return self._json(201, {**data, "id": user_id, "createdAt": TIMESTAMP})
+        elif url.path.startswith("/api/users/"):
+            tail = url.path[len("/api/users/"):]
+            user_id = int(tail) if tail.isdigit() else None
+            if method == "GET":
+                user = self.users.get(user_id)
+                return self._json(404, {}) if user is None else self._json(200, {"data": user, "support": SUPPORT})
+            if method in ("PATCH", "PUT"):
+                return self._json(200, {**self._json_object(body), "updatedAt": TIMESTAMP})
+            if method == "DELETE":
+                self.users.pop(user_id, None)
+                return self._json(204)
+        else:
+            return self._json(404, {})
+        return self._json(405, {})
+
+    @staticmethod
+    def _page_number(query: str) -> int:
+        value = parse_qs(query).get("page", ["1"])[0]
+        if not value.isdigit() or int(value) < 1:
+            raise BadRequest(f"Invalid page {value!r}")
+        return int(value)
+
+    @staticmethod
+    def _json_object(body: bytes) -> dict:
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise BadRequest("Body is not valid JSON") from None
+        if not isinstance(data, dict):
+            raise BadRequest(f"Body must be a JSON object, got {type(data).__name__}")
+        return data
+
+    def _page(self, page: int) -> dict:
+        users = [self.users[user_id] for user_id in sorted(self.users)]
+        total = len(users)
+        return {
+            "page": page,
+            "per_page": PER_PAGE,
+            "total": total,
+            "total_pages": -(-total // PER_PAGE),
+            "data": users[(page - 1) * PER_PAGE:page * PER_PAGE],
+            "support": SUPPORT
+        }
+
+
+def main(argv: t.Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for the reqres.in users API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--users", type=int, default=DEFAULT_USERS, help="number of seed users")
+    parser.add_argument("--latency", type=float, default=0.0, help="added latency per request, seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, default=503)
+    args = parser.parse_args(argv)
+
+    server = ReqresServer(args.host, args.port, args.users, args.latency, args.error_rate, args.error_status)
+    print(f"Serving reqres stand-in on http://{args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""When to record Playwright traces and where to put them.
+
+A trace costs CPU, memory and disk for every action, so by default only what is needed to
+debug a failure is kept:
+
+* ``off`` - never trace;
+* ``on-failure`` - record every test as a trace chunk, write it only if the test failed;
+* ``sampled`` - record and keep ``sample_rate`` of the tests (chosen by node id, so the
+  same tests are sampled on every run and every worker);
+* ``always`` - record and keep every test.
+
+Tracing is started once per browser context and each test is a chunk of it, which matters
+for contexts reused by ``ContextPool``. Every kept trace gets its own path, so parallel
+workers never overwrite each other.
+
+Screenshots and DOM snapshots are the bulk of the cost. Playwright sets them once per
+tracing session (``start_chunk`` cannot change them), so ``on-failure``, which throws
+most chunks away, records actions, network and console only unless ``snapshots`` asks
+for more.
+"""
+import re
+import shutil
+import typing as t
+import uuid
+import weakref
+import zipfile
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+
+from utils.logging_config import get_worker_id
+
+if t.TYPE_CHECKING:
+    from playwright.sync_api import BrowserContext
+
+TRACE_MODES = ("off", "on-failure", "sampled", "always")
+DEFAULT_TRACE_DIR = "test-results/traces"
+_UNSAFE_CHARS = re.compile(r"[^\w.-]+")
+
+
+@dataclass
+class TracePolicy:
+    mode: str = "on-failure"
+    sample_rate: float = 0.1
+    output_dir: str = DEFAULT_TRACE_DIR
+    compress: bool = False
+    seed: str = ""
+    # None: only for the modes that keep passing tests too (sampled, always)
+    snapshots: t.Optional[bool] = None
+
+    def __post_init__(self) -> None:
+        if self.mode not in TRACE_MODES:
+            raise ValueError(f"Unknown trace mode {self.mode!r}, expected one of {TRACE_MODES}")
+        if not 0.0 <= self.sample_rate <= 1.0:
+            raise ValueError(f"sample_rate must be within [0, 1], got {self.sample_rate}")
+
+    def should_record(self, test_id: str) -> bool:
+        if self.mode == "sampled":
+            return zlib.crc32(f"{self.seed}{test_id}".encode()) % 10_000 < self.sample_rate * 10_000
+        return self.mode != "off"
+
+    @property
+    def captures_snapshots(self) -> bool:
+        return self.snapshots if self.snapshots is not None else self.mode in ("sampled", "always")
+
+    def should_keep(self, failed: bool) -> bool:
+        return failed if self.mode == "on-failure" else self.mode != "off"
+
+    def trace_path(self, test_id: str) -> Path:
+        name = _UNSAFE_CHARS.sub("_", test_id).strip("_")[-150:]
+        return Path(self.output_dir) / f"{name}.{get_worker_id()}.{uuid.uuid4().hex[:8]}.zip"
+
+
+class ContextTracer:
+    """Applies a ``TracePolicy`` to the contexts of the tests."""
+
+    def __init__(self, policy: TracePolicy) -> None:
+        self.policy = policy
+        self._started: weakref.WeakSet = weakref.WeakSet()
+        self._recording: weakref.WeakSet = weakref.WeakSet()
+
+    def start(self, context: "BrowserContext", test_id: str) -> bool:
+        """Starts a trace chunk for the test if the policy wants one, returns whether it did."""
+        if not self.policy.should_record(test_id):
+            return False
+        if context in self._started:
+            context.tracing.start_chunk(title=test_id)
+        else:
+            snapshots = self.policy.captures_snapshots
+            context.tracing.start(title=test_id, screenshots=snapshots, snapshots=snapshots, sources=True)
+            self._started.add(context)
+        self._recording.add(context)
+        return True
+
+    def stop(self, context: "BrowserContext", test_id: str, failed: bool) -> t.Optional[Path]:
+        """Ends the test's chunk, writes it if the policy keeps it and returns its path."""
+        if context not in self._recording:
+            return None
+        self._recording.discard(context)
+        if not self.policy.should_keep(failed):
+            context.tracing.stop_chunk()
+            return None
+        path = self.policy.trace_path(test_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        context.tracing.stop_chunk(path=path)
+        if self.policy.compress:
+            recompress(path)
+        return path
+
+
+def recompress(path: Path, level: int = 9) -> None:
+    """Rewrites a trace archive with maximum deflate compression (screenshots and snapshots
+    are stored with a fast setting), in place."""
+    packed = path.with_suffix(".tmp")
+    with zipfile.ZipFile(path) as source, \
+            zipfile.ZipFile(packed, "w", zipfile.ZIP_DEFLATED, compresslevel=level) as target:
+        for info in source.infolist():
+            with source.open(info) as member, target.open(info.filename, "w") as copy:
+                shutil.copyfileobj(member, copy)
+    packed.replace(path)
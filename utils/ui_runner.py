@@ -0,0 +1,120 @@
+"""Parallel runner for the HostingPage scenario matrix.
+
+Expands server type x currency x price range into scenarios and spreads them over
+``--processes`` pytest processes. Each process launches one browser (the session
+``browser`` fixture) and runs its share of ``tests/test_srv_hosting.py`` in isolated,
+pooled contexts; it gets its own worker id, so logs and traces are kept apart, and its
+own Allure results directory.
+
+    python -m utils.ui_runner --server-types dedicated,vps --currencies USD,EUR \\
+        --price-ranges 400-450,100-200 --processes 4 --alluredir allure-results -- --ui-trace off
+"""
+import argparse
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+import typing as t
+from pathlib import Path
+
+DEFAULT_TEST_PATH = "tests/test_srv_hosting.py"
+
+
+class HostingScenario(t.NamedTuple):
+    server_type: str
+    currency: str
+    min_price: int
+    max_price: int
+
+    @classmethod
+    def parse(cls, value: str) -> "HostingScenario":
+        """``dedicated:USD:400:450``"""
+        server_type, currency, min_price, max_price = value.split(":")
+        return cls(server_type, currency, int(min_price), int(max_price))
+
+    def __str__(self) -> str:
+        return ":".join(map(str, self))
+
+
+DEFAULT_SCENARIO = HostingScenario("dedicated", "USD", 400, 450)
+
+
+def scenario_matrix(server_types: t.Iterable[str], currencies: t.Iterable[str],
+                    price_ranges: t.Iterable[tuple[int, int]]) -> list[HostingScenario]:
+    return [HostingScenario(server_type, currency, low, high)
+            for server_type, currency, (low, high) in itertools.product(server_types, currencies, price_ranges)]
+
+
+def split(scenarios: t.Sequence[HostingScenario], parts: int) -> list[list[HostingScenario]]:
+    """Round robin, so neighbouring (similar) scenarios land in different processes."""
+    return [chunk for chunk in (list(scenarios[i::parts]) for i in range(parts)) if chunk]
+
+
+def run_matrix(
+    scenarios: t.Sequence[HostingScenario],
+    processes: int,
+    alluredir: t.Optional[str] = None,
+    test_path: str = DEFAULT_TEST_PATH,
+    pytest_args: t.Sequence[str] = (),
+) -> dict:
+    """Runs every scenario, at most ``processes`` pytest processes at a time, and returns
+    per-process exit codes and durations."""
+    running = []
+    started = time.perf_counter()
+    for index, chunk in enumerate(split(scenarios, processes)):
+        worker = f"gw{index}"
+        command = [sys.executable, "-m", "pytest", test_path, "-q", "-p", "no:cacheprovider"]
+        command += [f"--hosting-scenario={scenario}" for scenario in chunk]
+        # per-worker log files and trace names, see --worker-id in tests/conftest.py
+        command.append(f"--worker-id={worker}")
+        if alluredir:
+            command.append(f"--alluredir={Path(alluredir) / worker}")
+        command += pytest_args
+        running.append((worker, chunk, time.perf_counter(), subprocess.Popen(command)))
+
+    workers = {}
+    for worker, chunk, worker_started, process in running:
+        code = process.wait()
+        workers[worker] = {
+            "scenarios": [str(scenario) for scenario in chunk],
+            "exit_code": code,
+            "seconds": round(time.perf_counter() - worker_started, 3),
+        }
+    return {
+        "scenarios": len(scenarios),
+        "processes": len(workers),
+        "seconds": round(time.perf_counter() - started, 3),
+        "passed": all(worker["exit_code"] == 0 for worker in workers.values()),
+        "workers": workers,
+    }
+
+
+def _price_range(value: str) -> tuple[int, int]:
+    low, _, high = value.partition("-")
+    return int(low), int(high)
+
+
+def main(argv: t.Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the hosting page scenario matrix in parallel")
+    parser.add_argument("--server-types", default=DEFAULT_SCENARIO.server_type, help="comma separated")
+    parser.add_argument("--currencies", default=DEFAULT_SCENARIO.currency, help="comma separated")
+    parser.add_argument("--price-ranges", default=f"{DEFAULT_SCENARIO.min_price}-{DEFAULT_SCENARIO.max_price}",
+                        help="comma separated min-max pairs")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1,
+                        help="pytest processes, one browser each")
+    parser.add_argument("--alluredir", help="Allure results root, one subdirectory per process")
+    parser.add_argument("--test-path", default=DEFAULT_TEST_PATH)
+    parser.add_argument("pytest_args", nargs="*", help="extra pytest arguments, after --")
+    args = parser.parse_args(argv)
+
+    scenarios = scenario_matrix(args.server_types.split(","), args.currencies.split(","),
+                                [_price_range(value) for value in args.price_ranges.split(",")])
+    report = run_matrix(scenarios, args.processes, args.alluredir, args.test_path, args.pytest_args)
+    print(json.dumps(report, indent=2))
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())